@@ -0,0 +1,134 @@
+"""Benchmark cases timed by benchmarks.run.
+
+   Each case is a function that sets up whatever it needs and returns a
+   function with no arguments to time. Every call of the timed function does
+   the same work, so timings can be compared between runs and commits.
+
+   Functions:
+        chess_opening:         Italian game opening with castling through Chess.move
+        chess_middlegame:      scripted middlegame with captures through Chess.move
+        draughts_multi_capture: forced three move capture through Draughts.move
+        othello_random_game:   seeded random Othello game played to the end
+        display_board:         Chess display_board mid game
+        new_games:             new Chess, Draughts and Othello games from the game registry
+        save_restore:          Game.save and Game.restore of a mid game Chess game
+        app_import:            new Python process importing the Flask app
+        terminal_import:       new Python process importing the terminal game script
+"""
+import os
+from pathlib import Path
+import random
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+
+from src.game_enums import Color
+from src.game_pieces.draughts_counter import Counter
+from src.games import game_names, new_game
+from src.games.chess import Chess
+from src.games.draughts import Draughts
+from src.games.game import Game
+from src.games.othello import Othello
+
+
+FILES = 'abcdefgh'
+
+CHESS_OPENING = 'e2e4 e7e5 g1f3 b8c6 f1c4 f8c5 c2c3 g8f6 d2d4 e5d4 c3d4 c5b4 b1c3 f6e4 e1g1'.split()
+CHESS_MIDDLEGAME = ('b4c3 b2c3 e4c3 d1e1 c3e2 e1e2 e8f8 c1a3 d7d6 d4d5 c6a5 c4d3 '
+                    'a7a6 a1b1 a8a7 a3c1 a7a8 a2a3 a8a7 a3a4 a7a8 b1a1 a5b3 a1b1').split()
+
+
+def _square_id(square):
+    """Return square id, eg '41', for algebraic square, eg 'e2'."""
+    return f'{FILES.index(square[0])}{int(square[1]) - 1}'
+
+
+def _play_chess(game, moves):
+    for move in moves:
+        game.move(_square_id(move[:2]), _square_id(move[2:]))
+    return game
+
+
+def chess_opening():
+    return lambda: _play_chess(Chess(), CHESS_OPENING)
+
+
+def chess_middlegame():
+    start = _play_chess(Chess(), CHESS_OPENING)
+    return lambda: _play_chess(start.copy(), CHESS_MIDDLEGAME)
+
+
+def draughts_multi_capture():
+    def capture():
+        game = Draughts({
+            '66': Counter(Color.BLACK),
+            '55': Counter(Color.WHITE),
+            '33': Counter(Color.WHITE),
+            '11': Counter(Color.WHITE),
+            '04': Counter(Color.WHITE),
+        })
+        game.move('66', '00')
+        return game
+    return capture
+
+
+def othello_random_game():
+    def play():
+        rng, game = random.Random(0), Othello()
+        while not game.winner:
+            game.move(to_coords=rng.choice(game.legal_square_ids()))
+        return game
+    return play
+
+
+def display_board():
+    game = _play_chess(Chess(), CHESS_OPENING)
+    return game.display_board
+
+
+def new_games():
+    return lambda: [new_game(name) for name in game_names()]
+
+
+def save_restore():
+    game = _play_chess(Chess(), CHESS_OPENING)
+    temp_dir = TemporaryDirectory()
+    (Path(temp_dir.name) / 'saved_games').mkdir()
+
+    def save_and_restore():
+        cwd = os.getcwd()
+        os.chdir(temp_dir.name)
+        try:
+            game.save('benchmark')
+            return Game.restore('benchmark')
+        finally:
+            os.chdir(cwd)
+    save_and_restore.temp_dir = temp_dir  # Removed once the case is no longer used
+    return save_and_restore
+
+
+def _import_in_new_process(module_name):
+    root = Path(__file__).parent.parent
+    command = [sys.executable, '-c', f'import {module_name}']
+    return lambda: subprocess.run(command, cwd=root, check=True).returncode
+
+
+def app_import():
+    return _import_in_new_process('src.app')
+
+
+def terminal_import():
+    return _import_in_new_process('play_terminal_game')
+
+
+CASES = {
+    'chess_opening': chess_opening,
+    'chess_middlegame': chess_middlegame,
+    'draughts_multi_capture': draughts_multi_capture,
+    'othello_random_game': othello_random_game,
+    'display_board': display_board,
+    'new_games': new_games,
+    'save_restore': save_restore,
+    'app_import': app_import,
+    'terminal_import': terminal_import,
+}
@@ -0,0 +1,94 @@
+"""Run benchmark cases and compare them against a stored baseline.
+
+   Usage: python -m benchmarks.run [CASE ...] [options]
+
+   Each case is timed over several repeats, each of enough calls to take about
+   0.2 seconds, and its fastest call time is compared with the baseline. Cases
+   slower than the baseline by more than the threshold are reported as
+   regressions and the run exits with status 1. Results are written as JSON,
+   and --save-baseline stores them as the new baseline.
+
+   Functions:
+        time_case: return timing dict for one case
+        compare:   return comparison rows of results against a baseline
+"""
+import argparse
+import json
+from pathlib import Path
+import platform
+from statistics import median
+import sys
+from timeit import Timer
+
+from tabulate import tabulate
+
+from benchmarks.cases import CASES
+
+
+BASELINE_FILE = Path(__file__).parent / 'baseline.json'
+DEFAULT_THRESHOLD = 0.25
+
+
+def time_case(name, repeat=5):
+    """Return dict of calls per repeat and best and median seconds per call for case name."""
+    timer = Timer(CASES[name]())
+    calls, _ = timer.autorange()
+    times = [seconds / calls for seconds in timer.repeat(repeat, calls)]
+    return {'calls': calls, 'best': min(times), 'median': median(times)}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return list of (case, baseline best, best, ratio, regressed) rows for cases in results,
+       with None for cases missing from baseline.
+    """
+    rows = []
+    for name, timing in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, None, timing['best'], None, False))
+        else:
+            ratio = timing['best'] / base['best']
+            rows.append((name, base['best'], timing['best'], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Time game benchmark cases.')
+    parser.add_argument('cases', nargs='*', help=f"cases to run, default all: {', '.join(CASES)}")
+    parser.add_argument('--repeat', type=int, default=5, help='timed repeats per case')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='slowdown over baseline reported as a regression, 0.25 for 25%%')
+    parser.add_argument('--output', type=Path, help='JSON file results are written to')
+    parser.add_argument('--save-baseline', action='store_true', help='store results as the baseline')
+    args = parser.parse_args()
+
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main():
+    args = parse_args()
+    results = {name: time_case(name, args.repeat) for name in args.cases or CASES}
+    report = {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        print(f'Baseline saved to {args.baseline}')
+
+    baseline = json.loads(args.baseline.read_text())['results'] if args.baseline.exists() else {}
+    rows = compare(results, baseline, args.threshold)
+    print(tabulate([(name, base and base * 1e6, best * 1e6, ratio, 'REGRESSION' if regressed else '')
+                    for name, base, best, ratio, regressed in rows],
+                   headers=('Case', 'Baseline us', 'Best us', 'Ratio', ''), floatfmt='.2f'))
+
+    if any(row[-1] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,9 +3,7 @@ import sys
 
 from tabulate import tabulate
 
-from src.games.chess import Chess
-from src.games.draughts import Draughts
-from src.games.othello import Othello
+from src.games import new_game
 from src.game_errors import IllegalMoveError
 
 
@@ -23,11 +21,13 @@ class TerminalGame():
     {END}'''
 
     QUIT_MSG = f'\n{RED}Got too much for you, did it?!?{END}\n'
+    TAKE_BACK_COMMANDS = ('undo', 'redo')
 
+    # Game built once chosen, so only the chosen game type is imported
     GAME_OPTIONS = {
-        'C': Chess(),
-        'D': Draughts(),
-        'O': Othello()
+        'C': 'chess',
+        'D': 'draughts',
+        'O': 'othello'
     }
 
     X_COORD_MAP = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7}
@@ -49,7 +49,7 @@ class TerminalGame():
     def _parse_args_to_fetch_game(self):
         try:
             game_type = sys.argv[1].title()[0]
-            return self.GAME_OPTIONS[game_type]
+            return new_game(self.GAME_OPTIONS[game_type])
         except (KeyError, IndexError):
             print(self.INVALID_ARG_ERROR)
             sys.exit()
@@ -62,7 +62,10 @@ class TerminalGame():
         try:
             move_coords = input(f'{self.player} to move. Choose wisely.....\n --> ')
             self.display_message = self.NO_MESSAGE
-            if len(move_coords) > 2:
+            command = move_coords.strip().lower()
+            if command in self.TAKE_BACK_COMMANDS:
+                getattr(self.game, command)()
+            elif len(move_coords) > 2:
                 move_coords = self._split_and_map_coords(move_coords)
                 self.game.move(*move_coords)
             else:
@@ -0,0 +1,53 @@
+"""Command line script to play engines against each other and report their scores.
+
+   Usage: python play_tournament.py ENGINE ENGINE [ENGINE ...] [options]
+
+   Example:
+        python play_tournament.py random negamax:max_depth=2 mcts:playouts=300 --games othello
+"""
+import argparse
+
+from tabulate import tabulate
+
+from src.tournament import GAMES, parse_engine, run_tournament, schedule, summarise
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Play a tournament between game engines.')
+    parser.add_argument('engines', nargs='+',
+                        help='engine specs, eg random, negamax:max_depth=2, mcts:playouts=500')
+    parser.add_argument('--games', nargs='+', choices=sorted(GAMES), default=sorted(GAMES))
+    parser.add_argument('--openings', type=int, default=10, help='openings per game')
+    parser.add_argument('--opening-plies', type=int, default=4, help='random moves per opening')
+    parser.add_argument('--max-moves', type=int, default=300, help='moves before a game is drawn')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None, help='processes, default one per core')
+    parser.add_argument('--output', default='tournament.jsonl', help='JSONL file results are added to')
+    args = parser.parse_args()
+
+    if len(args.engines) < 2:
+        parser.error('at least two engines are needed')
+    for spec in args.engines:
+        try:
+            parse_engine(spec)
+        except ValueError as error:
+            parser.error(str(error))
+    return args
+
+
+def main():
+    args = parse_args()
+    tasks = schedule(args.engines, args.games, args.openings, args.opening_plies,
+                     args.seed, args.max_moves)
+    print(f'Playing {len(tasks)} games, results added to {args.output}')
+    results = run_tournament(tasks, args.output, args.workers)
+
+    rows = [(row['game'], row['engine'], row['opponent'], row['wins'], row['losses'], row['draws'],
+             row['score'], f"{row['low']:.3f} - {row['high']:.3f}")
+            for row in summarise(results)]
+    print(tabulate(rows, headers=('Game', 'Engine', 'Opponent', 'W', 'L', 'D', 'Score', '95% CI'),
+                   floatfmt='.3f'))
+
+
+if __name__ == '__main__':
+    main()
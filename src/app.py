@@ -0,0 +1,157 @@
+"""Create main app.
+
+   Game types and the Othello computer player are imported when first used,
+   so workers start without loading rules for games they never serve.
+
+   Games are kept in a GameStore, the session only holding the game id. Unless
+   one is passed to create_app, the store is created on the first request, from
+   the GAME_STORE_* config values, so importing the app creates no files.
+
+   Clients send the board version they show with each move, made of an id of
+   the game they show and its board_version. Moves from clients up to date get
+   back only the squares that changed, others, including pages still showing an
+   earlier game, the whole board.
+"""
+import atexit
+import os
+from threading import Lock
+from uuid import uuid4
+
+from flask import Flask, jsonify, request, render_template, session, url_for
+from flask_session import Session
+
+from src.game_enums import Color
+from src.game_store import GameStore, SqliteBackend
+from src.games import new_game
+from src.game_errors import IllegalMoveError
+
+
+GAME_NOT_FOUND = 'Game not found, refresh to start a new game'
+
+
+def create_app(game_store=None, config=None):
+    """Return app playing games kept in game_store, default a GameStore made on first
+       request. Values in config dict are set on app.config over the defaults.
+    """
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
+    app.config['SESSION_TYPE'] = os.environ.get('SESSION_TYPE', 'filesystem')
+    app.config['SESSION_FILE_DIR'] = os.environ.get('SESSION_FILE_DIR',
+                                                    os.path.join(os.getcwd(), 'flask_session'))
+    # Session only changes when a game starts, so don't write it back on every move
+    app.config['SESSION_REFRESH_EACH_REQUEST'] = False
+    app.config['GAME_STORE_PATH'] = os.environ.get('GAME_STORE_PATH', 'game_store.sqlite3')
+    app.config['GAME_STORE_MAX_GAMES'] = int(os.environ.get('GAME_STORE_MAX_GAMES', 1000))
+    app.config['GAME_STORE_IDLE_SECONDS'] = float(os.environ.get('GAME_STORE_IDLE_SECONDS', 3600))
+    app.config.update(config or {})
+    Session(app)
+
+    if game_store is not None:
+        app.extensions['game_store'] = game_store
+    store_lock = Lock()
+
+    if os.environ.get('GAME_INSTRUMENTATION'):
+        from src import instrumentation
+        instrumentation.enable()
+
+    def othello_ai():
+        # Searches keep state on the engine, so each request gets its own
+        from src.engines.othello_ai import OthelloAI
+        return OthelloAI(time_limit=float(os.environ.get('OTHELLO_AI_TIME_LIMIT', 0.5)))
+
+    def get_game_store():
+        with store_lock:
+            if 'game_store' not in app.extensions:
+                default_store = GameStore(SqliteBackend(app.config['GAME_STORE_PATH']),
+                                          max_games=app.config['GAME_STORE_MAX_GAMES'],
+                                          idle_seconds=app.config['GAME_STORE_IDLE_SECONDS'])
+                atexit.register(default_store.flush)
+                app.extensions['game_store'] = default_store
+            return app.extensions['game_store']
+
+    @app.route('/')
+    def home():
+        if session.get('game_id'):
+            get_game_store().discard(session['game_id'])
+        session['game_id'] = None
+        return render_template('home.html')
+
+    def play_game(game, *, move_piece_game=True, computer_color=None):
+        if session.get('game_id'):
+            get_game_store().discard(session['game_id'])
+        session['game_id'] = get_game_store().add(game)
+        # Board versions of each game start at 0, so a random id tells games apart
+        session['board_id'] = uuid4().hex[:8]
+        session['computer_color'] = computer_color
+        return render_template('game.html', game=game, version=shown_version(game),
+                               move_piece_game=move_piece_game)
+
+    def shown_version(game):
+        return f"{session.get('board_id')}:{game.board_version}"
+
+    @app.route('/chess')
+    def chess():
+        return play_game(new_game('chess'))
+
+    @app.route('/draughts')
+    def draughts():
+        return play_game(new_game('draughts'))
+
+    @app.route('/othello')
+    def othello():
+        return play_game(new_game('othello'), move_piece_game=False)
+
+    @app.route('/othello-vs-computer')
+    def othello_computer():
+        return play_game(new_game('othello'), move_piece_game=False, computer_color=Color.WHITE)
+
+    @app.route('/move')
+    def move():
+        from_coords = request.args['from'] if request.args['from'] != 'null' else None
+        to_coords = request.args['to']
+        game_id = session.get('game_id')
+        store = get_game_store()
+        # One request at a time moves a game, or a move could be made on a stale copy
+        with store.game_lock(game_id):
+            game = store.get(game_id)
+            if game is None:
+                return jsonify(err=GAME_NOT_FOUND), 404
+            # Board codes as the client shows them, None if it is out of sync
+            in_sync = request.args.get('version') == shown_version(game)
+            shown_codes = game.board_codes() if in_sync else None
+
+            try:
+                game.move(from_coords, to_coords)
+                play_computer_moves(game)
+                return json_response(game, shown_codes)
+            except IllegalMoveError as err:
+                return json_response(game, shown_codes, err=err.message)
+            finally:
+                store.save(game_id, game)
+
+    def play_computer_moves(game):
+        computer = None
+        # Computer may move more than once in a row if its opponent has to pass
+        while not game.winner and game.playing_color == session.get('computer_color'):
+            computer = computer or othello_ai()
+            game.move(to_coords=computer.best_move(game))
+
+    def json_response(game, shown_codes, err=None):
+        if shown_codes is None:
+            squares = {'board': game.display_board()}
+        else:
+            squares = {'changes': game.changed_squares(shown_codes)}
+        winner = game.winner_color()
+        return jsonify(
+            **squares,
+            version=shown_version(game),
+            next_player=game.playing_color.value,
+            legal_squares=game.legal_square_ids(),
+            winner=winner and winner.value,
+            err=err
+        )
+
+    return app
+
+
+app = create_app()
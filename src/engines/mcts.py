@@ -0,0 +1,176 @@
+"""Monte Carlo tree search for any Game.
+
+   MonteCarloAI grows a UCT search tree through the Game search interface,
+   legal_moves, apply, undo, is_terminal and result, scoring leaves by random
+   playouts. With more than one worker, each worker process searches its own
+   copy of the game with its own random seed, and visit statistics of the
+   root moves are added together before a move is chosen.
+
+   Playouts are cut off after max_playout_moves and scored as a draw, as Chess
+   and Draughts have no draw rules to end them.
+
+   Functions:
+        search_moves: return MoveStats per root move from one search
+        merge_stats:  return MoveStats lists from several searches added together
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+import random
+from time import perf_counter
+
+
+MoveStats = namedtuple('MoveStats', 'move visits wins')
+
+
+class _Node:
+    """Search tree node, reached from its parent by move made by color."""
+    __slots__ = ('move', 'color', 'parent', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(self, move, color, parent, untried):
+        self.move = move
+        self.color = color
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        log_visits = log(self.visits)
+        return max(self.children,
+                   key=lambda child: child.wins / child.visits
+                   + exploration * sqrt(log_visits / child.visits))
+
+
+class MonteCarloAI:
+    """Computer player for any Game using Monte Carlo tree search.
+
+       Attributes:
+            playouts:          Playouts per move, shared between workers. None for no limit
+            time_limit:        Seconds allowed to choose each move. None for no limit
+            workers:           Processes searching in parallel, 1 searches in this process
+            exploration:       UCT exploration constant
+            max_playout_moves: Moves after which a playout is scored as a draw
+            seed:              Random seed, for repeatable searches
+    """
+    def __init__(self, playouts=1000, time_limit=None, workers=1, exploration=1.4,
+                 max_playout_moves=200, seed=None):
+        if playouts is None and time_limit is None:
+            raise ValueError('Search needs a playout or time limit')
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.workers = workers
+        self.exploration = exploration
+        self.max_playout_moves = max_playout_moves
+        self.seed = seed
+        self._pool = None
+
+    def best_move(self, game):
+        """Return most visited (from_coords, to_coords) move for game, None if game is over."""
+        stats = self.move_stats(game)
+        return stats[0].move if stats else None
+
+    def move_stats(self, game):
+        """Return list of MoveStats for each legal move of game, most visited first."""
+        if game.is_terminal():
+            return []
+
+        seed = random.randrange(2 ** 32) if self.seed is None else self.seed
+        if self.workers == 1:
+            return search_moves(game, self.playouts, self.time_limit, self.exploration,
+                                self.max_playout_moves, seed)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        futures = [self._pool.submit(search_moves, game, playouts, self.time_limit,
+                                     self.exploration, self.max_playout_moves, seed + worker)
+                   for worker, playouts in enumerate(self._worker_playouts())]
+        return merge_stats(future.result() for future in futures)
+
+    def close(self):
+        """Shut down worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _worker_playouts(self):
+        if self.playouts is None:
+            return [None] * self.workers
+        share, extra = divmod(self.playouts, self.workers)
+        return [share + (worker < extra) for worker in range(self.workers)]
+
+
+def search_moves(game, playouts, time_limit, exploration, max_playout_moves, seed):
+    """Search game for playouts, or until time_limit seconds pass, and return list of MoveStats
+       per root move, most visited first. Game is back as it was on return.
+    """
+    rng = random.Random(seed)
+    deadline = float('inf') if time_limit is None else perf_counter() + time_limit
+    root = _Node(None, None, None, _shuffled(game.legal_moves(), rng))
+
+    playout = 0
+    while (playouts is None or playout < playouts) and perf_counter() < deadline:
+        _run_playout(game, root, rng, exploration, max_playout_moves)
+        playout += 1
+
+    stats = [MoveStats(child.move, child.visits, child.wins) for child in root.children]
+    return sorted(stats, key=lambda stat: stat.visits, reverse=True)
+
+
+def merge_stats(stats_lists):
+    """Return MoveStats lists added together per move, most visited first."""
+    totals = {}
+    for stats in stats_lists:
+        for move, visits, wins in stats:
+            total_visits, total_wins = totals.get(move, (0, 0.0))
+            totals[move] = (total_visits + visits, total_wins + wins)
+
+    stats = [MoveStats(move, visits, wins) for move, (visits, wins) in totals.items()]
+    return sorted(stats, key=lambda stat: stat.visits, reverse=True)
+
+
+def _run_playout(game, root, rng, exploration, max_playout_moves):
+    node, moves_made = root, 0
+    try:
+        # Selection
+        while not node.untried and node.children:
+            node = node.select_child(exploration)
+            game.apply(node.move)
+            moves_made += 1
+
+        # Expansion
+        if node.untried:
+            move = node.untried.pop()
+            color = game.playing_color
+            game.apply(move)
+            moves_made += 1
+            child = _Node(move, color, node, _shuffled(game.legal_moves(), rng))
+            node.children.append(child)
+            node = child
+
+        # Random playout
+        playout_moves = 0
+        while playout_moves < max_playout_moves and not game.is_terminal():
+            game.apply(rng.choice(game.legal_moves()))
+            moves_made += 1
+            playout_moves += 1
+
+        final_color = game.playing_color
+        result = game.result() if game.is_terminal() else 0
+    finally:
+        for _ in range(moves_made):
+            game.undo()
+
+    # Backpropagation, wins counted for the color that made the move into each node
+    while node is not None:
+        node.visits += 1
+        if node.color is not None:
+            node_result = result if node.color == final_color else -result
+            node.wins += (node_result + 1) / 2
+        node = node.parent
+
+
+def _shuffled(moves, rng):
+    rng.shuffle(moves)
+    return moves
@@ -0,0 +1,166 @@
+"""Game tree search for any Game.
+
+   NegamaxAI runs an iterative deepening negamax search with alpha-beta pruning
+   and a transposition table. It only uses the search interface shared by every
+   game, legal_moves, apply, undo, is_terminal, result and hash, so Chess,
+   Draughts and Othello all play through the same search core.
+
+   Positions are scored by an evaluate function, material by default. Scores are
+   always from the point of view of the playing color.
+
+   Functions:
+        material:   return material score of game for the playing color
+        bound_flag: return transposition table flag for a searched value
+"""
+from time import perf_counter
+
+
+INFINITY = 1000000
+WIN_SCORE = 10000
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+PIECE_VALUES = {
+    'Pawn': 100,
+    'Knight': 300,
+    'Bishop': 300,
+    'Rook': 500,
+    'Queen': 900,
+    'King': 0,
+    'Counter': 100,
+    'Disc': 1,
+}
+CROWNED_COUNTER_VALUE = 250
+
+
+class OutOfTime(Exception):
+    """Raised inside a search when its time limit has passed."""
+    pass
+
+
+class NegamaxAI:
+    """Computer player for any Game.
+
+       Attributes:
+            evaluate:       Function of game returning score for the playing color
+            max_depth:      Deepest search in moves, made unless time runs out first
+            time_limit:     Seconds allowed to choose each move, or None for no limit
+            max_table_size: Transposition table entries kept before the table is cleared
+    """
+    def __init__(self, evaluate=None, max_depth=3, time_limit=None, max_table_size=100000):
+        self.evaluate = evaluate or material
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.max_table_size = max_table_size
+        self._table = {}
+        self._deadline = None
+        self._nodes = 0
+
+    def best_move(self, game):
+        """Return best (from_coords, to_coords) move for game playing color, None if game is over.
+
+           Game is searched through apply and undo, and is back as it was on return.
+        """
+        moves = game.legal_moves()
+        if not moves:
+            return None
+
+        self._deadline = float('inf') if self.time_limit is None else perf_counter() + self.time_limit
+        self._nodes = 0
+        best_move = moves[0]
+
+        try:
+            for depth in range(1, self.max_depth + 1):
+                best_move = self._root(game, moves, depth)
+                # Search best move first in next iteration
+                moves = [best_move] + [move for move in moves if move != best_move]
+        except OutOfTime:
+            pass
+
+        if len(self._table) > self.max_table_size:
+            self._table.clear()
+        return best_move
+
+    def search(self, game, depth):
+        """Return negamax value of game for the playing color, searched depth moves deep."""
+        self._deadline = float('inf')
+        return self._negamax(game, depth, -INFINITY, INFINITY, 0)
+
+    def _root(self, game, moves, depth):
+        alpha, best_move = -INFINITY, moves[0]
+        for move in moves:
+            value = -self._child_value(game, move, depth, -INFINITY, -alpha, 1)
+            if value > alpha:
+                alpha, best_move = value, move
+        return best_move
+
+    def _child_value(self, game, move, depth, alpha, beta, ply):
+        game.apply(move)
+        try:
+            return self._negamax(game, depth - 1, alpha, beta, ply)
+        finally:
+            game.undo()
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        self._check_time()
+        if game.is_terminal():
+            # Quicker wins and slower losses score higher
+            return game.result() * (WIN_SCORE - ply)
+        if depth <= 0:
+            return self.evaluate(game)
+
+        key = game.hash()
+        entry = self._table.get(key)
+        table_move = None
+        if entry:
+            entry_depth, value, flag, table_move = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND and value >= beta or flag == UPPER_BOUND and value <= alpha:
+                    return value
+
+        original_alpha = alpha
+        best_value, best_move = -INFINITY, None
+        for move in _ordered_moves(game.legal_moves(), table_move):
+            value = -self._child_value(game, move, depth, -beta, -alpha, ply + 1)
+            if value > best_value:
+                best_value, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        self._table[key] = (depth, best_value, bound_flag(best_value, original_alpha, beta), best_move)
+        return best_value
+
+    def _check_time(self):
+        self._nodes += 1
+        if not self._nodes & 63 and perf_counter() > self._deadline:
+            raise OutOfTime()
+
+
+def _ordered_moves(moves, first_move):
+    if first_move is not None and first_move in moves:
+        moves.remove(first_move)
+        moves.insert(0, first_move)
+    return moves
+
+
+def bound_flag(value, alpha, beta):
+    """Return whether searched value is EXACT, or only an UPPER_BOUND or LOWER_BOUND, when
+       searched with window alpha to beta.
+    """
+    if value <= alpha:
+        return UPPER_BOUND
+    if value >= beta:
+        return LOWER_BOUND
+    return EXACT
+
+
+def material(game):
+    """Return value of playing color pieces less value of opponent pieces."""
+    score = 0
+    for piece in game.current_board_pieces():
+        value = CROWNED_COUNTER_VALUE if getattr(piece, 'crowned', False) else PIECE_VALUES[piece.name]
+        score += value if piece.color == game.playing_color else -value
+    return score
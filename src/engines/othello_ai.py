@@ -0,0 +1,236 @@
+"""Computer player for Othello.
+
+   Midgame moves come from an iterative deepening alpha-beta search scored on
+   mobility and the corner, edge and diagonal pattern tables in
+   othello_patterns, which cover corners and edge stability. Once few enough
+   squares are empty the position is solved exactly for final disc count
+   instead, after a shallow midgame search whose move is played should the
+   solver run out of time. Both phases stop at the time limit and keep their
+   transposition tables between moves.
+
+   Positions are searched as (player, opponent) bitboards, see othello_bitboard,
+   which is much faster than the general search in negamax working on Game.
+   Transposition tables are keyed on the canonical form of each position, so
+   the 8 symmetric versions of a position share one entry.
+"""
+from time import perf_counter
+
+from src.engines import othello_patterns
+from src.engines.negamax import (bound_flag, EXACT, INFINITY, LOWER_BOUND, OutOfTime,
+                                 UPPER_BOUND, WIN_SCORE)
+from src.games import othello_bitboard as bitboard
+from src.games.othello_bitboard import (canonical, EDGES, flips, INVERSE_SQUARES, legal_moves,
+                                        popcount, stable_discs, SYMMETRY_SQUARES)
+
+
+CORNERS = 0x8100000000000081
+
+# Static square preference used to order moves: corners first, X squares last.
+SQUARE_WEIGHTS = (
+    100, -20, 10, 5, 5, 10, -20, 100,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    10, -2, 1, 1, 1, 1, -2, 10,
+    5, -2, 1, 0, 0, 1, -2, 5,
+    5, -2, 1, 0, 0, 1, -2, 5,
+    10, -2, 1, 1, 1, 1, -2, 10,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    100, -20, 10, 5, 5, 10, -20, 100,
+)
+MOVE_ORDER_KEY = [-weight for weight in SQUARE_WEIGHTS]
+# Midgame search depth before solving, for a move to fall back on and to order the solver's
+ENDGAME_PRESEARCH_DEPTH = 4
+
+
+class OthelloAI:
+    """Computer player for Othello.
+
+       Attributes:
+            time_limit:      Seconds allowed to choose each move
+            endgame_empties: Empty square count at which the exact solver takes over. Up to 9
+                             empty squares are solved in under 0.5 seconds, 12 can take
+                             several seconds.
+            max_table_size:  Transposition table entries kept before a table is cleared
+    """
+    def __init__(self, time_limit=0.5, endgame_empties=9, max_table_size=200000):
+        self.time_limit = time_limit
+        self.endgame_empties = endgame_empties
+        self.max_table_size = max_table_size
+        self._midgame_table = {}
+        self._endgame_table = {}
+        self._deadline = None
+        self._nodes = 0
+
+    def best_move(self, game):
+        """Return Coords of move for game playing color, or None if it has to pass."""
+        player, opponent = game.discs[game.playing_color], game.discs[game.opponent_color]
+        move = self.best_move_for(player, opponent)
+        return None if move is None else bitboard.bit_coords(move)
+
+    def best_move_for(self, player, opponent):
+        """Return bit index of move for player, or None if player has no legal move."""
+        moves = self._ordered_moves(legal_moves(player, opponent), None)
+        if not moves:
+            return None
+
+        self._deadline = perf_counter() + self.time_limit
+        self._nodes = 0
+        best_move = moves[0]
+
+        try:
+            empty_count = 64 - popcount(player | opponent)
+            if empty_count <= self.endgame_empties:
+                for depth in range(1, min(ENDGAME_PRESEARCH_DEPTH, empty_count) + 1):
+                    best_move, moves = self._deepen(player, opponent, moves, depth)
+                best_move, _ = self._root(player, opponent, moves, self._solve_child)
+            else:
+                for depth in range(1, empty_count + 1):
+                    best_move, moves = self._deepen(player, opponent, moves, depth)
+        except OutOfTime:
+            pass
+
+        self._trim_tables()
+        return best_move
+
+    def solve(self, player, opponent):
+        """Return exact final disc difference for player with best play by both sides."""
+        self._deadline = float('inf')
+        return self._solve(player, opponent, -INFINITY, INFINITY)
+
+    def _deepen(self, player, opponent, moves, depth):
+        best_move, _ = self._root(player, opponent, moves,
+                                  lambda *args: self._midgame_child(depth, *args))
+        # Search best move first in next iteration
+        moves = [best_move] + [move for move in moves if move != best_move]
+        return best_move, moves
+
+    @staticmethod
+    def _root(player, opponent, moves, child_score):
+        alpha, best_move = -INFINITY, moves[0]
+        for move in moves:
+            move_bit = 1 << move
+            flipped = flips(player, opponent, move_bit)
+            score = child_score(opponent ^ flipped, player | flipped | move_bit, alpha)
+            if score > alpha:
+                alpha, best_move = score, move
+        return best_move, alpha
+
+    def _midgame_child(self, depth, player, opponent, alpha):
+        return -self._negamax(player, opponent, depth - 1, -INFINITY, -alpha)
+
+    def _solve_child(self, player, opponent, alpha):
+        return -self._solve(player, opponent, -INFINITY, -alpha)
+
+    def _negamax(self, player, opponent, depth, alpha, beta):
+        self._check_time()
+        if depth <= 0:
+            return evaluate(player, opponent)
+
+        key, symmetry = canonical(player, opponent)
+        entry = self._midgame_table.get(key)
+        table_move = None
+        if entry:
+            entry_depth, value, flag, table_move = entry
+            table_move = INVERSE_SQUARES[symmetry][table_move]
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND and value >= beta or flag == UPPER_BOUND and value <= alpha:
+                    return value
+
+        moves = legal_moves(player, opponent)
+        if not moves:
+            if not legal_moves(opponent, player):
+                return final_score(player, opponent)
+            return -self._negamax(opponent, player, depth - 1, -beta, -alpha)
+
+        value, best_move = self._search_moves(player, opponent, moves, table_move, alpha, beta,
+                                              lambda p, o, a, b: self._negamax(p, o, depth - 1, a, b))
+        self._midgame_table[key] = (depth, value, bound_flag(value, alpha, beta),
+                                    SYMMETRY_SQUARES[symmetry][best_move])
+        return value
+
+    def _solve(self, player, opponent, alpha, beta):
+        self._check_time()
+        key, symmetry = canonical(player, opponent)
+        entry = self._endgame_table.get(key)
+        table_move = None
+        if entry:
+            value, flag, table_move = entry
+            table_move = INVERSE_SQUARES[symmetry][table_move]
+            if flag == EXACT:
+                return value
+            if flag == LOWER_BOUND and value >= beta or flag == UPPER_BOUND and value <= alpha:
+                return value
+
+        # Opponent keeps its stable discs, so player can't finish more than 64 - 2 * stable ahead
+        if alpha >= 64 - 2 * popcount(opponent):
+            best_possible = 64 - 2 * popcount(stable_discs(opponent, player))
+            if best_possible <= alpha:
+                return best_possible
+
+        moves = legal_moves(player, opponent)
+        if not moves:
+            if not legal_moves(opponent, player):
+                return popcount(player) - popcount(opponent)
+            return -self._solve(opponent, player, -beta, -alpha)
+
+        value, best_move = self._search_moves(player, opponent, moves, table_move, alpha, beta,
+                                              self._solve)
+        self._endgame_table[key] = (value, bound_flag(value, alpha, beta),
+                                    SYMMETRY_SQUARES[symmetry][best_move])
+        return value
+
+    def _search_moves(self, player, opponent, moves, table_move, alpha, beta, child_search):
+        best_value, best_move = -INFINITY, None
+        for move in self._ordered_moves(moves, table_move):
+            move_bit = 1 << move
+            flipped = flips(player, opponent, move_bit)
+            value = -child_search(opponent ^ flipped, player | flipped | move_bit, -beta, -alpha)
+            if value > best_value:
+                best_value, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        return best_value, best_move
+
+    @staticmethod
+    def _ordered_moves(moves, first_move):
+        ordered = sorted(bitboard.squares(moves), key=MOVE_ORDER_KEY.__getitem__)
+        if first_move is not None and first_move in ordered:
+            ordered.remove(first_move)
+            ordered.insert(0, first_move)
+        return ordered
+
+    def _check_time(self):
+        self._nodes += 1
+        if not self._nodes & 255 and perf_counter() > self._deadline:
+            raise OutOfTime()
+
+    def _trim_tables(self):
+        for table in (self._midgame_table, self._endgame_table):
+            if len(table) > self.max_table_size:
+                table.clear()
+
+
+def evaluate(player, opponent):
+    """Return heuristic score of position for player, positive is good for player."""
+    mobility = popcount(legal_moves(player, opponent)) - popcount(legal_moves(opponent, player))
+    score = 5 * mobility + othello_patterns.evaluate(player, opponent)
+
+    # Edge stability is in the pattern tables. Stable discs further in are rare until a
+    # corner is taken, so they are only looked for after that.
+    if (player | opponent) & CORNERS:
+        score += 10 * (popcount(stable_discs(player, opponent) & ~EDGES)
+                       - popcount(stable_discs(opponent, player) & ~EDGES))
+    return score
+
+
+def final_score(player, opponent):
+    """Return score of finished game for player. Any win outscores every heuristic score."""
+    disc_difference = popcount(player) - popcount(opponent)
+    if disc_difference > 0:
+        return WIN_SCORE + disc_difference
+    if disc_difference < 0:
+        return -WIN_SCORE + disc_difference
+    return 0
@@ -0,0 +1,216 @@
+"""Pattern table evaluation for Othello.
+
+   The board is covered by pattern instances: the 4 edges, the 4 3x3 corner
+   blocks and the 2 long diagonals. Each instance reads its squares as a base 3
+   number (0 empty, 1 first side, 2 second side), which indexes a table of
+   scores shared by every instance of the same shape. Scores are from the
+   point of view of the first side and change sign when colors swap.
+
+   Tables are stored as little endian int16 in othello_patterns.bin, one after
+   another in TABLE_SIZES order. The file is memory mapped, so worker
+   processes share its pages and nothing is parsed at start up. Run this
+   module to rebuild the file.
+
+   Functions:
+        indexes:        return pattern indexes for a position, from scratch
+        pattern_score:  return score for pattern indexes, from scratch
+        evaluate:       return pattern score of bitboard position for player
+"""
+from array import array
+import mmap
+from pathlib import Path
+import sys
+
+from src.games.othello_bitboard import flip_diagonal, flip_vertical, mirror_horizontal
+
+
+TABLES_FILE = Path(__file__).parent / 'othello_patterns.bin'
+
+EDGE, CORNER, DIAGONAL = 'edge', 'corner', 'diagonal'
+TABLE_SIZES = ((EDGE, 3 ** 8), (CORNER, 3 ** 9), (DIAGONAL, 3 ** 8))
+
+
+def _square(x, y):
+    return y * 8 + x
+
+
+# (table, squares) per instance, first square is read as the lowest base 3 digit.
+# Instances of one shape are symmetric images of each other, square for square.
+PATTERNS = (
+    (EDGE, tuple(_square(x, 0) for x in range(8))),
+    (EDGE, tuple(_square(x, 7) for x in range(8))),
+    (EDGE, tuple(_square(0, y) for y in range(8))),
+    (EDGE, tuple(_square(7, y) for y in range(8))),
+    (CORNER, tuple(_square(x, y) for y in range(3) for x in range(3))),
+    (CORNER, tuple(_square(x, 7 - y) for y in range(3) for x in range(3))),
+    (CORNER, tuple(_square(7 - x, y) for y in range(3) for x in range(3))),
+    (CORNER, tuple(_square(7 - x, 7 - y) for y in range(3) for x in range(3))),
+    (DIAGONAL, tuple(_square(i, i) for i in range(8))),
+    (DIAGONAL, tuple(_square(7 - i, i) for i in range(8))),
+)
+
+# Base 3 value of a byte or 9 bit mask with every set bit read as digit 1
+BASE_3 = tuple(sum(3 ** place for place in range(9) if mask >> place & 1) for mask in range(512))
+
+MAIN_DIAGONAL = 0x8040201008040201
+GATHER = 0x0101010101010101
+
+_tables = None
+
+
+def tables():
+    """Return dict of table name to sequence of int scores, loaded once per process."""
+    global _tables
+    if _tables is None:
+        _tables = _load_tables(TABLES_FILE)
+    return _tables
+
+
+def _load_tables(path):
+    with open(path, 'rb') as tables_file:
+        if sys.byteorder == 'little':
+            scores = memoryview(mmap.mmap(tables_file.fileno(), 0, access=mmap.ACCESS_READ)).cast('h')
+        else:
+            scores = array('h', tables_file.read())
+            scores.byteswap()
+
+    loaded, offset = {}, 0
+    for name, size in TABLE_SIZES:
+        loaded[name] = scores[offset:offset + size]
+        offset += size
+    return loaded
+
+
+def indexes(first, second):
+    """Return list of index per pattern instance for first and second side bitboards."""
+    return [sum((1 if first >> square & 1 else 2 if second >> square & 1 else 0) * 3 ** place
+                for place, square in enumerate(squares))
+            for _, squares in PATTERNS]
+
+
+def pattern_score(pattern_indexes):
+    """Return score of pattern indexes for the first side. Slow reference for evaluate."""
+    loaded = tables()
+    return sum(loaded[table][index] for (table, _), index in zip(PATTERNS, pattern_indexes))
+
+
+def evaluate(player, opponent):
+    """Return pattern score for player of bitboard position.
+
+       Indexes are read straight from the bitboards with byte lookups, in the same order
+       as PATTERNS, so a search leaf needs no per square work.
+    """
+    loaded = tables()
+    edge, corner, diagonal = loaded[EDGE], loaded[CORNER], loaded[DIAGONAL]
+
+    player_transposed, opponent_transposed = flip_diagonal(player), flip_diagonal(opponent)
+    player_vertical, opponent_vertical = flip_vertical(player), flip_vertical(opponent)
+    player_mirrored, opponent_mirrored = mirror_horizontal(player), mirror_horizontal(opponent)
+
+    score = (edge[_row_index(player, opponent, 0)]
+             + edge[_row_index(player, opponent, 56)]
+             + edge[_row_index(player_transposed, opponent_transposed, 0)]
+             + edge[_row_index(player_transposed, opponent_transposed, 56)])
+
+    score += (corner[_corner_index(player, opponent)]
+              + corner[_corner_index(player_vertical, opponent_vertical)]
+              + corner[_corner_index(player_mirrored, opponent_mirrored)]
+              + corner[_corner_index(mirror_horizontal(player_vertical),
+                                     mirror_horizontal(opponent_vertical))])
+
+    score += (diagonal[_diagonal_index(player, opponent)]
+              + diagonal[_diagonal_index(player_mirrored, opponent_mirrored)])
+    return score
+
+
+def _row_index(first, second, shift):
+    return BASE_3[first >> shift & 0xFF] + 2 * BASE_3[second >> shift & 0xFF]
+
+
+def _corner_index(first, second):
+    return BASE_3[_corner_bits(first)] + 2 * BASE_3[_corner_bits(second)]
+
+
+def _corner_bits(mask):
+    return mask & 0x7 | mask >> 5 & 0x38 | mask >> 10 & 0x1C0
+
+
+def _diagonal_index(first, second):
+    return BASE_3[_diagonal_bits(first)] + 2 * BASE_3[_diagonal_bits(second)]
+
+
+def _diagonal_bits(mask):
+    return ((mask & MAIN_DIAGONAL) * GATHER) >> 56 & 0xFF
+
+
+# Table building. Scores are hand set, for the first side. Between them the shapes score
+# corners, X squares next to an empty corner and edge discs that can't be flipped.
+CORNER_WEIGHT = 20  # Corners also score as stable discs on both of their edges
+STABLE_WEIGHT = 10  # Per edge disc in an unbroken run from an owned corner
+X_SQUARE_PENALTY = 15  # X square next to an empty corner gives the corner away
+C_SQUARE_PENALTY = 5  # As X squares, for the edge squares next to a corner
+DIAGONAL_WEIGHTS = (0, 0, 1, 1, 1, 1, 0, 0)
+
+
+def _digits(index, length):
+    digits = []
+    for _ in range(length):
+        index, digit = divmod(index, 3)
+        digits.append(digit)
+    return digits
+
+
+def _sign(digit):
+    return (0, 1, -1)[digit]
+
+
+def _edge_score(digits):
+    stable = set()
+    for run in (range(8), range(7, -1, -1)):
+        for square in run:
+            if not digits[square] or digits[square] != digits[run[0]]:
+                break
+            stable.add(square)
+    score = STABLE_WEIGHT * sum(_sign(digits[square]) for square in stable)
+
+    for corner, c_square in ((0, 1), (7, 6)):
+        if not digits[corner]:
+            score -= C_SQUARE_PENALTY * _sign(digits[c_square])
+    return score
+
+
+def _corner_score(digits):
+    score = CORNER_WEIGHT * _sign(digits[0])
+    if not digits[0]:
+        score -= X_SQUARE_PENALTY * _sign(digits[4])
+    return score
+
+
+def _diagonal_score(digits):
+    return sum(weight * _sign(digit) for weight, digit in zip(DIAGONAL_WEIGHTS, digits))
+
+
+def build_tables():
+    """Return dict of table name to list of int scores, computed from the weights above."""
+    scorers = {EDGE: (_edge_score, 8), CORNER: (_corner_score, 9), DIAGONAL: (_diagonal_score, 8)}
+    built = {}
+    for name, size in TABLE_SIZES:
+        score_digits, length = scorers[name]
+        built[name] = [score_digits(_digits(index, length)) for index in range(size)]
+    return built
+
+
+def write_tables(path=TABLES_FILE):
+    """Build tables and write them to path in the binary layout read by tables()."""
+    scores = array('h')
+    built = build_tables()
+    for name, _ in TABLE_SIZES:
+        scores.extend(built[name])
+    if sys.byteorder != 'little':
+        scores.byteswap()
+    with open(path, 'wb') as tables_file:
+        scores.tofile(tables_file)
+
+
+if __name__ == '__main__':
+    write_tables()
@@ -6,9 +6,11 @@ from src.games.game import move_direction
 
 class Bishop(GamePiece):
     """Bishop chess game piece. Inherits from GamePiece."""
+    __slots__ = ()
+    code = 3
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
 
     def __str__(self):
         return '\u2657' if self.color == Color.WHITE else '\u265D'
@@ -3,9 +3,12 @@ from src.game_pieces.game_piece import GamePiece
 from src.games.game import NEXT_ADJACENT_COORD
 
 class Counter(GamePiece):
+    __slots__ = ('crowned', '_to_coords')
+    code = 7
+    flag = 'crowned'
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
         self.crowned = False
         self._to_coords = None
 
@@ -1,9 +1,22 @@
-"""Module for GamePiece abstract base class."""
+"""Module for GamePiece abstract base class.
+
+   Functions:
+        decode_piece: return new piece for code made by GamePiece.encode
+"""
 from abc import ABC, abstractmethod
 
 from src.game_enums import Color
 
 
+# Piece codes fit in a byte: piece type in the low 4 bits, then color and flag bits.
+# 0 is left free to mean an empty square.
+CODE_MASK = 0x0F
+BLACK_BIT = 0x10
+FLAG_BIT = 0x20
+
+PIECE_CODES = {}  # Piece type code: GamePiece subclass
+
+
 class GamePiece(ABC):
     """Abstract Base class for game pieces.
 
@@ -12,15 +25,43 @@ class GamePiece(ABC):
             color:  Piece color (Color Enum)
             coords: Piece current coordinates on board
 
+       Class attributes:
+            code: Unique int 1-15 identifying piece type in board codes
+            flag: Name of bool attribute kept in board codes, e.g. 'moved', if any
+
+       Class methods:
+            of: Shared read only instance of piece type for a color, for comparisons
+
        Abstract methods:
             legal_move:    Logic to decide legal move for piece
             legal_capture: Logic to decide legal capture for piece
     """
-    def __init__(self):
-        self.name = self.__class__.__name__
-        self._color = None
+    __slots__ = ('color', 'coords')
+    code = None
+    flag = None
+    _flyweights = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
+        # Read only subclasses made by of inherit code, only the piece type is registered
+        if cls.__dict__.get('code') is not None:
+            PIECE_CODES[cls.code] = cls
+
+    def __init__(self, color):
+        if not isinstance(color, Color):
+            raise ValueError('Not a legal game color')
+        self.color = color
         self.coords = None
 
+    def __setstate__(self, state):
+        # Pieces pickled before slots were added have a __dict__ state, with color as _color
+        if isinstance(state, dict):
+            state = None, {'color' if name == '_color' else name: value
+                           for name, value in state.items() if name != 'name'}
+        for name, value in state[1].items():
+            setattr(self, name, value)
+
     def __repr__(self):
         return f'{self.name}({self.color.value!r})'
 
@@ -28,20 +69,33 @@ class GamePiece(ABC):
         raise NotImplementedError()
 
     def __eq__(self, other):
-        if other.__class__ is self.__class__:
+        # Shared instances from of are a read only subclass, equal to pieces of their type
+        if other.__class__ is self.__class__ or isinstance(other, GamePiece):
             return (self.name, self.color) == (other.name, other.color)
         return NotImplemented
 
-    @property
-    def color(self):
-        return self._color
+    @classmethod
+    def of(cls, color):
+        """Return shared instance of piece type for color, to compare against,
+           e.g. piece == King.of(Color.WHITE). Its attributes can't be set, so it
+           can't be placed on a board or changed.
+        """
+        try:
+            return GamePiece._flyweights[cls, color]
+        except KeyError:
+            piece = cls(color)
+            piece.__class__ = _read_only_class(cls)
+            GamePiece._flyweights[cls, color] = piece
+            return piece
 
-    @color.setter
-    def color(self, color):
-        if color not in Color:
-            # AttributeError thrown if illegal Color Enum, TODO Why can't I catch it?
-            raise ValueError('Not a legal game color')
-        self._color = color
+    def encode(self):
+        """Return piece type, color and flag as int code for compact board storage."""
+        code = self.code
+        if self.color == Color.BLACK:
+            code |= BLACK_BIT
+        if self.flag and getattr(self, self.flag):
+            code |= FLAG_BIT
+        return code
 
     @abstractmethod
     def legal_move(self, to_coords):
@@ -52,3 +106,33 @@ class GamePiece(ABC):
     def legal_capture(self, to_coords):
         """Confirm if capture at passed coordinates supported by this piece. Return bool."""
         raise NotImplementedError()
+
+
+_read_only_classes = {}  # Piece type: read only subclass for instances shared by of
+
+
+def _read_only_class(cls):
+    read_only = _read_only_classes.get(cls)
+    if read_only is None:
+        def refuse_change(piece, attribute, *value):
+            raise AttributeError(f"{piece!r} is shared by {cls.name}.of, "
+                                 f"its {attribute} can't be changed")
+
+        read_only = _read_only_classes[cls] = type(cls.__name__, (cls,), {
+            '__slots__': (),
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__setattr__': refuse_change,
+            '__delattr__': refuse_change,
+            # Copies and pickles are the shared instance itself
+            '__reduce__': lambda piece: (cls.of, (piece.color,)),
+        })
+    return read_only
+
+
+def decode_piece(code):
+    """Return new piece for int code made by GamePiece.encode. Coords are left unset."""
+    piece = PIECE_CODES[code & CODE_MASK](Color.BLACK if code & BLACK_BIT else Color.WHITE)
+    if code & FLAG_BIT:
+        setattr(piece, piece.flag, True)
+    return piece
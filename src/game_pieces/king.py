@@ -6,9 +6,12 @@ from src.game_pieces.game_piece import GamePiece
 
 class King(GamePiece):
     """King chess game piece. Inherits from GamePiece."""
+    __slots__ = ('moved',)
+    code = 6
+    flag = 'moved'
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
         self.moved = False
 
     def __str__(self):
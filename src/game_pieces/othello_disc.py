@@ -4,9 +4,11 @@ from src.game_pieces.game_piece import GamePiece
 
 class Disc(GamePiece):
     """Disc is a dumb object. Can only be placed or flipped so doesn't implement legal move/capture."""
+    __slots__ = ()
+    code = 8
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
 
     def __str__(self):
         return '\u25EF' if self.color == Color.WHITE else '\u2B24'
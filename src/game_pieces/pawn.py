@@ -5,9 +5,11 @@ from src.game_pieces.game_piece import GamePiece
 
 class Pawn(GamePiece):
     """Pawn chess game piece. Inherits from GamePiece."""
+    __slots__ = ()
+    code = 1
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
 
     def __str__(self):
         return '\u2659' if self.color == Color.WHITE else '\u265F'
@@ -6,9 +6,11 @@ from src.games.game import move_direction
 
 class Queen(GamePiece):
     """Queen chess game piece. Inherits from GamePiece."""
+    __slots__ = ()
+    code = 5
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
 
     def __str__(self):
         return '\u2655' if self.color == Color.WHITE else '\u265B'
@@ -6,9 +6,12 @@ from src.games.game import move_direction
 
 class Rook(GamePiece):
     """Rook chess game piece. Inherits from GamePiece."""
+    __slots__ = ('moved',)
+    code = 4
+    flag = 'moved'
+
     def __init__(self, color):
-        super().__init__()
-        self.color = color
+        super().__init__(color)
         self.moved = False
 
     def __str__(self):
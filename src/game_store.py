@@ -0,0 +1,196 @@
+"""Server side store of games being played, keyed by game id.
+
+   GameStore keeps games in memory, most recently used last, in front of a
+   persistent backend. Games leave memory when more than max_games are held
+   or when unused for idle_seconds, and are only written to the backend then,
+   or on flush, so requests for games in memory do no pickling or disk I/O.
+   Games not in memory are loaded back from the backend when next asked for.
+   Games in memory are kept compact between requests, see Game.compact, so
+   they hold board codes rather than piece objects. get expands them again.
+
+   The memory cache belongs to one process, so a game should be served by the
+   same process for as long as it is in memory there. The Procfile runs one
+   gunicorn worker process, with threads, for this. Requests changing a game
+   hold its game_lock from get to save, so two requests for one game can't
+   both change it and one overwrite the other's move.
+
+   Classes:
+        SqliteBackend: games stored as compressed pickles in an sqlite table
+        GameStore:     games in an LRU cache in front of a backend
+"""
+from collections import OrderedDict
+import pickle
+import sqlite3
+from threading import Lock
+from time import monotonic, time
+from uuid import uuid4
+from weakref import WeakValueDictionary
+import zlib
+
+
+class SqliteBackend:
+    """Persistent store of game data by game id in an sqlite database file.
+
+       Attributes:
+            path: Database file path, or ':memory:'
+    """
+    def __init__(self, path):
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS games '
+                                     '(game_id TEXT PRIMARY KEY, data BLOB, updated REAL)')
+
+    def load(self, game_id):
+        """Return bytes stored for game_id, None if there are none."""
+        with self._lock:
+            row = self._connection.execute('SELECT data FROM games WHERE game_id = ?',
+                                           (game_id,)).fetchone()
+        return row[0] if row else None
+
+    def store(self, items):
+        """Store (game_id, bytes) pairs from items, replacing any stored for the same ids."""
+        now = time()
+        with self._lock, self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO games VALUES (?, ?, ?)',
+                                         ((game_id, data, now) for game_id, data in items))
+
+    def delete(self, game_id):
+        """Remove game_id from the store, if stored."""
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM games WHERE game_id = ?', (game_id,))
+
+
+class GameStore:
+    """Games by game id, held in memory and written to backend when evicted or flushed.
+
+       Attributes:
+            backend:      Object with load, store and delete methods, as SqliteBackend
+            max_games:    Most games held in memory
+            idle_seconds: Seconds a game is held in memory unused
+    """
+    def __init__(self, backend, max_games=1000, idle_seconds=3600, clock=monotonic):
+        self.backend = backend
+        self.max_games = max_games
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        # game_id: [game, last used time, changed since last written]
+        self._games = OrderedDict()
+        # game_id: (game, pickled data) taken out of memory or flushed, until written
+        self._pending = {}
+        self._lock = Lock()
+        # Held by the one thread writing to backend, so writes are made in order
+        self._write_lock = Lock()
+        # game_id: Lock, kept while a request holds it
+        self._game_locks = WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._games)
+
+    def add(self, game):
+        """Store new game and return its game id."""
+        game_id = uuid4().hex
+        self.save(game_id, game)
+        return game_id
+
+    def get(self, game_id):
+        """Return game stored as game_id, None if there is none."""
+        with self._lock:
+            game = self._held_game(game_id)
+            if game is not None:
+                self._evict()
+        if game is not None:
+            self._write_pending()
+            return game
+
+        data = self.backend.load(game_id) if game_id else None
+        if data is None:
+            return None
+        game = pickle.loads(zlib.decompress(data))
+        with self._lock:
+            self._games[game_id] = [game, self._clock(), False]
+            self._evict()
+        self._write_pending()
+        return game
+
+    def game_lock(self, game_id):
+        """Return lock for game_id. Hold it from get to save while changing the game."""
+        with self._lock:
+            lock = self._game_locks.get(game_id)
+            if lock is None:
+                lock = self._game_locks[game_id] = Lock()
+            return lock
+
+    def save(self, game_id, game):
+        """Store game as game_id after it has changed. Compacts game."""
+        game.compact()
+        with self._lock:
+            self._games[game_id] = [game, self._clock(), True]
+            self._games.move_to_end(game_id)
+            self._evict()
+        self._write_pending()
+
+    def discard(self, game_id):
+        """Remove game_id from memory and backend."""
+        with self._lock:
+            self._games.pop(game_id, None)
+            self._pending.pop(game_id, None)
+        # After any write of the game already under way
+        with self._write_lock:
+            self.backend.delete(game_id)
+
+    def flush(self):
+        """Write every game changed since it was last written to the backend."""
+        with self._lock:
+            for game_id, entry in self._games.items():
+                if entry[2]:
+                    self._set_pending(game_id, entry)
+        self._write_pending()
+
+    def _held_game(self, game_id):
+        entry = self._games.get(game_id)
+        if entry is None:
+            if game_id not in self._pending:
+                return None
+            # Taken out of memory but not written yet, so newer than the backend copy
+            entry = self._games[game_id] = [self._pending[game_id][0], None, True]
+        entry[1] = self._clock()
+        self._games.move_to_end(game_id)
+        entry[0].expand()
+        return entry[0]
+
+    def _evict(self):
+        idle_since = self._clock() - self.idle_seconds
+        while self._games:
+            game_id, entry = next(iter(self._games.items()))
+            if len(self._games) <= self.max_games and entry[1] > idle_since:
+                break
+            self._games.popitem(last=False)
+            if entry[2]:
+                self._set_pending(game_id, entry)
+
+    def _set_pending(self, game_id, entry):
+        self._pending[game_id] = (entry[0], _dumps(entry[0]))
+        entry[2] = False
+
+    def _write_pending(self):
+        """Write pending games to backend, without holding _lock so other requests go on
+           meanwhile. Games made pending while another thread writes are left to it.
+        """
+        while self._pending and self._write_lock.acquire(blocking=False):
+            try:
+                with self._lock:
+                    items = [(game_id, data) for game_id, (_, data) in self._pending.items()]
+                self.backend.store(items)
+                with self._lock:
+                    for game_id, data in items:
+                        # Game may have been taken out of memory again since
+                        if game_id in self._pending and self._pending[game_id][1] is data:
+                            del self._pending[game_id]
+            finally:
+                self._write_lock.release()
+
+
+def _dumps(game):
+    return zlib.compress(pickle.dumps(game, pickle.HIGHEST_PROTOCOL), 1)
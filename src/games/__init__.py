@@ -0,0 +1,51 @@
+"""Registry of game types by name, each imported the first time it is asked for.
+
+   Functions:
+        game_names: return tuple of registered game names
+        game_class: return Game subclass for a game name
+        new_game:   return new game for a game name
+"""
+from importlib import import_module
+
+
+# Game name: (module, class name)
+GAME_TYPES = {
+    'chess': ('src.games.chess', 'Chess'),
+    'draughts': ('src.games.draughts', 'Draughts'),
+    'othello': ('src.games.othello', 'Othello'),
+}
+UNKNOWN_GAME = 'Unknown game {!r}, choose from: {}'
+
+_game_classes = {}
+
+
+def game_names():
+    """Return tuple of registered game names."""
+    return tuple(GAME_TYPES)
+
+
+def game_class(name):
+    """Return Game subclass registered as name, importing its module on first use.
+       Raises:
+            KeyError
+    """
+    try:
+        return _game_classes[name]
+    except KeyError:
+        pass
+
+    try:
+        module_name, class_name = GAME_TYPES[name]
+    except KeyError:
+        raise KeyError(UNKNOWN_GAME.format(name, ', '.join(GAME_TYPES))) from None
+    cls = _game_classes[name] = getattr(import_module(module_name), class_name)
+    return cls
+
+
+def new_game(name, restore_positions=None):
+    """Return new game of type name, set up from restore_positions if passed, otherwise
+       copied from the starting position template of Game.new.
+    """
+    if restore_positions is None:
+        return game_class(name).new()
+    return game_class(name)(restore_positions=restore_positions)
@@ -1,9 +1,7 @@
 """Contains Chess class."""
-from copy import deepcopy
-
 from src.game_enums import ChessPiece, Color, Direction
 from src.game_errors import IllegalMoveError
-from src.games.game import Coords, Game, move_direction, NEXT_ADJACENT_COORD, TWO_COORD_ERR_MSG
+from src.games.game import Coords, Game, move_direction, TWO_COORD_ERR_MSG
 
 from src.game_pieces.bishop import Bishop
 from src.game_pieces.king import King
@@ -24,6 +22,7 @@ class Chess(Game):
     OWN_PIECE_ATTACK = 'Cannot attack own piece'
     PIECE_BLOCKING = 'Piece blocking attempted move'
     CASTLE_IN_CHECK = 'Cannot castle out of, through or into check'
+    JOURNAL_ATTRS = Game.JOURNAL_ATTRS + ('last_move_pawn',)
 
 
     def __init__(self, restore_positions=None):
@@ -41,18 +40,62 @@ class Chess(Game):
 
         self.last_move_pawn = None  # Used for checking legality of en passant attempt
 
+    def _repoint_piece(self, piece, owned_piece):
+        super()._repoint_piece(piece, owned_piece)
+        if self.last_move_pawn is piece:
+            self.last_move_pawn = owned_piece
+
+    def _rebind_pieces(self):
+        super()._rebind_pieces()
+        self.last_move_pawn = self._board_piece(self.last_move_pawn)
+
+    def _candidate_moves(self):
+        return ((piece.coords, coords)
+                for piece in list(self.current_board_pieces()) if piece.color == self.playing_color
+                for coords in self.geometry.coords
+                if piece.legal_move(coords) or piece.legal_capture(coords))
+
+    def _no_legal_moves_result(self):
+        # Checkmate is a loss, stalemate a draw
+        king = self._king(self.playing_color)
+        return -1 if self._king_in_check(self.playing_color, king.coords) else 0
+
+    def _move_state(self):
+        en_passant_coords = self.last_move_pawn.coords if self.last_move_pawn else None
+        return super()._move_state() + (en_passant_coords and tuple(en_passant_coords),)
+
+    def _load_move_state(self, move_state):
+        *game_state, en_passant_coords = move_state
+        super()._load_move_state(game_state)
+        if en_passant_coords:
+            x_coord, y_coord = en_passant_coords
+            self.last_move_pawn = self.board[x_coord][y_coord]
+        else:
+            self.last_move_pawn = None
+
+    def _position_key(self):
+        # Pawn that can be taken en passant is part of the position
+        en_passant_coords = self.last_move_pawn.coords if self.last_move_pawn else None
+        return super()._position_key() + (en_passant_coords,)
+
     def make_move(self):
-        self._raise_errors_if_chess_specific_illegal_move()
+        error = self._rule_error()
+        if error:
+            raise IllegalMoveError(error)
 
-        make_move, legal_move, error_message = self._move_type()
+        make_move, _, _ = self._move_type()
+        make_move()
+        if self._check_mate():
+            self.winner = self.playing_color.value
+        self.switch_players()
 
-        if legal_move(self.to_coords):
-            make_move()
-            if self._check_mate():
-                self.winner = self.playing_color.value
-            self.switch_players()
-        else:
-            raise IllegalMoveError(error_message)
+    def _rule_error(self):
+        error = self._chess_specific_error()
+        if error:
+            return error
+
+        _, legal_move, error_message = self._move_type()
+        return None if legal_move(self.to_coords) else error_message
 
     def _move_type(self):
         if self._castle_move():
@@ -60,6 +103,10 @@ class Chess(Game):
                     self._legal_castle,
                     self.ILLEGAL_CASTLE)
         if self._prawn_promotion():
+            if self._capture_move():
+                return (self._promote_pawn,
+                        self.playing_piece.legal_capture,
+                        self.ILLEGAL_CAPTURE)
             return (self._promote_pawn,
                     self.playing_piece.legal_move,
                     self.ILLEGAL_MOVE)
@@ -84,12 +131,10 @@ class Chess(Game):
         return False
 
     def _promote_pawn(self):
-        self.board[self.from_coords.x][self.from_coords.y] = None
+        self._set_square(self.from_coords, None)
         # Defaults to Queen as most players want this
         # TODO Add functionality to choose promotion piece
-        promoted_piece = Queen(self.playing_color)
-        promoted_piece.coords = self.to_coords
-        self.board[self.to_coords.x][self.to_coords.y] = promoted_piece
+        self.add(Queen(self.playing_color), self.to_coords)
 
     def _move(self):
         self._move_piece_and_update_coords()
@@ -99,28 +144,29 @@ class Chess(Game):
         else:
             self.last_move_pawn = None
 
-        if self.playing_piece in [King(self.playing_color), Rook(self.playing_color)]:
-            self.playing_piece.moved = True
+        if self.playing_piece in (King.of(self.playing_color), Rook.of(self.playing_color)):
+            self._set_piece_attribute(self.playing_piece, 'moved', True)
 
-    def _raise_errors_if_chess_specific_illegal_move(self):
+    def _chess_specific_error(self):
         captured_piece = self.board[self.to_coords.x][self.to_coords.y]
 
         if captured_piece and captured_piece.color == self.playing_color:
-            raise IllegalMoveError(self.OWN_PIECE_ATTACK)
+            return self.OWN_PIECE_ATTACK
 
         if self._piece_blocking(self.from_coords, self.to_coords):
-            raise IllegalMoveError(self.PIECE_BLOCKING)
+            return self.PIECE_BLOCKING
 
         if self._own_king_in_check():
             if self._castle_move():
-                raise IllegalMoveError(self.CASTLE_IN_CHECK)
-            raise IllegalMoveError(self.KING_IN_CHECK)
+                return self.CASTLE_IN_CHECK
+            return self.KING_IN_CHECK
+        return None
 
     def _pawn_two_space_first_move(self):
-        if (self.playing_piece == Pawn(Color.WHITE)
+        if (self.playing_piece == Pawn.of(Color.WHITE)
                 and self.from_coords.y == 1 and self.to_coords.y == 3):
             return True
-        if (self.playing_piece == Pawn(Color.BLACK)
+        if (self.playing_piece == Pawn.of(Color.BLACK)
                 and self.from_coords.y == 6 and self.to_coords.y == 4):
             return True
         return False
@@ -128,16 +174,16 @@ class Chess(Game):
     def _capture_en_passant(self):
         coords = self.last_move_pawn.coords
         captured_piece = self.board[coords.x][coords.y]
-        captured_piece.coords = None
-        self.board[coords.x][coords.y] = None
+        self._set_square(coords, None)
+        self._set_piece_attribute(captured_piece, 'coords', None)
         self._move()
 
     def _castle_move(self):
-        if self.playing_piece == King(Color.WHITE):
+        if self.playing_piece == King.of(Color.WHITE):
             if (self.from_coords == Coords(4, 0)
                     and self.to_coords in (Coords(2, 0), Coords(6, 0))):
                 return True
-        if self.playing_piece == King(Color.BLACK):
+        if self.playing_piece == King.of(Color.BLACK):
             if (self.from_coords == Coords(4, 7)
                     and self.to_coords in (Coords(2, 7), Coords(6, 7))):
                 return True
@@ -172,8 +218,8 @@ class Chess(Game):
         return self._black_castle_king_side
 
     def _prawn_promotion(self):
-        return (self.playing_piece == Pawn(Color.WHITE) and self._black_king_row()
-                or self.playing_piece == Pawn(Color.BLACK) and self._white_king_row())
+        return (self.playing_piece == Pawn.of(Color.WHITE) and self._black_king_row()
+                or self.playing_piece == Pawn.of(Color.BLACK) and self._white_king_row())
 
     def _legal_castle(self, to_coords=None):
         playing_color = self.playing_color
@@ -204,7 +250,7 @@ class Chess(Game):
 
     def _king(self, wanted_color):
         for piece in self.current_board_pieces():
-            if piece == King(wanted_color):
+            if piece == King.of(wanted_color):
                 return piece
 
     def _king_moved(self, playing_color):
@@ -224,46 +270,40 @@ class Chess(Game):
             if self._queen_side():
                 piece = self.board[0][7]
 
-        return piece and piece == Rook(playing_color) and piece.moved
+        # No rook of playing color on its start square means it has moved or been taken
+        return piece != Rook.of(playing_color) or piece.moved
 
     def _legal_en_passant(self, to_coords):
         if not self.last_move_pawn:
             return False
-        if self.playing_piece == Pawn(Color.WHITE) and to_coords.y == 5:
+        if self.playing_piece == Pawn.of(Color.WHITE) and to_coords.y == 5:
             return Coords(to_coords.x, to_coords.y - 1) == self.last_move_pawn.coords
-        if self.playing_piece == Pawn(Color.BLACK) and to_coords.y == 2:
+        if self.playing_piece == Pawn.of(Color.BLACK) and to_coords.y == 2:
             return Coords(to_coords.x, to_coords.y + 1) == self.last_move_pawn.coords
         return False
 
     def _white_castle_king_side(self):
-        king, rook = self.board[4][0], self.board[7][0]
-        self.board[4][0], self.board[7][0] = None, None
-        self.board[6][0], self.board[5][0] = king, rook
-        king.moved, rook.moved = True, True
+        self._castle(self.board[4][0], Coords(6, 0), self.board[7][0], Coords(5, 0))
 
     def _white_castle_queen_side(self):
-        king, rook = self.board[4][0], self.board[0][0]
-        self.board[4][0], self.board[0][0] = None, None
-        self.board[2][0], self.board[3][0] = king, rook
-        king.moved, rook.moved = True, True
+        self._castle(self.board[4][0], Coords(2, 0), self.board[0][0], Coords(3, 0))
 
     def _black_castle_king_side(self):
-        king, rook = self.board[4][7], self.board[7][7]
-        self.board[4][7], self.board[7][7] = None, None
-        self.board[6][7], self.board[5][7] = king, rook
-        king.moved, rook.moved = True, True
+        self._castle(self.board[4][7], Coords(6, 7), self.board[7][7], Coords(5, 7))
 
     def _black_castle_queen_side(self):
-        king, rook = self.board[4][7], self.board[0][7]
-        self.board[4][7], self.board[0][7] = None, None
-        self.board[2][7], self.board[3][7] = king, rook
-        king.moved, rook.moved = True, True
+        self._castle(self.board[4][7], Coords(2, 7), self.board[0][7], Coords(3, 7))
+
+    def _castle(self, king, king_to_coords, rook, rook_to_coords):
+        for piece, to_coords in ((king, king_to_coords), (rook, rook_to_coords)):
+            self._move_piece_to(piece, to_coords)
+            self._set_piece_attribute(piece, 'moved', True)
 
     def _capture_move(self):
         return self.board[self.to_coords.x][self.to_coords.y] is not None
 
     def _en_passant(self):
-        if (self.playing_piece == Pawn(self.playing_color)
+        if (self.playing_piece == Pawn.of(self.playing_color)
                 and self.playing_piece.legal_capture(self.to_coords)
                 and self.board[self.to_coords.x][self.to_coords.y] is None
                 and self._potential_en_passant_capture_piece()):
@@ -272,20 +312,24 @@ class Chess(Game):
 
     def _potential_en_passant_capture_piece(self):
         y_coord = self.to_coords.y - 1 if self.playing_color == Color.WHITE else self.to_coords.y + 1
-        if self.board[self.to_coords.x][y_coord] == Pawn(self.opponent_color):
+        if self.board[self.to_coords.x][y_coord] == Pawn.of(self.opponent_color):
             return True
         return False
 
     def _own_king_in_check(self):
         """Check if move will put/keep current player king in check. Return bool."""
-        cloned_game = deepcopy(self)
-        cloned_game.board[self.from_coords.x][self.from_coords.y] = None
-        cloned_game.board[self.to_coords.x][self.to_coords.y] = self.playing_piece
+        # Try the move on this board and take it back, rather than copying the game
+        outer_changes = self._start_changes()
+        try:
+            self._set_square(self.from_coords, None)
+            self._set_square(self.to_coords, self.playing_piece)
 
-        king = cloned_game._king(self.playing_color)
-        king_coords = self.to_coords if king == self.playing_piece else king.coords
+            king = self._king(self.playing_color)
+            king_coords = self.to_coords if king == self.playing_piece else king.coords
 
-        return cloned_game._king_in_check(self.playing_color, king_coords)
+            return self._king_in_check(self.playing_color, king_coords)
+        finally:
+            self._undo_changes(outer_changes)
 
     def _check_mate(self):
         king = self._king(self.opponent_color)
@@ -332,19 +376,14 @@ class Chess(Game):
         return False
 
     def _board_pieces(self, color, king_wanted=True):
-        king = None if king_wanted else King(color)
+        king = None if king_wanted else King.of(color)
 
         return [piece for piece in self.current_board_pieces()
                 if piece.color == color and piece != king]
 
     def _adjacent_empty_square_coords(self, king_coords):
-        potential_coords = [adjacent_coord(king_coords)
-                            for adjacent_coord
-                            in NEXT_ADJACENT_COORD.values()]
-
-        return [coords for coords in potential_coords
-                if self.coords_on_board(coords)
-                and self.board[coords.x][coords.y] is None]
+        return [coords for coords in self.geometry.neighbours[king_coords]
+                if self.board[coords.x][coords.y] is None]
 
     @staticmethod
     def _new_board_setup():
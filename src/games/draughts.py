@@ -2,7 +2,7 @@
 from itertools import cycle, product
 
 from src.game_enums import Color
-from src.games.game import Game, NEXT_ADJACENT_COORD, TWO_COORD_ERR_MSG
+from src.games.game import Game, TWO_COORD_ERR_MSG
 from src.game_pieces.draughts_counter import Counter
 from src.game_errors import IllegalMoveError
 
@@ -29,23 +29,60 @@ class Draughts(Game):
         super().__init__(DRAUGHTS_SETUP, restore_positions)
 
     def make_move(self):
-        if self.playing_piece.legal_move(self.to_coords) and not self._potential_capture():
+        error = self._rule_error()
+        if error:
+            raise IllegalMoveError(error)
+
+        if self.playing_piece.legal_move(self.to_coords):
             self._move_piece()
-        elif self.playing_piece.legal_capture(self.to_coords):
-            capture_coords = self._collect_capture_coords()
-            self._capture_pieces(capture_coords)
+        else:
+            self._capture_pieces(self._collect_capture_coords())
             self._force_capture_if_extra_captures_possible()
             self._move_piece()
-        else:
-            raise IllegalMoveError(self.ILLEGAL_MOVE)
 
         self.switch_players()
 
+    def _rule_error(self):
+        if self.board[self.to_coords.x][self.to_coords.y]:
+            return self.SQUARE_TAKEN
+
+        if self.playing_piece.legal_move(self.to_coords):
+            if self._potential_capture():
+                return self.CAPTURE_POSSIBLE
+        elif self.playing_piece.legal_capture(self.to_coords):
+            if not self._collect_capture_coords():
+                return self.ILLEGAL_CAPTURE
+        else:
+            return self.ILLEGAL_MOVE
+        return None
+
+    def _candidate_moves(self):
+        candidates = []
+        for piece in self._playing_pieces():
+            adjacent_coords = (self.geometry.adjacent[direction].get(piece.coords)
+                               for direction in piece.legal_move_directions())
+            candidates.extend((piece.coords, coords) for coords in adjacent_coords if coords)
+            candidates.extend((piece.coords, coords) for coords in self._jump_coords(piece))
+        return candidates
+
+    def _jump_coords(self, piece):
+        """Return set of squares piece can reach by a run of up to MAX_CAPTURE_MOVE_COUNT jumps."""
+        reached, from_coords = set(), {piece.coords}
+        for _ in range(self.MAX_CAPTURE_MOVE_COUNT):
+            from_coords = {to_coords
+                           for coords in from_coords
+                           for to_coords in (self._capture_coords(direction, coords)
+                                             for direction in piece.legal_move_directions())
+                           if to_coords and to_coords not in reached}
+            reached |= from_coords
+        reached.discard(piece.coords)
+        return reached
+
     def _move_piece(self):
         self._move_piece_and_update_coords()
 
         if self._king_row_reached():
-            self.playing_piece.crowned = True
+            self._set_piece_attribute(self.playing_piece, 'crowned', True)
 
     def _capture_pieces(self, capture_coords):
         from_coords, to_coords = capture_coords[:-1], capture_coords[1:]
@@ -55,7 +92,7 @@ class Draughts(Game):
     def _capture(self, capture_coords):
         captured_piece_coords = (coords for idx, coords in enumerate(capture_coords) if idx % 2 == 0)
         for coords in captured_piece_coords:
-            self.board[coords.x][coords.y] = None
+            self._set_square(coords, None)
 
     def _capture_move_count(self):
         if self.playing_piece.crowned:
@@ -63,6 +100,9 @@ class Draughts(Game):
         return int(abs(self.from_coords.y - self.to_coords.y) / 2)
 
     def _collect_capture_coords(self):
+        """Return tuple of coords jumped to from from_coords to to_coords, or None if
+           there is no capture route.
+        """
         capture_coords = []
         direction_combinations = product(self.playing_piece.legal_move_directions(),
                                          repeat=self._capture_move_count())
@@ -76,7 +116,7 @@ class Draughts(Game):
                 if self._move_route_found(capture_coords):
                     return (self.from_coords, *capture_coords)
             capture_coords = []
-        raise IllegalMoveError(self.ILLEGAL_CAPTURE)
+        return None
 
     def _move_route_found(self, capture_coords):
         return capture_coords[-1] == self.to_coords
@@ -87,11 +127,9 @@ class Draughts(Game):
         return self.playing_piece.coords.y == 0
 
     def _potential_capture(self):
-        for piece in self._playing_pieces():
-            for direction in piece.legal_move_directions():
-                if self._capture_coords(direction, piece.coords):
-                    raise IllegalMoveError(self.CAPTURE_POSSIBLE)
-        return False
+        return any(self._capture_coords(direction, piece.coords)
+                   for piece in self._playing_pieces()
+                   for direction in piece.legal_move_directions())
 
     def _playing_pieces(self):
         return [piece for piece in self.current_board_pieces()
@@ -109,17 +147,17 @@ class Draughts(Game):
             from_coords = to_coords if to_coords else None
 
     def _capture_coords(self, direction, from_coords):
-        capture_coords = NEXT_ADJACENT_COORD[direction](from_coords)
-        to_coords = NEXT_ADJACENT_COORD[direction](capture_coords)
+        adjacent = self.geometry.adjacent[direction]
+        capture_coords = adjacent.get(from_coords)
+        to_coords = adjacent.get(capture_coords)
 
-        for coords in (capture_coords, to_coords):
-            if not self.coords_on_board(coords):
-                return None
+        if to_coords is None:
+            return None
 
         capture_square = self.board[capture_coords.x][capture_coords.y]
         move_to_square = self.board[to_coords.x][to_coords.y]
 
-        if capture_square == Counter(self.opponent_color) and move_to_square is None:
+        if capture_square == Counter.of(self.opponent_color) and move_to_square is None:
             return to_coords
         return None
 
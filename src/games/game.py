@@ -3,9 +3,12 @@
    Functions:
         move_direction:   return move Direction enum type
         adjacent_squares: return bool
+        board_geometry:   return shared BoardGeometry for board size
 """
 from abc import ABC, abstractmethod
 from collections import namedtuple
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
 import pickle
 
@@ -13,6 +16,7 @@ from tabulate import tabulate
 
 from src.game_enums import Color, Direction
 from src.game_errors import IllegalMoveError, NotOnBoardError
+from src.game_pieces.game_piece import decode_piece, FLAG_BIT, GamePiece
 
 
 ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
@@ -22,6 +26,10 @@ TWO_COORD_ERR_MSG = 'Invalid coords, coords seperated by white space. Example us
 
 Coords = namedtuple('Coords', 'x y')
 BoardSquare = namedtuple('BoardSquare', 'id image')
+# Move journal entries. A move's changes are undone in reverse order and redone in order.
+SquareChange = namedtuple('SquareChange', 'coords old new')
+PieceChange = namedtuple('PieceChange', 'piece attribute old new')
+MoveRecord = namedtuple('MoveRecord', 'changes state_before state_after redoable')
 
 
 class Game(ABC):
@@ -30,13 +38,28 @@ class Game(ABC):
        Methods:
             add
             move
+            undo
+            redo
+            legal_moves
+            apply
+            is_terminal
+            result
+            winner_color
+            hash
+            copy
+            compact
+            expand
+            board_codes
+            load_board_codes
             coords_on_board
             coords_between
             switch_players
             opponenet_color
             x_axis
             y_axis
+            legal_square_ids
             display_board
+            changed_squares
             display_board_to_terminal
             gui_display_board
             save_game
@@ -49,15 +72,32 @@ class Game(ABC):
     NO_PIECE = 'No piece found at from coordinates'
     WRONG_COLOR = 'Incorrect piece color for current player'
     SQUARE_TAKEN = 'Piece already found at coordinates'
+    NOTHING_TO_UNDO = 'No move to undo'
+    NOTHING_TO_REDO = 'No move to redo'
+    # Game attributes saved before and after each move, restored by undo and redo
+    JOURNAL_ATTRS = ('playing_color', 'winner')
 
     def __init__(self, setup, restore_positions):
         self.board = setup['board']
         self.board_width = len(self.board[0])
         self.board_height = len(self.board)
+        self.geometry = board_geometry(self.board_width, self.board_height)
+        # Move journal, see undo and redo
+        self._history = []
+        self._undone = []
+        self._changes = None
+        self._legal_moves_cache = None
+        # Copy on write state, see copy
+        self._shared = False
+        self._owned_columns = set()
+        self._owned_pieces = {}
+        self._replaced_pieces = {}
         self.board_colors = setup['board_colors']
         self.legal_piece_names = setup['legal_piece_names']
         self.legal_piece_colors = setup['legal_piece_colors']
         self.input_error_msg = setup['input_err_msg']
+        # Changed whenever the board does, for displays to tell if they are up to date
+        self.board_version = 0
         self._setup_game(restore_positions)
         # Move attributes
         self.playing_color = setup['start_color']
@@ -78,6 +118,42 @@ class Game(ABC):
             return (self.board, self.playing_color) == (other.board, other.playing_color)
         return NotImplemented
 
+    def __getstate__(self):
+        # Pickled as board codes and the state they don't hold. Setup constants are rebuilt
+        # on load, undo history and copy on write bookkeeping are left out.
+        return bytes(self.board_codes()), self._move_state()
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # Game pickled whole, before games were pickled as board codes. Only its position
+            # and move state are kept, attributes added since come from a new game.
+            old_game = self.__class__.__new__(self.__class__)
+            old_game.__dict__.update(state, board_version=0)
+            state = bytes(old_game.board_codes()), old_game._move_state()
+        codes, move_state = state
+        self.__dict__.update(self.new().__dict__)
+        self.load_board_codes(codes)
+        self._load_move_state(move_state)
+
+    def __copy__(self):
+        # Shallow copy for copy(), rather than the board codes kept by __getstate__
+        cloned_game = self.__class__.__new__(self.__class__)
+        cloned_game.__dict__.update(self.__dict__)
+        return cloned_game
+
+    def _move_state(self):
+        """Return tuple of game state not held in board codes, loaded by _load_move_state."""
+        return self.playing_color, self.winner, self.board_version
+
+    def _load_move_state(self, move_state):
+        self.playing_color, self.winner, self.board_version = move_state
+
+    def __hash__(self):
+        # Piece equality ignores flags such as King.moved, so hash must too. Hash changes as
+        # moves are made, so don't keep a game in a set or dict key while playing it.
+        codes = bytes(code & ~FLAG_BIT for code in self.board_codes())
+        return hash((codes, self.playing_color))
+
     @abstractmethod
     def make_move(self):
         """Move piece from coordinates, to coordianates. Remove captured piece, if any.
@@ -89,6 +165,14 @@ class Game(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def _rule_error(self):
+        """Return message of IllegalMoveError make_move would raise for the current move
+           attributes, or None if the move is legal. Game is left unchanged, so legal_moves
+           and validate_many can check moves without making them.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def _new_board_setup(self):
         """Return dictionary of new game default piece start postitions and pieces.
@@ -100,6 +184,16 @@ class Game(ABC):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def new(cls):
+        """Return new game at the starting position. Games are copied from a template game
+           built and validated once per game type, rather than set up piece by piece.
+        """
+        template = _TEMPLATES.get(cls)
+        if template is None:
+            template = _TEMPLATES[cls] = cls()
+        return template.copy()
+
     def _setup_game(self, restore_positions):
         """Setup board for new or previously stored game."""
         game_positions = self._new_board_setup() if restore_positions is None else restore_positions
@@ -107,8 +201,7 @@ class Game(ABC):
         for coords, piece in game_positions.items():
             assert piece.color in self.legal_piece_colors
             assert piece.name in self.legal_piece_names
-            coords = Coords(x=int(coords[0]), y=int(coords[1]))
-            self.add(piece, coords)
+            self.add(piece, self._coords_from(coords))
 
     def move(self, from_coords=None, to_coords=None):
         """Move piece from coordinates, to coordianates. Remove captured piece, if any.
@@ -122,13 +215,282 @@ class Game(ABC):
         to_coords = self._coords_from(to_coords)
         if from_coords:
             from_coords = self._coords_from(from_coords)
+        self._journaled_move(from_coords, to_coords, redoable=True)
+        self._undone = []
+
+    def apply(self, move):
+        """Make move, a (from_coords, to_coords) tuple as given by legal_moves, for game tree
+           search. Take it back with undo. Unlike move, moves waiting to be redone are kept
+           and the move can't be redone once undone.
+           Raises:
+                IllegalMoveError
+        """
+        from_coords, to_coords = move
+        self._journaled_move(from_coords, to_coords, redoable=False)
+
+    def _journaled_move(self, from_coords, to_coords, redoable):
         self._set_current_move_attributes_or_raise_errors(from_coords, to_coords)
-        self.make_move()
 
-    @staticmethod
-    def _coords_from(input_coords):
+        state_before = self._journal_state()
+        self._start_changes()
+        try:
+            self.make_move()
+        except Exception:
+            self._undo_changes(None)
+            self._restore_journal_state(state_before)
+            raise
+        changes, self._changes = self._changes, None
+        self.board_version += 1
+        self._history.append(MoveRecord(changes, state_before, self._journal_state(), redoable))
+
+    def undo(self):
+        """Take back last move, restoring board, pieces and game state as they were before it.
+           Raises:
+                IllegalMoveError
+        """
+        if not self._history:
+            raise IllegalMoveError(self.NOTHING_TO_UNDO)
+
+        record = self._history.pop()
+        self._revert(record.changes)
+        self._restore_journal_state(record.state_before)
+        self.board_version += 1
+        if record.redoable:
+            self._undone.append(record)
+
+    def redo(self):
+        """Make last undone move again. Moves can be redone until a new move is made.
+           Raises:
+                IllegalMoveError
+        """
+        if not self._undone:
+            raise IllegalMoveError(self.NOTHING_TO_REDO)
+
+        record = self._undone.pop()
+        self._own_changed_pieces(record.changes)
+        for change in record.changes:
+            self._apply(change, change.new)
+        self._restore_journal_state(record.state_after)
+        self.board_version += 1
+        self._history.append(record)
+
+    def legal_moves(self):
+        """Return list of (from_coords, to_coords) moves the playing color can make, with
+           from_coords None in games where pieces are placed. Empty once the game is won.
+        """
+        if self.winner is not None:
+            return []
+
+        position_key = self._position_key()
+        if self._legal_moves_cache is None or self._legal_moves_cache[0] != position_key:
+            legal_moves = tuple(move for move in self._candidate_moves() if self._legality_error(move) is None)
+            self._legal_moves_cache = (position_key, legal_moves)
+        return list(self._legal_moves_cache[1])
+
+    def _candidate_moves(self):
+        """Return iterable of moves that might be legal, each checked by legal_moves.
+           Games override this to narrow the candidates down.
+        """
+        return ((piece.coords, coords)
+                for piece in list(self.current_board_pieces()) if piece.color == self.playing_color
+                for coords in self.geometry.coords)
+
+    def _legality_error(self, move):
+        """Return message of IllegalMoveError making move would raise, or None if it is legal.
+           Rules are checked without making the move. Move attributes are left as they were.
+        """
+        move_attributes = self.from_coords, self.to_coords, self.playing_piece
+        try:
+            return self._set_current_move_attributes(*move) or self._rule_error()
+        finally:
+            self.from_coords, self.to_coords, self.playing_piece = move_attributes
+
+    def is_legal(self, from_coords=None, to_coords=None):
+        """Return True if move, with args as for move, is legal for the playing color.
+           Game is left unchanged and no error is raised.
+        """
+        return self.move_error(from_coords, to_coords) is None
+
+    def move_error(self, from_coords=None, to_coords=None):
+        """Return message of IllegalMoveError move, with args as for move, would raise, or
+           None if the move is legal. Game is left unchanged and no error is raised.
+        """
+        return self._move_errors([(from_coords, to_coords)])[0]
+
+    def validate_many(self, moves):
+        """Return list with move_error result for each (from_coords, to_coords) in moves.
+           Game is left unchanged and no error is raised.
+        """
+        return self._move_errors(moves)
+
+    def _move_errors(self, moves):
+        # Moves found by legal_moves for this position need no checks
+        cache = self._legal_moves_cache
+        known_legal = cache[1] if cache and cache[0] == self._position_key() else ()
+
+        errors = []
+        for from_input, to_input in moves:
+            move = (self._board_coords(from_input) if from_input else None,
+                    self._board_coords(to_input))
+            if move[1] is None or from_input and move[0] is None:
+                errors.append(self.input_error_msg)
+            elif move[0] is None and self.input_error_msg == TWO_COORD_ERR_MSG:
+                errors.append(self.input_error_msg)
+            elif move in known_legal:
+                errors.append(None)
+            else:
+                errors.append(self._legality_error(move))
+        return errors
+
+    def _board_coords(self, input_coords):
+        """Return Coords for input_coords, as taken by move, or None if not a board square."""
+        try:
+            coords = self._coords_from(input_coords)
+        except (TypeError, ValueError):
+            return None
+        return coords if self.coords_on_board(coords) else None
+
+    def is_terminal(self):
+        """Return True if game is won, drawn or the playing color has no legal move."""
+        return self.winner is not None or not self.legal_moves()
+
+    def result(self):
+        """Return 1 if playing color has won, -1 if it has lost, otherwise 0."""
+        if self.winner is None:
+            return 0 if self.legal_moves() else self._no_legal_moves_result()
+        winner = self.winner_color()
+        if winner == Color.NONE:
+            return 0
+        return 1 if winner == self.playing_color else -1
+
+    def winner_color(self):
+        """Return declared winner as Color, Color.NONE for a draw, None if there is none yet."""
+        # Chess declares winners as the color value, Othello as Color
+        return None if self.winner is None else Color(self.winner)
+
+    def _no_legal_moves_result(self):
+        """Return result for playing color when it can't move and no winner is declared."""
+        return -1
+
+    def hash(self):
+        """Return hash of position for search transposition tables. Unlike hash(game), this
+           tells apart positions whose pieces differ only in flags such as King.moved.
+        """
+        return hash(self._position_key())
+
+    def _position_key(self):
+        return bytes(self.board_codes()), self.playing_color
+
+    def _journal_state(self):
+        # Copy dicts and lists, such as Othello bitboards, as moves update them in place
+        return tuple(_copy_if_mutable(getattr(self, attr)) for attr in self.JOURNAL_ATTRS)
+
+    def _restore_journal_state(self, state):
+        for attr, value in zip(self.JOURNAL_ATTRS, state):
+            if isinstance(value, GamePiece):
+                value = self._current_piece(value)
+            setattr(self, attr, _copy_if_mutable(value))
+
+    def _start_changes(self):
+        """Start recording board and piece changes. Return changes being recorded before,
+           for _undo_changes to carry on with.
+        """
+        outer_changes, self._changes = self._changes, []
+        return outer_changes
+
+    def _undo_changes(self, outer_changes):
+        """Revert changes recorded since _start_changes and go back to outer_changes."""
+        changes, self._changes = self._changes, outer_changes
+        self._revert(changes)
+
+    def _revert(self, changes):
+        self._own_changed_pieces(changes)
+        for change in reversed(changes):
+            self._apply(change, change.old)
+
+    def _own_changed_pieces(self, changes):
+        # Replace shared pieces before replaying changes, while they are still on their coords
+        if self._shared:
+            for change in changes:
+                if isinstance(change, PieceChange):
+                    self._writable_piece(change.piece)
+
+    def _apply(self, change, value):
+        if isinstance(change, SquareChange):
+            self._writable_column(change.coords.x)[change.coords.y] = self._current_piece(value)
+        else:
+            piece = self._writable_piece(change.piece)
+            setattr(piece, change.attribute, value)
+            if isinstance(self.board, CodeBoard):
+                self.board.update(piece)
+
+    def _set_square(self, coords, piece):
+        """Put piece, or None, on board at coords. Recorded if a move is being made."""
+        column = self._writable_column(coords.x)
+        if self._changes is not None:
+            self._changes.append(SquareChange(coords, column[coords.y], piece))
+        column[coords.y] = piece
+
+    def _set_piece_attribute(self, piece, attribute, value):
+        """Set piece attribute, e.g. coords or moved. Recorded if a move is being made."""
+        piece = self._writable_piece(piece)
+        if self._changes is not None:
+            self._changes.append(PieceChange(piece, attribute, getattr(piece, attribute), value))
+        setattr(piece, attribute, value)
+        if isinstance(self.board, CodeBoard):
+            self.board.update(piece)
+
+    def _writable_column(self, x_idx):
+        """Return board column x_idx, first copying it if it is shared with another game."""
+        if self._shared and x_idx not in self._owned_columns:
+            self.board[x_idx] = list(self.board[x_idx])
+            self._owned_columns.add(x_idx)
+        return self.board[x_idx]
+
+    def _writable_piece(self, piece):
+        """Return piece, or the copy of it that replaces it on this board if it is shared
+           with another game.
+        """
+        if not self._shared:
+            return piece
+        piece = self._current_piece(piece)
+        # Keyed on id as pieces aren't hashable. Values are checked, as ids can be reused.
+        if self._owned_pieces.get(id(piece)) is piece:
+            return piece
+
+        owned_piece = copy(piece)
+        self._owned_pieces[id(owned_piece)] = owned_piece
+        self._replaced_pieces[id(piece)] = (piece, owned_piece)
+        if piece.coords is not None and self.board[piece.coords.x][piece.coords.y] is piece:
+            self._writable_column(piece.coords.x)[piece.coords.y] = owned_piece
+        self._repoint_piece(piece, owned_piece)
+        return owned_piece
+
+    def _current_piece(self, piece):
+        """Return piece that stands for piece on this board, which is piece unless
+           _writable_piece replaced it. The journal still refers to replaced pieces.
+        """
+        while self._replaced_pieces:
+            replaced = self._replaced_pieces.get(id(piece))
+            if replaced is None or replaced[0] is not piece:
+                break
+            piece = replaced[1]
+        return piece
+
+    def _repoint_piece(self, piece, owned_piece):
+        """Called when owned_piece replaces piece. Games repoint their piece references here."""
+        if self.playing_piece is piece:
+            self.playing_piece = owned_piece
+
+    def _own_piece(self, piece):
+        """Mark new piece, not yet shared with any game, as safe to change in place."""
+        if self._shared:
+            self._owned_pieces[id(piece)] = piece
+
+    def _coords_from(self, input_coords):
         x_coord, y_coord = input_coords
-        return Coords(int(x_coord), int(y_coord))
+        coords = Coords(int(x_coord), int(y_coord))
+        return self.geometry.squares.get(coords, coords)
 
     @classmethod
     def restore(cls, file_name):
@@ -150,6 +512,98 @@ class Game(ABC):
         with open(file_path, 'wb') as to_file:
             pickle.dump(self, to_file)
 
+    def copy(self):
+        """Return independent copy of game in constant time.
+
+           Copy and original share board columns and pieces. After copying, each game
+           copies a column or piece the first time it changes it, so their memory grows
+           with moves made rather than board size. Games stored as a CodeBoard, see compact,
+           copy the codes instead and materialise their own pieces.
+        """
+        cloned_game = copy(self)
+        if isinstance(self.board, CodeBoard):
+            cloned_game.board = self.board.copy()
+            cloned_game._after_copy()
+            cloned_game._rebind_pieces()
+            return cloned_game
+
+        cloned_game.board = list(self.board)
+        for game in (self, cloned_game):
+            game._shared = True
+            game._owned_columns = set()
+            game._owned_pieces = {}
+        cloned_game._after_copy()
+        return cloned_game
+
+    def compact(self):
+        """Store board as piece codes, a CodeBoard, rather than lists of pieces. Pieces are
+           dropped until rules read them again, so a game kept between moves holds a byte per
+           square. Clears undo history, which refers to the dropped pieces.
+        """
+        self.board = CodeBoard(self.geometry, self.board_codes())
+        self._history, self._undone = [], []
+        self._shared = False
+        self._owned_columns, self._owned_pieces, self._replaced_pieces = set(), {}, {}
+        self._rebind_pieces()
+
+    def expand(self):
+        """Store a compact board as lists of pieces again, materialising every piece. Rules
+           run faster on lists than on a CodeBoard.
+        """
+        if isinstance(self.board, CodeBoard):
+            self.board = [list(column) for column in self.board]
+
+    def _rebind_pieces(self):
+        """Called when board pieces were replaced by ones materialised from codes. Games point
+           their piece references at the pieces now on the board here.
+        """
+        self.playing_piece = self._board_piece(self.playing_piece)
+
+    def _board_piece(self, piece):
+        """Return piece now on board in place of piece, None if piece is None or off the board."""
+        if piece is None or piece.coords is None:
+            return None
+        board_piece = self.board[piece.coords.x][piece.coords.y]
+        return board_piece if board_piece == piece else None
+
+    def _after_copy(self):
+        """Called on a new copy. Games copy their other mutable attributes here."""
+        # Journal is only undone in the game that made the moves
+        self._history, self._undone, self._changes = [], [], None
+        self._legal_moves_cache = None
+        self._replaced_pieces = {}
+
+    def board_codes(self):
+        """Return bytearray of GamePiece.encode codes, 0 for empty, indexed by y * width + x."""
+        if isinstance(self.board, CodeBoard):
+            return bytearray(self.board.codes)
+        codes = bytearray(self.board_width * self.board_height)
+        for x_idx, column in enumerate(self.board):
+            for y_idx, piece in enumerate(column):
+                if piece:
+                    codes[y_idx * self.board_width + x_idx] = piece.encode()
+        return codes
+
+    def load_board_codes(self, codes):
+        """Replace board with new pieces materialised from board_codes output, or with the
+           codes themselves if the board is a CodeBoard. Clears undo history, which refers to
+           the replaced pieces.
+        """
+        if isinstance(self.board, CodeBoard):
+            self.board = CodeBoard(self.geometry, codes)
+        else:
+            self.board = [[None] * self.board_height for _ in range(self.board_width)]
+            for square, code in enumerate(codes):
+                if code:
+                    coords = self.geometry.coords[square]
+                    piece = decode_piece(code)
+                    piece.coords = coords
+                    self.board[coords.x][coords.y] = piece
+        self._history, self._undone = [], []
+        self.board_version += 1
+        self._shared = False
+        self._owned_columns, self._owned_pieces, self._replaced_pieces = set(), {}, {}
+
     def add(self, piece, coords):
         """Add piece on board at given coordinates and update piece coordinates.
         Args:
@@ -159,8 +613,10 @@ class Game(ABC):
                 NotOnBoardError
         """
         try:
-            self.board[coords.x][coords.y] = piece
-            piece.coords = coords
+            self._own_piece(piece)
+            # Coords first, so pieces that can't be changed are refused before being placed
+            self._set_piece_attribute(piece, 'coords', coords)
+            self._set_square(coords, piece)
         except IndexError:
             raise NotOnBoardError(coords, 'Saved coordinates are not legal coordinates')
 
@@ -174,9 +630,13 @@ class Game(ABC):
         return Color.WHITE if self.playing_color == Color.BLACK else Color.BLACK
 
     def _move_piece_and_update_coords(self):
-        self.board[self.from_coords.x][self.from_coords.y] = None
-        self.board[self.to_coords.x][self.to_coords.y] = self.playing_piece
-        self.playing_piece.coords = self.to_coords
+        self._move_piece_to(self.playing_piece, self.to_coords)
+
+    def _move_piece_to(self, piece, to_coords):
+        piece = self._writable_piece(piece)
+        self._set_square(piece.coords, None)
+        self._set_square(to_coords, piece)
+        self._set_piece_attribute(piece, 'coords', to_coords)
 
     def current_board_pieces(self):
         """Generator of all pieces currently on game board."""
@@ -187,41 +647,43 @@ class Game(ABC):
 
     def coords_on_board(self, coords):
         """Check if coordinates within board range (negative indexing not allowed). Return bool."""
-        return coords.x in range(self.board_width) and coords.y in range(self.board_height)
+        return coords in self.geometry.squares
 
     def _set_current_move_attributes_or_raise_errors(self, from_coords, to_coords):
+        error = self._set_current_move_attributes(from_coords, to_coords)
+        if error:
+            raise IllegalMoveError(error)
+
+    def _set_current_move_attributes(self, from_coords, to_coords):
+        """Set move attributes for move. Return error message if the move is illegal in any
+           game, else None.
+        """
         if from_coords:
             if from_coords == to_coords:
-                raise IllegalMoveError(self.SAME_SQUARE)
+                return self.SAME_SQUARE
 
             if not self.board[from_coords.x][from_coords.y]:
-                raise IllegalMoveError(self.NO_PIECE)
+                return self.NO_PIECE
 
             self.from_coords = from_coords
             self.to_coords = to_coords
             self.playing_piece = self.board[from_coords.x][from_coords.y]
 
             if self.playing_piece.color != self.playing_color:
-                raise IllegalMoveError(self.WRONG_COLOR)
+                return self.WRONG_COLOR
         else:
             if self.board[to_coords.x][to_coords.y]:
-                raise IllegalMoveError(self.SQUARE_TAKEN)
+                return self.SQUARE_TAKEN
 
             self.to_coords = to_coords
+        return None
 
     def coords_between(self, from_coords, to_coords):
-        """Return generator of all Coords(x, y) between from_coords and to_coords."""
-        x_coords = self._coords_between(from_coords.x, to_coords.x, abs(from_coords.y - to_coords.y))
-        y_coords = self._coords_between(from_coords.y, to_coords.y, abs(from_coords.x - to_coords.x))
-        return (Coords(x, y) for x, y in zip(x_coords, y_coords))
-
-    @staticmethod
-    def _coords_between(from_coord, to_coord, other_coord_length):
-        if from_coord > to_coord:
-            return reversed(list(range(to_coord + 1, from_coord)))
-        if from_coord == to_coord:
-            return [from_coord] * other_coord_length
-        return list(range(from_coord + 1, to_coord))
+        """Return tuple of all Coords(x, y) between from_coords and to_coords, in order."""
+        try:
+            return self.geometry.between[from_coords, to_coords]
+        except KeyError:
+            return _coords_between(from_coords, to_coords)
 
     def x_axis(self):
         """Return list of letters in range a-z for length of board x-axis width"""
@@ -231,6 +693,12 @@ class Game(ABC):
         """Return reversed list of ints for length of board y-axis height"""
         return list(reversed(range(self.board_height + 1)))
 
+    def legal_square_ids(self):
+        """Return list of square ids the playing color can move to, where the game can tell
+           without a from square. Empty for games that move pieces rather than place them.
+        """
+        return []
+
     def display_board(self):
         """Return board as list of (id, image) tuples
 
@@ -248,6 +716,28 @@ class Game(ABC):
             display_board.append(display_row)
         return list(reversed(display_board))
 
+    def changed_squares(self, codes):
+        """Return list of BoardSquare for squares changed since board_codes returned codes."""
+        current_codes = self.board_codes()
+        changed = []
+        for square, (old_code, code) in enumerate(zip(codes, current_codes)):
+            if old_code != code:
+                coords = self.geometry.coords[square]
+                piece = self.board[coords.x][coords.y]
+                changed.append(BoardSquare(id=f'{coords.x}{coords.y}', image=str(piece) if piece else ''))
+        return changed
+
+
+# Direction and squares between two Coords don't depend on board size, so every
+# BoardGeometry adds its pairs here for move_direction to look up.
+_MOVE_DIRECTIONS = {}
+# Starting position game per Game subclass, copied by Game.new
+_TEMPLATES = {}
+
+
+def _copy_if_mutable(value):
+    return copy(value) if isinstance(value, (dict, list)) else value
+
 
 def move_direction(from_coords, to_coords):
     """Calculate direction from from_coordinates to coordinates. Return Direction enum.
@@ -257,6 +747,13 @@ def move_direction(from_coords, to_coords):
     Returns:
             Direction enum type.
     """
+    try:
+        return _MOVE_DIRECTIONS[from_coords, to_coords]
+    except KeyError:
+        return _move_direction(from_coords, to_coords)
+
+
+def _move_direction(from_coords, to_coords):
     if abs(from_coords.x - to_coords.x) == abs(from_coords.y - to_coords.y):
         return Direction.DIAGONAL
     if from_coords.x != to_coords.x and from_coords.y == to_coords.y:
@@ -266,6 +763,20 @@ def move_direction(from_coords, to_coords):
     return Direction.NON_LINEAR
 
 
+def _coords_between(from_coords, to_coords):
+    x_coords = _line_between(from_coords.x, to_coords.x, abs(from_coords.y - to_coords.y))
+    y_coords = _line_between(from_coords.y, to_coords.y, abs(from_coords.x - to_coords.x))
+    return tuple(Coords(x, y) for x, y in zip(x_coords, y_coords))
+
+
+def _line_between(from_coord, to_coord, other_coord_length):
+    if from_coord > to_coord:
+        return range(from_coord - 1, to_coord, -1)
+    if from_coord == to_coord:
+        return [from_coord] * other_coord_length
+    return range(from_coord + 1, to_coord)
+
+
 def adjacent_squares(from_coords, to_coords):
     """Check if to_coordinates are adjacent to from_coordinates. Return bool."""
     x_abs = abs(from_coords.x - to_coords.x)
@@ -285,3 +796,143 @@ NEXT_ADJACENT_COORD = {
     'W': lambda c: Coords(c.x - 1, c.y),
     'NW': lambda c: Coords(c.x - 1, c.y + 1)
 }
+
+
+class BoardGeometry:
+    """Shared Coords and adjacent square lookups for one board size, so move checks
+       reuse the same Coords rather than building new ones. Get with board_geometry.
+
+       Attributes:
+            width:      Board width
+            height:     Board height
+            coords:     Tuple of every board Coords, indexed by y * width + x like board_codes
+            squares:    Dict of every board Coords to itself, for interning equal Coords
+            adjacent:   Dict of NEXT_ADJACENT_COORD direction to dict of Coords to the
+                        adjacent Coords that way, None when that is off the board
+            neighbours: Dict of Coords to tuple of all adjacent Coords on the board
+            directions: Dict of (from Coords, to Coords) to move_direction Direction
+            between:    Dict of (from Coords, to Coords) to tuple of Coords between them,
+                        as Game.coords_between
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.coords = tuple(Coords(x, y) for y in range(height) for x in range(width))
+        self.squares = {coords: coords for coords in self.coords}
+        self.adjacent = {
+            direction: {coords: self.squares.get(next_coords(coords)) for coords in self.coords}
+            for direction, next_coords in NEXT_ADJACENT_COORD.items()
+        }
+        self.neighbours = {
+            coords: tuple(adjacent[coords] for adjacent in self.adjacent.values()
+                          if adjacent[coords] is not None)
+            for coords in self.coords
+        }
+        pairs = [(from_coords, to_coords) for from_coords in self.coords for to_coords in self.coords]
+        self.directions = {pair: _move_direction(*pair) for pair in pairs}
+        self.between = {pair: tuple(self.squares[coords] for coords in _coords_between(*pair))
+                        for pair in pairs}
+        _MOVE_DIRECTIONS.update(self.directions)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.width}, {self.height})'
+
+    def __reduce__(self):
+        # Pickle as board size only, loading returns the shared instance for that size
+        return board_geometry, (self.width, self.height)
+
+
+@lru_cache(maxsize=None)
+def board_geometry(width, height):
+    """Return BoardGeometry for board size, built once and shared by every game that size."""
+    return BoardGeometry(width, height)
+
+
+class CodeBoard:
+    """Board stored as a bytearray of GamePiece.encode codes, indexed by square number like
+       board_codes, read and written as board[x][y] like the list of columns games start with.
+       See Game.compact.
+
+       Pieces are materialised from their codes when first read and kept, so rules see the
+       same piece on a square until the square changes. Game writes piece attribute changes
+       back to the codes with update.
+
+       Attributes:
+            codes: Bytearray of piece codes, 0 for empty
+    """
+    __slots__ = ('geometry', 'codes', '_pieces', '_columns')
+
+    def __init__(self, geometry, codes):
+        self.geometry = geometry
+        self.codes = bytearray(codes)
+        self._pieces = {}  # Square number: materialised piece
+        self._columns = [_CodeColumn(self, x_idx) for x_idx in range(geometry.width)]
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __getitem__(self, x_idx):
+        return self._columns[x_idx]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(list(column) == list(other_column)
+                                               for column, other_column in zip(self, other))
+
+    def copy(self):
+        """Return CodeBoard with the same codes and no pieces materialised."""
+        return CodeBoard(self.geometry, self.codes)
+
+    def update(self, piece):
+        """Write code of piece to its square after its attributes changed, if it is there."""
+        if piece.coords is not None:
+            square = piece.coords.y * self.geometry.width + piece.coords.x
+            if self._pieces.get(square) is piece:
+                self.codes[square] = piece.encode()
+
+    def _piece(self, square):
+        piece = self._pieces.get(square)
+        if piece is None and self.codes[square]:
+            piece = self._pieces[square] = decode_piece(self.codes[square])
+            piece.coords = self.geometry.coords[square]
+        return piece
+
+    def _set_piece(self, square, piece):
+        if piece is None:
+            self.codes[square] = 0
+            self._pieces.pop(square, None)
+        else:
+            self.codes[square] = piece.encode()
+            self._pieces[square] = piece
+
+
+class _CodeColumn:
+    """Column x_idx of a CodeBoard, indexed by y like a board column list."""
+    __slots__ = ('_board', '_x_idx')
+
+    def __init__(self, board, x_idx):
+        self._board = board
+        self._x_idx = x_idx
+
+    def __len__(self):
+        return self._board.geometry.height
+
+    def __getitem__(self, y_idx):
+        return self._board._piece(self._square(y_idx))
+
+    def __setitem__(self, y_idx, piece):
+        self._board._set_piece(self._square(y_idx), piece)
+
+    def __iter__(self):
+        return (self[y_idx] for y_idx in range(len(self)))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def _square(self, y_idx):
+        height = self._board.geometry.height
+        if not -height <= y_idx < height:
+            raise IndexError('board column index out of range')
+        return y_idx % height * self._board.geometry.width + self._x_idx
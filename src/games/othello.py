@@ -2,15 +2,23 @@
 from src.game_enums import Color
 from src.game_pieces.othello_disc import Disc
 from src.game_errors import IllegalMoveError
-from src.games.game import Coords, Game, NEXT_ADJACENT_COORD, ONE_COORD_ERR_MSG
+from src.games.game import Game, ONE_COORD_ERR_MSG
+from src.games import othello_bitboard as bitboard
 
 
 class Othello(Game):
     """Game logic for Othello."""
 
     ILLEGAL_MOVE = 'Either incorrect coords or move not trapping opponent discs'
+    JOURNAL_ATTRS = Game.JOURNAL_ATTRS + ('discs', 'disc_counts', 'empty_count')
 
     def __init__(self, restore_positions=None):
+        # Bitboard per color, kept in step with Disc objects on self.board
+        self.discs = {Color.WHITE: 0, Color.BLACK: 0}
+        # Disc counts kept up to date on placement and flip
+        self.disc_counts = {Color.WHITE: 0, Color.BLACK: 0}
+        self.empty_count = 64
+        self._mobility_cache = {}
 
         OTHELLO_SETUP = {
             'board': [[None] * 8 for _ in range(8)],
@@ -23,26 +31,54 @@ class Othello(Game):
 
         super().__init__(OTHELLO_SETUP, restore_positions)
 
+    def add(self, piece, coords):
+        super().add(piece, coords)
+        self._count_disc(piece.color, bitboard.square_index(coords))
+
+    def load_board_codes(self, codes):
+        super().load_board_codes(codes)
+        self.discs = {Color.WHITE: 0, Color.BLACK: 0}
+        self.disc_counts = {Color.WHITE: 0, Color.BLACK: 0}
+        self.empty_count = 64
+        self._mobility_cache = {}
+        for piece in self.current_board_pieces():
+            self._count_disc(piece.color, bitboard.square_index(piece.coords))
+
+    def _count_disc(self, color, bit_idx):
+        self.discs[color] |= 1 << bit_idx
+        self.disc_counts[color] += 1
+        self.empty_count -= 1
+
+    def _after_copy(self):
+        super()._after_copy()
+        self.discs = self.discs.copy()
+        self.disc_counts = self.disc_counts.copy()
+        self._mobility_cache = self._mobility_cache.copy()
+
     def make_move(self):
-        for disc in self._trapped_discs(self.to_coords):
-            disc.color = self.playing_color
+        trapped_discs = self._trapped_discs_mask(self.to_coords)
+        if not trapped_discs:
+            raise IllegalMoveError(self.ILLEGAL_MOVE)
 
+        self._flip_discs(trapped_discs)
         self._place_disc(self.to_coords)
         self._declare_winner_or_switch_players()
 
+    def _rule_error(self):
+        return None if self._trapped_discs_mask(self.to_coords) else self.ILLEGAL_MOVE
+
     def _declare_winner_or_switch_players(self):
-        if not self._empty_square_coords():
+        if not self.empty_count:
             self.winner = self._winning_color()
-        elif self._next_player_cant_move():
-            self.switch_players()
-            if self._next_player_cant_move():
-                self.winner = self._winning_color()
-        else:
+        elif self.legal_moves_mask(self.opponent_color):
             self.switch_players()
+        elif not self.legal_moves_mask(self.playing_color):
+            self.winner = self._winning_color()
+        # Otherwise opponent has to pass and current player moves again
 
     def _winning_color(self):
-        white_discs = self.disc_count(Color.WHITE)
-        black_discs = self.disc_count(Color.BLACK)
+        white_discs = self.disc_counts[Color.WHITE]
+        black_discs = self.disc_counts[Color.BLACK]
 
         if white_discs > black_discs:
             return Color.WHITE
@@ -51,57 +87,80 @@ class Othello(Game):
         return Color.NONE
 
     def _place_disc(self, to_coords):
-        disc = Disc(self.playing_color)
-        self.board[to_coords.x][to_coords.y] = disc
-        disc.coords = to_coords
-
-    def _trapped_discs(self, to_coords):
-        trapped_discs = self._scan_board_for_trapped_discs(to_coords)
-
-        if not trapped_discs:
-            raise IllegalMoveError(self.ILLEGAL_MOVE)
-
-        return trapped_discs
-
-    def _next_player_cant_move(self):
-        empty_square_coords = self._empty_square_coords()
-
-        for square_coords in empty_square_coords:
-            trapped_discs = self._scan_board_for_trapped_discs(square_coords)
-            if trapped_discs:
-                return False
-        return True
-
-    def _scan_board_for_trapped_discs(self, passed_coords):
-        trapped_discs = []
-        for direction in 'N NE E SE S SW W NW'.split():
-            next_coords = passed_coords
-            possible_trapped_discs = []
-            while True:
-                next_coords = NEXT_ADJACENT_COORD[direction](next_coords)
-                if not self.coords_on_board(next_coords):
-                    break
-                disc = self.board[next_coords.x][next_coords.y]
-                if not disc:
-                    break
-                elif disc.color == self.opponent_color:
-                    possible_trapped_discs.append(disc)
-                else:
-                    trapped_discs.extend(possible_trapped_discs)
-        return trapped_discs
-
-    def _empty_square_coords(self):
-        empty_square_coords = []
-        for x_idx, row in enumerate(self.board):
-            for y_idx, disc in enumerate(row):
-                if not disc:
-                    empty_square_coords.append(Coords(x_idx, y_idx))
-        return empty_square_coords
+        self.add(Disc(self.playing_color), to_coords)
+
+    def _flip_discs(self, flipped):
+        self.discs[self.playing_color] |= flipped
+        self.discs[self.opponent_color] &= ~flipped
+        flipped_count = bitboard.popcount(flipped)
+        self.disc_counts[self.playing_color] += flipped_count
+        self.disc_counts[self.opponent_color] -= flipped_count
+        for bit_idx in bitboard.squares(flipped):
+            coords = bitboard.bit_coords(bit_idx)
+            self._set_piece_attribute(self.board[coords.x][coords.y], 'color', self.playing_color)
+
+    def legal_moves_mask(self, color=None):
+        """Return bitboard of squares where color (default playing color) can place a disc.
+
+           Cached per position, so pass and game end checks share one computation.
+        """
+        color = color or self.playing_color
+        opponent_color = Color.WHITE if color == Color.BLACK else Color.BLACK
+        position = (self.discs[color], self.discs[opponent_color])
+
+        cached = self._mobility_cache.get(color)
+        if cached and cached[0] == position:
+            return cached[1]
+
+        legal_moves = bitboard.legal_moves(*position)
+        self._mobility_cache[color] = (position, legal_moves)
+        return legal_moves
+
+    def stable_discs_mask(self, color=None):
+        """Return bitboard of discs of color (default playing color) that can never be flipped."""
+        color = color or self.playing_color
+        opponent_color = Color.WHITE if color == Color.BLACK else Color.BLACK
+        return bitboard.stable_discs(self.discs[color], self.discs[opponent_color])
+
+    def canonical_position(self):
+        """Return (player, opponent) bitboards for the playing color in canonical form.
+
+           All 8 rotations and reflections of a position give the same result, so caches
+           keyed on it share one entry between them.
+        """
+        position, _ = bitboard.canonical(self.discs[self.playing_color],
+                                         self.discs[self.opponent_color])
+        return position
+
+    def canonical_hash(self):
+        """Return hash of canonical_position."""
+        return hash(self.canonical_position())
+
+    def legal_moves(self):
+        """Return list of (None, to_coords) moves for the playing color, from legal_moves_mask."""
+        if self.winner is not None:
+            return []
+        return [(None, self.geometry.coords[bit_idx])
+                for bit_idx in bitboard.squares(self.legal_moves_mask())]
+
+    def _position_key(self):
+        return self.discs[Color.BLACK], self.discs[Color.WHITE], self.playing_color
+
+    def legal_square_ids(self):
+        """Return list of square ids, as used by display_board, the playing color can play."""
+        if self.winner is not None:
+            return []
+        return [f'{coords.x}{coords.y}'
+                for coords in map(bitboard.bit_coords, bitboard.squares(self.legal_moves_mask()))]
+
+    def _trapped_discs_mask(self, passed_coords):
+        """Return bitboard of opponent discs trapped by placing a disc at passed_coords."""
+        player, opponent = self.discs[self.playing_color], self.discs[self.opponent_color]
+        return bitboard.flips(player, opponent, bitboard.square_bit(passed_coords))
 
     def disc_count(self, wanted_color):
         """Return int count of discs for given Disc color."""
-        return len([disc for disc in self.current_board_pieces()
-                    if disc.color == wanted_color])
+        return self.disc_counts[wanted_color]
 
     @staticmethod
     def _new_board_setup():
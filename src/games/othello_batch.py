@@ -0,0 +1,185 @@
+"""Batch Othello simulator on NumPy arrays.
+
+   OthelloBatch holds many independent Othello games as arrays of bitboards,
+   laid out as in othello_bitboard, and moves every game of the batch forward
+   in one step of vectorised operations. It is meant for self play and
+   statistics over large numbers of games, where looping over Othello objects
+   is too slow. NumPy is only needed by this module, the games themselves run
+   without it, so it is a dev package in the Pipfile.
+
+   Positions are held from the point of view of the side to move, so player
+   and opponent swap after every move or pass.
+
+   Functions:
+        popcount:    return array of bits set per mask
+        fill:        return directional flood of masks through other masks
+        legal_moves: return masks of empty squares that flip at least one disc
+        flips:       return masks of discs flipped by playing one square per game
+"""
+import numpy as np
+
+from src.games import othello_bitboard as bitboard
+from src.game_enums import Color
+
+
+PASS = -1
+ZERO = np.uint64(0)
+ONE = np.uint64(1)
+START_BLACK = np.uint64(1 << 27 | 1 << 36)  # d4 and e5
+START_WHITE = np.uint64(1 << 28 | 1 << 35)  # e4 and d5
+
+# (shift, left, wrap mask) per othello_bitboard direction, as uint64 for NumPy
+DIRECTIONS = tuple((np.uint64(abs(shift)), shift > 0, np.uint64(wrap_mask))
+                   for shift, wrap_mask in bitboard.DIRECTIONS)
+
+
+def _shift(masks, shift, left):
+    return np.left_shift(masks, shift) if left else np.right_shift(masks, shift)
+
+
+def popcount(masks):
+    """Return int array of bits set in each mask of masks."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks).astype(np.int64)
+    masks = masks - ((masks >> ONE) & np.uint64(0x5555555555555555))
+    masks = (masks & np.uint64(0x3333333333333333)) + ((masks >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    masks = (masks + (masks >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((masks * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+def fill(gen, pro, shift, left, wrap_mask):
+    """Kogge-Stone occluded fill of each gen mask through its pro mask in one direction."""
+    pro = pro & wrap_mask
+    gen = gen | (pro & _shift(gen, shift, left))
+    pro = pro & _shift(pro, shift, left)
+    gen = gen | (pro & _shift(gen, shift * np.uint64(2), left))
+    pro = pro & _shift(pro, shift * np.uint64(2), left)
+    return gen | (pro & _shift(gen, shift * np.uint64(4), left))
+
+
+def legal_moves(player, opponent):
+    """Return masks of empty squares where each player would trap opponent discs."""
+    empty = ~(player | opponent)
+    moves = np.zeros_like(player)
+    for shift, left, wrap_mask in DIRECTIONS:
+        trapped = fill(player, opponent, shift, left, wrap_mask) & opponent
+        moves |= _shift(trapped, shift, left) & wrap_mask & empty
+    return moves
+
+
+def flips(player, opponent, move_bits):
+    """Return masks of opponent discs flipped when each player places a disc on its move bit."""
+    flipped = np.zeros_like(player)
+    for shift, left, wrap_mask in DIRECTIONS:
+        trapped = fill(move_bits, opponent, shift, left, wrap_mask) & opponent
+        closed = (_shift(trapped, shift, left) & wrap_mask & player) != ZERO
+        flipped |= np.where(closed, trapped, ZERO)
+    return flipped
+
+
+class OthelloBatch:
+    """Many Othello games moved forward together.
+
+       Attributes:
+            player:        uint64 array of discs of the side to move, per game
+            opponent:      uint64 array of discs of the side not to move, per game
+            black_to_move: bool array, True where Black is the side to move
+
+       Methods:
+            from_game:   return batch of copies of an Othello position
+            legal_moves: return masks of squares the side to move can play
+            terminal:    return bool array of games neither side can move in
+            step:        play one move, or pass, in every game
+            random_moves: return a random legal bit index per game
+            play_random: play every game to the end with random moves
+            disc_counts: return Black and White disc counts per game
+            results:     return 1, -1 or 0 per game for a Black win, White win or draw
+    """
+    ILLEGAL_MOVES = 'Illegal move in games: {}'
+
+    def __init__(self, size):
+        self.player = np.full(size, START_BLACK, dtype=np.uint64)
+        self.opponent = np.full(size, START_WHITE, dtype=np.uint64)
+        self.black_to_move = np.ones(size, dtype=bool)
+
+    @classmethod
+    def from_game(cls, game, size):
+        """Return batch of size games, each at the position of Othello game."""
+        batch = cls(size)
+        batch.player[:] = game.discs[game.playing_color]
+        batch.opponent[:] = game.discs[game.opponent_color]
+        batch.black_to_move[:] = game.playing_color == Color.BLACK
+        return batch
+
+    def __len__(self):
+        return len(self.player)
+
+    def legal_moves(self):
+        """Return uint64 array of squares the side to move can play, per game."""
+        return legal_moves(self.player, self.opponent)
+
+    def terminal(self):
+        """Return bool array, True for games where neither side has a legal move."""
+        return ((legal_moves(self.player, self.opponent) == ZERO)
+                & (legal_moves(self.opponent, self.player) == ZERO))
+
+    def step(self, moves):
+        """Play bit index per game from int array moves, PASS where the side to move passes.
+
+           A pass is only legal with no legal moves, and leaves finished games as they are.
+           Raises ValueError, with no game changed, if any move is illegal.
+        """
+        moves = np.asarray(moves, dtype=np.int64)
+        legal = self.legal_moves()
+        passing = moves == PASS
+        move_bits = np.where(passing, ZERO, ONE << moves.clip(0, 63).astype(np.uint64))
+        illegal = np.where(passing, legal != ZERO, (move_bits & legal) == ZERO)
+        if illegal.any():
+            raise ValueError(self.ILLEGAL_MOVES.format(np.flatnonzero(illegal).tolist()))
+        self._play(move_bits, passing & (legal_moves(self.opponent, self.player) == ZERO))
+
+    def _play(self, move_bits, finished):
+        flipped = flips(self.player, self.opponent, move_bits)
+        player = self.player | flipped | move_bits
+        opponent = self.opponent & ~flipped
+        self.player = np.where(finished, player, opponent)
+        self.opponent = np.where(finished, opponent, player)
+        self.black_to_move ^= ~finished
+
+    def random_moves(self, rng, legal=None):
+        """Return int array of one legal bit index per game, chosen with NumPy Generator rng,
+           PASS where the side to move has no legal move.
+        """
+        legal = self.legal_moves() if legal is None else legal
+        counts = popcount(legal)
+        choices = (rng.random(len(legal)) * counts).astype(np.int64)
+        # Clear the lowest set bit choice times, then take the index of the lowest left
+        for clear in range(1, int(choices.max(initial=0)) + 1):
+            legal = np.where(choices >= clear, legal & (legal - ONE), legal)
+        lowest_bit = legal & (~legal + ONE)
+        return np.where(counts > 0, popcount(lowest_bit - ONE), PASS)
+
+    def play_random(self, rng):
+        """Play every game to the end with moves chosen by random_moves. Return discs placed."""
+        placed = 0
+        while True:
+            legal = self.legal_moves()
+            passing = legal == ZERO
+            finished = passing & (legal_moves(self.opponent, self.player) == ZERO)
+            if finished.all():
+                return placed
+            moves = self.random_moves(rng, legal)
+            move_bits = np.where(passing, ZERO, ONE << moves.clip(0, 63).astype(np.uint64))
+            self._play(move_bits, finished)
+            placed += int(np.count_nonzero(~passing))
+
+    def disc_counts(self):
+        """Return (black, white) int arrays of disc counts per game."""
+        player, opponent = popcount(self.player), popcount(self.opponent)
+        return (np.where(self.black_to_move, player, opponent),
+                np.where(self.black_to_move, opponent, player))
+
+    def results(self):
+        """Return int array per game, 1 where Black has more discs, -1 where White has, else 0."""
+        black, white = self.disc_counts()
+        return np.sign(black - white)
@@ -0,0 +1,221 @@
+"""Bitboard helpers for Othello.
+
+   A position is held as two 64 bit ints, one per side. Bit n is the square
+   Coords(x=n % 8, y=n // 8), so a1 is bit 0 and h8 is bit 63.
+
+   Functions:
+        square_index: return bit index for Coords
+        square_bit:  return single bit mask for Coords
+        bit_coords:  return Coords for a bit index
+        squares:     generator of bit indexes set in a mask
+        popcount:    return number of bits set in a mask
+        fill:        return directional flood of a mask through another
+        legal_moves: return mask of empty squares that flip at least one disc
+        flips:       return mask of discs flipped by playing a square
+        canonical:   return position reduced to one form for all 8 board symmetries
+        stable_discs: return mask of discs that can never be flipped
+"""
+from src.games.game import Coords
+
+
+BOARD_SIZE = 8
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE  # Every square except x == 0
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F  # Every square except x == 7
+
+# (shift, wrap mask) per direction. Positive shifts are left shifts.
+# The mask removes squares a shift would wrap onto from the other edge.
+DIRECTIONS = (
+    (8, FULL),         # N
+    (9, NOT_A_FILE),   # NE
+    (1, NOT_A_FILE),   # E
+    (-7, NOT_A_FILE),  # SE
+    (-8, FULL),        # S
+    (-9, NOT_H_FILE),  # SW
+    (-1, NOT_H_FILE),  # W
+    (7, NOT_H_FILE),   # NW
+)
+
+
+EDGES = 0xFF818181818181FF
+FILE_EDGES = 0x8181818181818181  # x == 0 or x == 7
+RANK_EDGES = 0xFF000000000000FF  # y == 0 or y == 7
+
+
+def _line_masks(step_x, step_y):
+    """Return masks of every full length line of squares running in (step_x, step_y)."""
+    lines = []
+    for start_x in range(BOARD_SIZE):
+        for start_y in range(BOARD_SIZE):
+            if 0 <= start_x - step_x < BOARD_SIZE and 0 <= start_y - step_y < BOARD_SIZE:
+                continue  # Not the first square of a line
+            line, x, y = 0, start_x, start_y
+            while 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
+                line |= 1 << (y * BOARD_SIZE + x)
+                x, y = x + step_x, y + step_y
+            lines.append(line)
+    return tuple(lines)
+
+
+# Lines in the 4 axes a disc can be flipped along, each with the shifts to its neighbours
+# on that axis and the board edge squares with no neighbour on one side.
+AXES = (
+    (_line_masks(1, 0), ((1, NOT_A_FILE), (-1, NOT_H_FILE)), FILE_EDGES),
+    (_line_masks(0, 1), ((8, FULL), (-8, FULL)), RANK_EDGES),
+    (_line_masks(1, 1), ((9, NOT_A_FILE), (-9, NOT_H_FILE)), EDGES),
+    (_line_masks(-1, 1), ((7, NOT_H_FILE), (-7, NOT_A_FILE)), EDGES),
+)
+
+
+def _shift(mask, shift):
+    if shift > 0:
+        return (mask << shift) & FULL
+    return mask >> -shift
+
+
+def fill(gen, pro, shift, wrap_mask):
+    """Kogge-Stone occluded fill of gen through pro in one direction. Return mask of gen
+       plus every pro square reachable from it.
+    """
+    pro &= wrap_mask
+    gen |= pro & _shift(gen, shift)
+    pro &= _shift(pro, shift)
+    gen |= pro & _shift(gen, 2 * shift)
+    pro &= _shift(pro, 2 * shift)
+    gen |= pro & _shift(gen, 4 * shift)
+    return gen
+
+
+def square_index(coords):
+    """Return bit index for passed Coords."""
+    return coords.y * BOARD_SIZE + coords.x
+
+
+def square_bit(coords):
+    """Return single bit mask for passed Coords."""
+    return 1 << square_index(coords)
+
+
+def bit_coords(bit_idx):
+    """Return Coords for passed bit index."""
+    return Coords(bit_idx % BOARD_SIZE, bit_idx // BOARD_SIZE)
+
+
+def squares(mask):
+    """Generator of bit indexes set in mask, lowest first."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+def popcount(mask):
+    """Return number of bits set in mask."""
+    return bin(mask).count('1')
+
+
+def legal_moves(player, opponent):
+    """Return mask of empty squares where player would trap opponent discs."""
+    empty = ~(player | opponent) & FULL
+    moves = 0
+    for shift, wrap_mask in DIRECTIONS:
+        trapped = fill(player, opponent, shift, wrap_mask) & opponent
+        moves |= _shift(trapped, shift) & wrap_mask & empty
+    return moves
+
+
+def flips(player, opponent, move):
+    """Return mask of opponent discs flipped when player places a disc on move bit."""
+    flipped = 0
+    for shift, wrap_mask in DIRECTIONS:
+        trapped = fill(move, opponent, shift, wrap_mask) & opponent
+        if _shift(trapped, shift) & wrap_mask & player:
+            flipped |= trapped
+    return flipped
+
+
+def flip_vertical(mask):
+    """Return mask mirrored top to bottom, row y moves to row 7 - y."""
+    return int.from_bytes(mask.to_bytes(8, 'little'), 'big')
+
+
+def mirror_horizontal(mask):
+    """Return mask mirrored left to right, column x moves to column 7 - x."""
+    mask = ((mask >> 1) & 0x5555555555555555) | ((mask & 0x5555555555555555) << 1)
+    mask = ((mask >> 2) & 0x3333333333333333) | ((mask & 0x3333333333333333) << 2)
+    return ((mask >> 4) & 0x0F0F0F0F0F0F0F0F) | ((mask & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def flip_diagonal(mask):
+    """Return mask mirrored in the a1-h8 diagonal, Coords(x, y) moves to Coords(y, x)."""
+    swapped = 0x0F0F0F0F00000000 & (mask ^ (mask << 28))
+    mask ^= swapped ^ (swapped >> 28)
+    swapped = 0x3333000033330000 & (mask ^ (mask << 14))
+    mask ^= swapped ^ (swapped >> 14)
+    swapped = 0x5500550055005500 & (mask ^ (mask << 7))
+    mask ^= swapped ^ (swapped >> 7)
+    return mask & FULL
+
+
+def _symmetries(mask):
+    """Return tuple of mask under each of the 8 board symmetries, identity first."""
+    vertical = flip_vertical(mask)
+    diagonal = flip_diagonal(mask)
+    diagonal_vertical = flip_vertical(diagonal)
+    return (mask, vertical, mirror_horizontal(mask), mirror_horizontal(vertical),
+            diagonal, diagonal_vertical, mirror_horizontal(diagonal),
+            mirror_horizontal(diagonal_vertical))
+
+
+# SYMMETRY_SQUARES[symmetry][bit_idx] is where symmetry moves square bit_idx,
+# INVERSE_SQUARES maps it back.
+SYMMETRY_SQUARES = tuple(zip(*(
+    tuple(moved.bit_length() - 1 for moved in _symmetries(1 << bit_idx))
+    for bit_idx in range(64)
+)))
+INVERSE_SQUARES = tuple(
+    tuple(squares_map.index(bit_idx) for bit_idx in range(64))
+    for squares_map in SYMMETRY_SQUARES
+)
+
+
+def canonical(player, opponent):
+    """Reduce position to the smallest of its 8 symmetric forms.
+
+       Symmetric positions give the same (player, opponent) result, so caches keyed on it
+       share entries between them. Return ((player, opponent), symmetry), where
+       SYMMETRY_SQUARES[symmetry] maps squares into the canonical form.
+    """
+    forms = list(zip(_symmetries(player), _symmetries(opponent)))
+    position = min(forms)
+    return position, forms.index(position)
+
+
+def stable_discs(player, opponent):
+    """Return mask of player discs that can never be flipped.
+
+       A disc is stable when, on each of the 4 axes through it, its line is full or it
+       has a board edge or a stable disc of its own color next to it. Discs are added
+       until no more qualify, so the result may miss some stable discs but never
+       includes a disc that can be flipped.
+    """
+    occupied = player | opponent
+    secure_axes = []
+    for lines, _, edges in AXES:
+        full = 0
+        for line in lines:
+            if occupied & line == line:
+                full |= line
+        secure_axes.append(full | edges)
+
+    stable = 0
+    while True:
+        candidates = player
+        for (_, neighbour_shifts, _), secure in zip(AXES, secure_axes):
+            anchored = secure
+            for shift, wrap_mask in neighbour_shifts:
+                anchored |= _shift(stable, shift) & wrap_mask
+            candidates &= anchored
+        if candidates == stable:
+            return stable
+        stable = candidates
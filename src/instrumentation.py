@@ -0,0 +1,122 @@
+"""Optional timing of game rule methods.
+
+   enable swaps timing wrappers in for the methods listed in TARGETS, on the
+   classes defining them, and disable puts the original methods back. Nothing
+   is wrapped until enable is called, so games run at full speed while it is
+   off and it can be left on in production to find which rules cost the most.
+
+   Calls are recorded per game type, the class of the game called, and method,
+   with a count, total and maximum time and a histogram of call latencies.
+
+   Functions:
+        enable:  wrap TARGETS methods to record their calls
+        disable: restore the original methods
+        enabled: return True while methods are wrapped
+        reset:   forget all recorded calls
+        stats:   return recorded MethodStats per game type and method
+        report:  return stats as a table, slowest total time first
+"""
+from bisect import bisect_right
+from collections import namedtuple
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+from tabulate import tabulate
+
+from src.games.chess import Chess
+from src.games.draughts import Draughts
+from src.games.game import Game
+from src.games.othello import Othello
+
+
+MethodStats = namedtuple('MethodStats', 'calls total_seconds max_seconds histogram')
+
+# Histogram bucket upper bounds in seconds, the last bucket counts anything slower
+BUCKET_BOUNDS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+BUCKET_LABELS = ('<1us', '<10us', '<100us', '<1ms', '<10ms', '<100ms', '<1s', '>=1s')
+
+TARGETS = {
+    Game: ('move', 'legal_moves', 'legal_square_ids', 'display_board', 'copy'),
+    Chess: ('make_move', '_own_king_in_check', '_check_mate'),
+    Draughts: ('make_move', '_collect_capture_coords', '_potential_capture'),
+    Othello: ('make_move', 'legal_moves', 'legal_moves_mask', '_trapped_discs_mask'),
+}
+
+_originals = {}
+_records = {}
+_lock = Lock()
+
+
+def enable(targets=None):
+    """Wrap methods of targets, a dict of class to method names, default TARGETS, so their
+       calls are recorded. Methods already wrapped are left as they are.
+    """
+    for cls, names in (targets or TARGETS).items():
+        for name in names:
+            if (cls, name) not in _originals:
+                method = cls.__dict__[name]
+                _originals[(cls, name)] = method
+                setattr(cls, name, _timed(method, name))
+
+
+def disable():
+    """Put back every method wrapped by enable. Recorded calls are kept."""
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+
+
+def enabled():
+    """Return True if any methods are wrapped."""
+    return bool(_originals)
+
+
+def reset():
+    """Forget all recorded calls."""
+    with _lock:
+        _records.clear()
+
+
+def stats():
+    """Return dict of game type name to dict of method name to MethodStats."""
+    with _lock:
+        game_stats = {}
+        for (game_type, name), (calls, total, slowest, histogram) in _records.items():
+            game_stats.setdefault(game_type, {})[name] = MethodStats(calls, total, slowest,
+                                                                     tuple(histogram))
+        return game_stats
+
+
+def report():
+    """Return recorded stats as a text table, methods taking most time in total first."""
+    rows = [(game_type, name, method_stats.calls, method_stats.total_seconds * 1000,
+             method_stats.total_seconds * 1e6 / method_stats.calls, method_stats.max_seconds * 1000,
+             *method_stats.histogram)
+            for game_type, methods in stats().items()
+            for name, method_stats in methods.items()]
+    rows.sort(key=lambda row: row[3], reverse=True)
+    headers = ('Game', 'Method', 'Calls', 'Total ms', 'Mean us', 'Max ms') + BUCKET_LABELS
+    return tabulate(rows, headers=headers, floatfmt='.1f')
+
+
+def _timed(method, name):
+    @wraps(method)
+    def timed_method(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _record(type(self).__name__, name, perf_counter() - start)
+    return timed_method
+
+
+def _record(game_type, name, seconds):
+    with _lock:
+        record = _records.get((game_type, name))
+        if record is None:
+            record = _records[(game_type, name)] = [0, 0.0, 0.0, [0] * len(BUCKET_LABELS)]
+        record[0] += 1
+        record[1] += seconds
+        record[2] = max(record[2], seconds)
+        record[3][bisect_right(BUCKET_BOUNDS, seconds)] += 1
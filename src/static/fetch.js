@@ -18,14 +18,20 @@ function placePiece(event) {
 
 async function tryMove(event_id) {
   move['toId'] = event_id
-  const moveRoute = `move?from=${move['fromId']}&to=${move['toId']}`
+  const boardVersion = document.getElementById('game-board').dataset.version
+  const moveRoute = `move?from=${move['fromId']}&to=${move['toId']}&version=${boardVersion}`
 
   try {
     const fetchResult = fetch(moveRoute)
     const response = await fetchResult
     const jsonData = await response.json()
 
-    makeMove(jsonData)
+    if (response.ok) {
+      makeMove(jsonData)
+    } else {
+      document.getElementById('game-error').innerText = jsonData.err
+      reset_move()
+    }
 
   } catch(e) {
     throw Error(e);
@@ -40,29 +46,43 @@ function makeMove(gameData) {
 
   if (gameData.err) {
     gameError.innerText = gameData.err
+    updateBoard(gameData)
   } else if (gameData.winner) {
     gameWinner.innerText = `${gameData.winner} wins!!! Refresh to play again.`
-    updateBoard(gameData.board, gameEnd=true)
+    updateBoard(gameData, gameEnd=true)
   } else {
     currentPlayer.innerText = gameData.next_player
-    updateBoard(gameData.board)
+    updateBoard(gameData)
   }
+  highlightLegalSquares(gameData.legal_squares)
 
   reset_move()
 }
 
-function updateBoard(board, gameEnd=false) {
-  for (const row of board) {
-    for (const [square_id, image] of row) {
-      const square = document.getElementById(square_id)
-      square.innerText = image
-      if (gameEnd) {
-        square.onclick = null
-      }
+function updateBoard(gameData, gameEnd=false) {
+  // Whole board rows are sent when the board shown is out of date, otherwise changed squares
+  const squares = gameData.changes || gameData.board.flat()
+  for (const [square_id, image] of squares) {
+    document.getElementById(square_id).innerText = image
+  }
+  document.getElementById('game-board').dataset.version = gameData.version
+
+  if (gameEnd) {
+    for (const square of document.querySelectorAll('.game-square')) {
+      square.onclick = null
     }
   }
 }
 
+function highlightLegalSquares(squareIds) {
+  for (const square of document.querySelectorAll('.legal-square')) {
+    square.classList.remove('legal-square')
+  }
+  for (const squareId of squareIds) {
+    document.getElementById(squareId).classList.add('legal-square')
+  }
+}
+
 function reset_move() {
   move['fromId'] = null
   move['toId'] = null
@@ -0,0 +1,241 @@
+"""Engine tournaments across Chess, Draughts and Othello.
+
+   Engines are named by spec strings, an engine name with optional keyword
+   arguments, eg 'negamax:max_depth=2' or 'mcts:playouts=200,exploration=1.0'.
+   Every pair of engines plays every opening of every game twice, once from
+   each side, so neither engine gains from the opening it is given. Openings
+   are a few random moves from the start, fixed by a seed so reruns play the
+   same games. Games are played on a process pool, each result written as a
+   line of JSON as soon as it is known. Pool processes can't start processes
+   of their own, so engine specs asking for more than one worker are refused.
+
+   Scores count a win as 1 and a draw as 1/2, with a Wilson score interval.
+
+   Functions:
+        parse_engine:    return (engine name, keyword args) for an engine spec
+        make_player:     return player for an engine spec
+        openings:        return list of fixed opening move lists for a game
+        schedule:        return list of match tasks for engines, games and openings
+        play_match:      play one match task and return its result
+        run_tournament:  play match tasks on a process pool, writing JSONL results
+        wilson_interval: return confidence interval for a score
+        summarise:       return score summary rows per game and engine pair
+"""
+from ast import literal_eval
+from itertools import combinations
+import json
+from multiprocessing import Pool
+import os
+import random
+from time import perf_counter
+
+from src.engines.mcts import MonteCarloAI
+from src.engines.negamax import NegamaxAI
+from src.engines.othello_ai import OthelloAI
+from src.games.chess import Chess
+from src.games.draughts import Draughts
+from src.games.othello import Othello
+
+
+GAMES = {'chess': Chess, 'draughts': Draughts, 'othello': Othello}
+UNKNOWN_ENGINE = 'Unknown engine {!r}, choose from: {}'
+BAD_ENGINE_ARG = 'Engine args are name=value pairs separated by commas, got {!r}'
+UNSUPPORTED_GAME = 'Engine {!r} only plays {}'
+NESTED_WORKERS = "Engine {!r} can't start processes in a tournament worker, use workers=1"
+
+
+class RandomPlayer:
+    """Player making uniformly random legal moves, as a baseline for other engines."""
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+
+    def best_move(self, game):
+        moves = game.legal_moves()
+        return self._rng.choice(moves) if moves else None
+
+
+class OthelloPlayer:
+    """OthelloAI returning (None, to_coords) moves like the other engines."""
+    def __init__(self, **kwargs):
+        self._ai = OthelloAI(**kwargs)
+
+    def best_move(self, game):
+        coords = self._ai.best_move(game)
+        return None if coords is None else (None, coords)
+
+
+# Engine name: (function of keyword args and seed returning player, game names or None for all)
+ENGINES = {
+    'random': (lambda kwargs, seed: RandomPlayer(seed=seed, **kwargs), None),
+    'negamax': (lambda kwargs, seed: NegamaxAI(**kwargs), None),
+    'mcts': (lambda kwargs, seed: MonteCarloAI(**dict({'seed': seed}, **kwargs)), None),
+    'othello': (lambda kwargs, seed: OthelloPlayer(**kwargs), ('othello',)),
+}
+
+
+def parse_engine(spec):
+    """Return (engine name, dict of keyword args) for engine spec string.
+       Raises:
+            ValueError
+    """
+    name, _, args = spec.partition(':')
+    if name not in ENGINES:
+        raise ValueError(UNKNOWN_ENGINE.format(name, ', '.join(ENGINES)))
+
+    kwargs = {}
+    for arg in filter(None, args.split(',')):
+        key, equals, value = arg.partition('=')
+        if not equals or not key:
+            raise ValueError(BAD_ENGINE_ARG.format(arg))
+        try:
+            kwargs[key] = literal_eval(value)
+        except (ValueError, SyntaxError):
+            kwargs[key] = value
+    if kwargs.get('workers', 1) != 1:
+        raise ValueError(NESTED_WORKERS.format(spec))
+    return name, kwargs
+
+
+def plays_game(spec, game_name):
+    """Return True if engine spec can play game_name."""
+    games = ENGINES[parse_engine(spec)[0]][1]
+    return games is None or game_name in games
+
+
+def make_player(spec, game_name, seed=None):
+    """Return player with best_move(game) for engine spec, seeded with seed where it is random.
+       Raises:
+            ValueError
+    """
+    name, kwargs = parse_engine(spec)
+    factory, games = ENGINES[name]
+    if games is not None and game_name not in games:
+        raise ValueError(UNSUPPORTED_GAME.format(name, ', '.join(games)))
+    return factory(kwargs, seed)
+
+
+def openings(game_name, count, plies, seed=0):
+    """Return list of count different opening move lists for game_name, each plies random
+       legal moves long, the same for the same seed.
+    """
+    rng = random.Random(f'{game_name}:{seed}')
+    found, attempts = [], 0
+    while len(found) < count and attempts < count * 20:
+        attempts += 1
+        game, opening = GAMES[game_name](), []
+        while len(opening) < plies and not game.is_terminal():
+            move = rng.choice(game.legal_moves())
+            game.apply(move)
+            opening.append(move)
+        if opening not in found and not game.is_terminal():
+            found.append(opening)
+    return found
+
+
+def schedule(engines, game_names, opening_count, opening_plies, seed=0, max_moves=300):
+    """Return list of match task dicts: every pair of engines plays every opening of every
+       game twice, with sides swapped.
+    """
+    tasks = []
+    for game_name in game_names:
+        game_openings = openings(game_name, opening_count, opening_plies, seed)
+        for first, second in combinations(engines, 2):
+            if not (plays_game(first, game_name) and plays_game(second, game_name)):
+                continue
+            for opening_idx, opening in enumerate(game_openings):
+                for players in ((first, second), (second, first)):
+                    tasks.append({
+                        'game': game_name,
+                        'opening': opening_idx,
+                        'opening_moves': opening,
+                        'players': players,
+                        'seed': seed * 1000003 + len(tasks),
+                        'max_moves': max_moves,
+                    })
+    return tasks
+
+
+def play_match(task):
+    """Play match task, players[0] taking the side to move after the opening. Return result
+       dict naming the winner, None for a draw. Games still running after max_moves are draws.
+    """
+    start = perf_counter()
+    game = GAMES[task['game']]()
+    for move in task['opening_moves']:
+        game.apply(move)
+
+    first_color = game.playing_color
+    players = [make_player(spec, task['game'], task['seed'] + idx)
+               for idx, spec in enumerate(task['players'])]
+    moves = 0
+    while not game.is_terminal() and moves < task['max_moves']:
+        player = players[0 if game.playing_color == first_color else 1]
+        game.apply(player.best_move(game))
+        moves += 1
+
+    winner = None
+    if game.is_terminal() and game.result():
+        winning_color = game.playing_color if game.result() == 1 else game.opponent_color
+        winner = task['players'][0 if winning_color == first_color else 1]
+    for player in players:
+        if hasattr(player, 'close'):
+            player.close()
+
+    return {
+        'game': task['game'],
+        'opening': task['opening'],
+        'players': list(task['players']),
+        'winner': winner,
+        'moves': moves,
+        'seconds': round(perf_counter() - start, 3),
+    }
+
+
+def run_tournament(tasks, output_file, workers=None):
+    """Play tasks on workers processes, default one per core, appending each result to
+       output_file as a line of JSON. Return list of results in the order they finished.
+    """
+    results = []
+    with open(output_file, 'a') as output, Pool(workers or os.cpu_count()) as pool:
+        for result in pool.imap_unordered(play_match, tasks):
+            output.write(json.dumps(result) + '\n')
+            output.flush()
+            results.append(result)
+    return results
+
+
+def wilson_interval(score, games, z=1.96):
+    """Return (low, high) Wilson score interval for score points from games, default 95%."""
+    if not games:
+        return 0.0, 1.0
+    rate = score / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    margin = z * ((rate * (1 - rate) + z * z / (4 * games)) / games) ** 0.5 / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def summarise(results):
+    """Return list of summary dicts per game and engine pair, with wins, losses, draws, score
+       rate and Wilson interval for the first engine of the pair.
+    """
+    pairs = {}
+    for result in results:
+        engine, opponent = sorted(result['players'])
+        counts = pairs.setdefault((result['game'], engine, opponent), [0, 0, 0])
+        if result['winner'] is None:
+            counts[2] += 1
+        else:
+            counts[0 if result['winner'] == engine else 1] += 1
+
+    rows = []
+    for (game_name, engine, opponent), (wins, losses, draws) in sorted(pairs.items()):
+        games = wins + losses + draws
+        score = wins + draws / 2
+        low, high = wilson_interval(score, games)
+        rows.append({
+            'game': game_name, 'engine': engine, 'opponent': opponent,
+            'wins': wins, 'losses': losses, 'draws': draws,
+            'score': score / games, 'low': low, 'high': high,
+        })
+    return rows
@@ -1,15 +1,24 @@
 """Shared pytest fixtures for test functions."""
 import os
-from tempfile import mkstemp
+from tempfile import mkdtemp, mkstemp
 
 import pytest
 
-from src import create_app
 from src.games.chess import Chess
 from src.game_enums import Color
 from src.game_pieces.king import King
 from src.game_pieces.rook import Rook
 
+# Session files of the app created on import of src.app go to a temporary directory
+os.environ.setdefault('SESSION_FILE_DIR', mkdtemp())
+from src.app import create_app  # noqa: E402
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    """Return create_app config keeping session files out of the working directory."""
+    return {'SESSION_FILE_DIR': str(tmp_path / 'flask_session')}
+
 
 @pytest.fixture(scope='function')
 def new_game():
@@ -0,0 +1,85 @@
+"""Test module for app routes."""
+import pytest
+
+from src.app import create_app
+from src.game_store import GameStore, SqliteBackend
+
+
+@pytest.fixture
+def client(app_config):
+    return create_app(GameStore(SqliteBackend(':memory:')), app_config).test_client()
+
+
+def version(client, board_version):
+    """Return version sent by a page showing the current game at board_version."""
+    with client.session_transaction() as session:
+        return f"{session['board_id']}:{board_version}"
+
+
+def test_move_in_sync_returns_changed_squares(client):
+    page = client.get('/chess').get_data(as_text=True)
+    assert f'data-version="{version(client, 0)}"' in page
+    response = client.get(f'/move?from=41&to=43&version={version(client, 0)}').get_json()
+
+    assert 'board' not in response
+    assert sorted(response['changes']) == [['41', ''], ['43', '♙']]
+    assert response['version'] == version(client, 1)
+
+    response = client.get(f'/move?from=46&to=44&version={response["version"]}').get_json()
+    assert sorted(response['changes']) == [['44', '♟'], ['46', '']]
+    assert response['version'] == version(client, 2)
+
+
+def test_move_out_of_sync_returns_whole_board(client):
+    client.get('/chess')
+    client.get('/move?from=41&to=43')
+    earlier_game_version = version(client, 1)
+
+    for shown_version in ('0', '1', '', 'x', earlier_game_version):
+        client.get('/')
+        client.get('/chess')
+        client.get('/move?from=41&to=43')
+        response = client.get(f'/move?from=46&to=44&version={shown_version}').get_json()
+        assert 'changes' not in response
+        assert len(response['board']) == 8 and response['board'][3][4] == ['44', '♟']
+        assert response['version'] == version(client, 2)
+
+
+def test_illegal_move_in_sync_returns_no_changes(client):
+    client.get('/chess')
+    response = client.get(f'/move?from=41&to=45&version={version(client, 0)}').get_json()
+    assert response['err'] and response['changes'] == [] and response['version'] == version(client, 0)
+
+
+def shown_squares(client):
+    """Return dict of square id to image for whole board, sent after an illegal move."""
+    board = client.get('/move?from=null&to=00&version=').get_json()['board']
+    return dict(square for row in board for square in row)
+
+
+def test_changes_bring_shown_board_up_to_date_after_computer_moves(client):
+    client.get('/othello-vs-computer')
+    shown_board = shown_squares(client)
+
+    response = client.get(f'/move?from=null&to=53&version={version(client, 0)}').get_json()
+    assert response['version'] == version(client, 2) and response['next_player'] == 'Black'
+    shown_board.update(response['changes'])
+    assert shown_board == shown_squares(client)
+
+
+def test_computer_moves_use_own_engine_per_request(client, monkeypatch):
+    from src.engines import othello_ai
+    engines = []
+
+    class RecordedAI(othello_ai.OthelloAI):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            engines.append(self)
+
+    monkeypatch.setattr(othello_ai, 'OthelloAI', RecordedAI)
+    monkeypatch.setenv('OTHELLO_AI_TIME_LIMIT', '0.05')
+    client.get('/othello-vs-computer')
+    response = client.get('/move?from=null&to=53').get_json()
+    client.get('/move?from=null&to=00')  # Illegal, so no computer move
+    client.get(f"/move?from=null&to={response['legal_squares'][0]}")
+    assert len(engines) == 2 and engines[0] is not engines[1]
@@ -0,0 +1,21 @@
+"""Test module for the benchmark suite."""
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.run import compare
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_case_runs_repeatably(name):
+    timed = CASES[name]()
+    assert timed() == timed()
+
+
+def test_compare_flags_slowdowns_over_threshold():
+    results = {'fast': {'best': 1.0}, 'slow': {'best': 1.3}, 'new': {'best': 2.0}}
+    baseline = {'fast': {'best': 1.1}, 'slow': {'best': 1.0}}
+    rows = {row[0]: row for row in compare(results, baseline, threshold=0.25)}
+
+    assert rows['fast'][-1] is False
+    assert rows['slow'][3] == pytest.approx(1.3) and rows['slow'][-1] is True
+    assert rows['new'] == ('new', None, 2.0, None, False)
@@ -2,6 +2,7 @@
 import pytest
 
 from src.game_enums import Color
+from src.games.chess import Chess
 from src.games.game import Coords
 from src.game_errors import IllegalMoveError
 
@@ -154,6 +155,19 @@ def test_black_pawn_can_be_promoted_to_queen(game):
     assert game.board[2][0] == Queen(Color.BLACK)
 
 
+def test_pawn_can_only_be_promoted_by_capturing_diagonally(game):
+    game.add(Pawn(Color.WHITE), Coords(x=2, y=6))
+    game.add(Rook(Color.BLACK), Coords(x=2, y=7))
+    game.add(Rook(Color.BLACK), Coords(x=3, y=7))
+
+    with pytest.raises(IllegalMoveError, match=game.ILLEGAL_CAPTURE):
+        game.move(Coords(x=2, y=6), Coords(x=2, y=7))
+
+    game.move(Coords(x=2, y=6), Coords(x=3, y=7))
+    assert game.board[3][7] == Queen(Color.WHITE)
+    assert game.board[2][7] == Rook(Color.BLACK)
+
+
 def test_piece_blocking_diagonal_move_returns_true(game):
     # Test south/east and north/west
     game.add(Pawn(Color.WHITE), Coords(x=4, y=6))
@@ -417,6 +431,7 @@ def test_checkmate_results_in_game_ending(new_game):
     game.move(Coords(x=3, y=7), Coords(x=7, y=3))
     # assert game.check_mate
     assert game.winner == Color.BLACK.value
+    assert game.winner_color() == Color.BLACK
 
 
 @pytest.mark.no_check_mate
@@ -489,3 +504,42 @@ def test_king_can_escape_out_of_check_mate(game):
     game.move(Coords(x=1, y=4), Coords(x=1, y=0))
     # King can't attack Rook as Bishop is protecting but can escape
     assert not game.winner
+
+
+def test_castle_updates_piece_coords_and_can_be_undone(castle_game):
+    king, rook = castle_game.board[4][0], castle_game.board[7][0]
+    castle_game.move(Coords(x=4, y=0), Coords(x=6, y=0))
+    assert king.coords == Coords(x=6, y=0) and rook.coords == Coords(x=5, y=0)
+
+    castle_game.undo()
+    assert castle_game.board[4][0] is king and castle_game.board[7][0] is rook
+    assert king.coords == Coords(x=4, y=0) and not king.moved and not rook.moved
+    assert castle_game.playing_color == Color.WHITE
+
+
+def test_undo_and_redo_pawn_promotion():
+    game = Chess(restore_positions={
+        '06': Pawn(Color.WHITE),
+        '40': King(Color.WHITE),
+        '77': King(Color.BLACK),
+    })
+    game.move(Coords(x=0, y=6), Coords(x=0, y=7))
+    assert game.board[0][7] == Queen(Color.WHITE)
+
+    game.undo()
+    assert game.board[0][7] is None
+    assert game.board[0][6] == Pawn(Color.WHITE)
+
+    game.redo()
+    assert game.board[0][7] == Queen(Color.WHITE)
+    assert game.playing_color == Color.BLACK
+
+
+def test_cannot_castle_without_rook():
+    game = Chess(restore_positions={
+        '40': King(Color.WHITE),
+        '00': Rook(Color.WHITE),
+        '47': King(Color.BLACK),
+    })
+    with pytest.raises(IllegalMoveError, match=game.ILLEGAL_CASTLE):
+        game.move(Coords(x=4, y=0), Coords(x=6, y=0))
@@ -331,3 +331,45 @@ def test_crowned_piece_can_take_two_pieces_and_return_to_same_y_index():
     assert game.board[5][5] is None
     assert game.board[3][5] is None
     assert game.board[2][6] == Counter(Color.BLACK)
+
+
+def test_undo_restores_captured_pieces_and_crown():
+    game = Draughts({
+        '22': Counter(Color.BLACK),
+        '11': Counter(Color.WHITE),
+        '55': Counter(Color.WHITE),
+    })
+    game.move(Coords(x=2, y=2), Coords(x=0, y=0))
+    assert game.board[1][1] is None
+    assert game.board[0][0].crowned
+
+    game.undo()
+    assert game.board[1][1] == Counter(Color.WHITE)
+    assert game.board[2][2] == Counter(Color.BLACK)
+    assert not game.board[2][2].crowned
+    assert game.playing_color == Color.BLACK
+
+
+def test_nothing_to_undo_or_redo_raises_error():
+    game = Draughts()
+    with pytest.raises(IllegalMoveError, match=game.NOTHING_TO_UNDO):
+        game.undo()
+    with pytest.raises(IllegalMoveError, match=game.NOTHING_TO_REDO):
+        game.redo()
+
+
+def test_cannot_move_onto_own_piece():
+    game = Draughts()
+    with pytest.raises(IllegalMoveError, match=game.SQUARE_TAKEN):
+        game.move(Coords(x=0, y=6), Coords(x=1, y=5))
+
+
+def test_move_error_when_capture_possible():
+    game = Draughts({
+        '66': Counter(Color.BLACK),
+        '55': Counter(Color.WHITE),
+    })
+
+    assert game.move_error('66', '75') == game.CAPTURE_POSSIBLE
+    assert game.validate_many([('66', '44'), ('66', '75')]) == [None, game.CAPTURE_POSSIBLE]
+    assert game.board[5][5] == Counter(Color.WHITE)
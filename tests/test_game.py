@@ -1,13 +1,24 @@
 """Test module form game_helper module."""
+from copy import copy
 from pathlib import Path
+import pickle
+import random
+import subprocess
+import sys
 
 import pytest
 
 from src.game_enums import Color, Direction
 from src.games.chess import Chess
-from src.games.game import adjacent_squares, Coords, move_direction
+from src.games.draughts import Draughts
+from src.games.othello import Othello
+from src.games import game_class, game_names, new_game
+from src.games.game import adjacent_squares, CodeBoard, Coords, move_direction
 from src.game_errors import IllegalMoveError, NotOnBoardError
+from src.game_pieces.game_piece import FLAG_BIT
+from src.game_pieces.king import King
 from src.game_pieces.pawn import Pawn
+from src.game_pieces.rook import Rook
 
 
 @pytest.mark.parametrize('to_coords, direction', [
@@ -70,3 +81,318 @@ def test_game_not_restored_for_invalid_file_path():
     file_path = Path.cwd() / 'saved_games' / 'fail.pkl'
     restored_game = Chess.restore(file_path)
     assert not restored_game
+
+
+@pytest.mark.parametrize('game_class', [Chess, Draughts, Othello])
+def test_board_codes_round_trip(game_class):
+    game = game_class()
+    codes = game.board_codes()
+    assert len(codes) == 64
+    assert sum(1 for code in codes if code) == len(list(game.current_board_pieces()))
+
+    restored = game_class()
+    restored.load_board_codes(codes)
+    assert restored == game
+    assert all(piece.coords is not None for piece in restored.current_board_pieces())
+
+
+def test_copied_game_is_independent(new_game):
+    cloned_game = new_game.copy()
+    assert cloned_game == new_game
+    assert hash(cloned_game) == hash(new_game)
+
+    cloned_game.move('01', '03')
+    assert new_game.board[0][1] == Pawn(Color.WHITE)
+    assert cloned_game != new_game
+    assert cloned_game.last_move_pawn is cloned_game.board[0][3]
+
+
+def test_copied_othello_game_keeps_bitboards_separate():
+    game = Othello()
+    cloned_game = game.copy()
+    cloned_game.move(to_coords='53')
+    assert game.disc_count(Color.BLACK) == 2
+    assert cloned_game.disc_count(Color.BLACK) == 4
+
+
+def test_games_of_same_size_share_geometry():
+    geometry = Chess().geometry
+    assert Draughts().geometry is geometry
+    assert pickle.loads(pickle.dumps(geometry)) is geometry
+    assert geometry.squares[Coords(3, 4)] is geometry.coords[4 * 8 + 3]
+
+
+def test_geometry_adjacent_is_none_off_board(new_game):
+    adjacent = new_game.geometry.adjacent
+    assert adjacent['NE'][Coords(0, 0)] == Coords(1, 1)
+    assert adjacent['SW'][Coords(0, 0)] is None
+    assert adjacent['N'][Coords(4, 7)] is None
+    assert len(new_game.geometry.neighbours[Coords(0, 0)]) == 3
+    assert len(new_game.geometry.neighbours[Coords(3, 3)]) == 8
+    assert not new_game.coords_on_board(Coords(-1, 0))
+
+
+def test_coords_between_looked_up_in_order(new_game):
+    between = new_game.coords_between(Coords(7, 0), Coords(3, 4))
+    assert between == (Coords(6, 1), Coords(5, 2), Coords(4, 3))
+    assert between is new_game.coords_between(Coords(7, 0), Coords(3, 4))
+    assert new_game.coords_between(Coords(0, 0), Coords(0, 1)) == ()
+    assert new_game.geometry.directions[Coords(0, 0), Coords(1, 2)] == Direction.NON_LINEAR
+
+
+def test_copy_shares_board_until_changed(new_game):
+    cloned_game = new_game.copy()
+    assert cloned_game.board is not new_game.board
+    assert cloned_game.board[4] is new_game.board[4]
+
+    cloned_game.move('41', '43')
+    assert cloned_game.board[4] is not new_game.board[4]
+    assert cloned_game.board[3] is new_game.board[3]
+    assert new_game.board[4][1].coords == Coords(4, 1)
+    assert cloned_game.board[4][3].coords == Coords(4, 3)
+
+
+def test_original_game_can_undo_moves_made_before_copy(new_game):
+    new_game.move('41', '43')
+    cloned_game = new_game.copy()
+    new_game.undo()
+    assert new_game.board[4][1] == Pawn(Color.WHITE)
+    assert new_game.board[4][1].coords == Coords(4, 1)
+    assert cloned_game.board[4][3].coords == Coords(4, 3)
+    assert cloned_game.board[4][1] is None
+
+
+def test_is_legal_and_move_error_leave_game_unchanged(new_game):
+    codes = new_game.board_codes()
+    assert new_game.is_legal('41', '43')
+    assert not new_game.is_legal('41', '44')
+    assert new_game.move_error('41', '44') == new_game.ILLEGAL_MOVE
+    assert new_game.move_error('46', '44') == new_game.WRONG_COLOR
+    assert new_game.move_error('44', '45') == new_game.NO_PIECE
+
+    assert new_game.board_codes() == codes
+    assert new_game.playing_color == Color.WHITE
+    with pytest.raises(IllegalMoveError):
+        new_game.undo()
+
+
+@pytest.mark.parametrize('from_coords, to_coords', [
+    ('41', '48'), ('41', 'zz'), ('4', '43'), (None, '43'), ('41', None),
+])
+def test_move_error_for_bad_coords_is_input_error(new_game, from_coords, to_coords):
+    assert new_game.move_error(from_coords, to_coords) == new_game.input_error_msg
+
+
+def test_validate_many_matches_legal_moves():
+    for game in (Chess(), Draughts(), Othello()):
+        legal_moves = set(game.legal_moves())
+        moves = [(from_coords, to_coords)
+                 for from_coords in ([None] if isinstance(game, Othello) else game.geometry.coords)
+                 for to_coords in game.geometry.coords]
+
+        errors = game.validate_many(moves)
+        assert {move for move, error in zip(moves, errors) if error is None} == legal_moves
+        assert all(isinstance(error, str) for move, error in zip(moves, errors) if move not in legal_moves)
+
+
+@pytest.mark.parametrize('game_type', [Chess, Draughts, Othello])
+def test_validate_many_checks_rules_without_making_moves(game_type, monkeypatch):
+    game = game_type()
+    random.seed(3)
+    for _ in range(12):
+        game.apply(random.choice(game.legal_moves()))
+    moves = [(from_coords, to_coords)
+             for from_coords in ([None] if game_type is Othello else game.geometry.coords)
+             for to_coords in game.geometry.coords]
+
+    # Errors match those raised when the move is made
+    made_errors = []
+    for move in moves:
+        try:
+            game.copy().apply(move)
+        except IllegalMoveError as error:
+            made_errors.append(error.message)
+        else:
+            made_errors.append(None)
+
+    def make_move(_):
+        raise AssertionError('move made')
+
+    monkeypatch.setattr(game_type, 'make_move', make_move)
+    assert game.validate_many(moves) == made_errors
+
+
+def test_game_registry_builds_games_by_name():
+    assert game_names() == ('chess', 'draughts', 'othello')
+    assert game_class('draughts') is Draughts
+    assert new_game('othello') == Othello()
+    with pytest.raises(KeyError):
+        game_class('go')
+
+
+def test_games_import_without_flask_or_other_games():
+    code = ('import sys; import src.games.othello; '
+            'print(any(name in sys.modules '
+            'for name in ("flask", "src.games.chess", "src.app", "src.engines")))')
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                            universal_newlines=True, check=True, cwd=Path(__file__).parent.parent)
+    assert result.stdout.strip() == 'False'
+
+
+@pytest.mark.parametrize('game_type', [Chess, Draughts, Othello])
+def test_new_games_are_independent_copies_of_start_position(game_type):
+    first_game, second_game = game_type.new(), game_type.new()
+    assert first_game == game_type() and first_game.board_codes() == game_type().board_codes()
+
+    move = first_game.legal_moves()[0]
+    first_game.apply(move)
+    first_game.undo()
+    first_game.apply(move)
+
+    assert second_game == game_type()
+    assert game_type.new() == game_type()
+    assert second_game.legal_moves() == game_type().legal_moves()
+
+
+def test_new_chess_game_moves_pieces_of_its_own():
+    first_game, second_game = Chess.new(), Chess.new()
+    first_game.move('41', '43')
+    first_game.move('46', '44')
+    first_game.move('40', '41')
+
+    assert first_game.board[4][1] == first_game._king(Color.WHITE)
+    assert first_game.board[4][1].moved
+    assert not second_game.board[4][0].moved
+    assert second_game.board[4][1] == Pawn(Color.WHITE)
+    assert second_game.board[4][1].coords == Coords(x=4, y=1)
+
+
+@pytest.mark.parametrize('game_type', [Chess, Draughts, Othello])
+def test_pickled_game_plays_on_from_same_position(game_type):
+    game = game_type()
+    for _ in range(3):
+        game.apply(game.legal_moves()[0])
+
+    restored_game = pickle.loads(pickle.dumps(game, pickle.HIGHEST_PROTOCOL))
+    assert restored_game == game
+    assert restored_game.playing_color == game.playing_color
+    assert restored_game.legal_moves() == game.legal_moves()
+
+    move = game.legal_moves()[0]
+    restored_game.apply(move)
+    game.apply(move)
+    assert restored_game.board_codes() == game.board_codes()
+
+
+def test_pickled_game_is_smaller_than_its_attributes():
+    game = Chess()
+    game.move('41', '43')
+    assert len(pickle.dumps(game)) < len(pickle.dumps(game.__dict__)) / 5
+
+
+def test_pickled_chess_game_keeps_en_passant_and_moved_pieces():
+    game = Chess()
+    for from_coords, to_coords in (('41', '43'), ('06', '05'), ('43', '44'), ('36', '34')):
+        game.move(from_coords, to_coords)
+    game.board[4][0].moved = True
+
+    restored_game = pickle.loads(pickle.dumps(game))
+    assert restored_game.last_move_pawn is restored_game.board[3][4]
+    assert restored_game.board[4][0].moved
+    restored_game.move('44', '35')
+    assert restored_game.board[3][4] is None
+
+
+def test_pickled_othello_game_rebuilds_discs_and_counts():
+    game = Othello()
+    game.move(to_coords='53')
+    restored_game = pickle.loads(pickle.dumps(game))
+
+    assert restored_game.discs == game.discs
+    assert restored_game.disc_counts == game.disc_counts
+    assert restored_game.empty_count == game.empty_count
+
+
+@pytest.mark.parametrize('file_name, game_type, moves, next_move', [
+    ('chess', Chess, [('41', '43'), ('06', '05'), ('40', '41'), ('05', '04'), ('43', '44'),
+                      ('36', '34')], ('44', '35')),
+    ('draughts', Draughts, [('15', '24')], ('22', '33')),
+    ('othello', Othello, [(None, '35')], (None, '25')),
+])
+def test_game_pickled_whole_by_earlier_versions_still_loads(file_name, game_type, moves, next_move):
+    # Saved by Game.save before games were pickled as board codes and pieces had slots
+    with open(Path(__file__).parent / 'data' / f'{file_name}_pickled_whole.pkl', 'rb') as from_file:
+        restored_game = pickle.load(from_file)
+
+    game = game_type()
+    for move in moves:
+        game.move(*move)
+    assert restored_game == game and restored_game.playing_color == game.playing_color
+    assert all(piece.coords is not None for piece in restored_game.current_board_pieces())
+
+    restored_game.move(*next_move)
+    game.move(*next_move)
+    assert restored_game == game and restored_game.board_version == 1
+
+
+def test_copy_is_shallow_not_pickled(new_game):
+    cloned_game = copy(new_game)
+    assert cloned_game.board is new_game.board
+
+
+def test_board_version_changes_with_board_and_survives_pickle(new_game):
+    codes = new_game.board_codes()
+    new_game.move('41', '43')
+    assert new_game.changed_squares(codes) == [('41', ''), ('43', '♙')]
+    new_game.undo()
+    new_game.redo()
+    assert new_game.board_version == 3
+    assert pickle.loads(pickle.dumps(new_game)).board_version == 3
+
+
+@pytest.mark.parametrize('game_type', [Chess, Draughts, Othello])
+def test_compact_game_plays_as_game_with_piece_lists(game_type):
+    rng = random.Random(1)
+    game, compact_game = game_type(), game_type()
+    compact_game.compact()
+    for turn in range(40):
+        moves = game.legal_moves()
+        assert compact_game.legal_moves() == moves
+        if not moves:
+            break
+        move = rng.choice(moves)
+        game.apply(move)
+        compact_game.apply(move)
+        if turn % 5 == 0:
+            compact_game.compact()
+        assert isinstance(compact_game.board, CodeBoard)
+        assert compact_game.board_codes() == game.board_codes()
+        assert compact_game == game and compact_game.winner == game.winner
+
+    compact_game.undo()
+    game.undo()
+    assert compact_game.board_codes() == game.board_codes()
+
+
+def test_compact_game_copies_keep_their_own_pieces():
+    game = Chess()
+    game.move('41', '43')
+    game.compact()
+    cloned_game = game.copy()
+
+    assert cloned_game.last_move_pawn is cloned_game.board[4][3]
+    assert cloned_game.last_move_pawn is not game.board[4][3]
+    cloned_game.move('46', '44')
+    assert game.board[4][6] == Pawn(Color.BLACK) and cloned_game.board[4][6] is None
+
+
+def test_compact_board_codes_follow_piece_attribute_changes():
+    game = Chess(restore_positions={'40': King(Color.WHITE), '70': Rook(Color.WHITE),
+                                    '47': King(Color.BLACK)})
+    game.compact()
+    king = game.board[4][0]
+    game.move('40', '60')
+    assert game.board_codes()[6] & FLAG_BIT and game.board_codes()[5] & FLAG_BIT
+
+    game.expand()
+    assert game.board[6][0] is king and king.moved
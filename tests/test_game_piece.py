@@ -1,9 +1,17 @@
 """Test module for GamePieces ABC."""
+from copy import copy, deepcopy
+import pickle
+
 import pytest
 
 from src.game_enums import Color
-from src.game_pieces.game_piece import GamePiece
+from src.game_pieces.draughts_counter import Counter
+from src.game_pieces.game_piece import decode_piece, GamePiece
+from src.game_pieces.king import King
+from src.game_pieces.othello_disc import Disc
 from src.game_pieces.pawn import Pawn
+from src.games.chess import Chess
+from src.games.game import Coords
 
 
 def test_game_piece_cant_be_instantiated():
@@ -44,3 +52,51 @@ def test_abstract_methods_require_implementing():
 
     with pytest.raises(TypeError):
         TestPiece()
+
+
+@pytest.mark.parametrize('piece', [
+    Pawn(Color.WHITE), Pawn(Color.BLACK), King(Color.BLACK), Counter(Color.WHITE), Disc(Color.BLACK)
+])
+def test_piece_code_round_trip(piece):
+    decoded = decode_piece(piece.encode())
+    assert decoded == piece
+    assert 0 < piece.encode() < 256
+
+
+def test_piece_code_keeps_flag():
+    king = King(Color.WHITE)
+    king.moved = True
+    assert decode_piece(king.encode()).moved
+    assert not decode_piece(King(Color.WHITE).encode()).moved
+
+
+def test_shared_piece_per_type_and_color():
+    assert King.of(Color.WHITE) is King.of(Color.WHITE)
+    assert King.of(Color.WHITE) is not King.of(Color.BLACK)
+    assert King.of(Color.WHITE) == King(Color.WHITE)
+    assert Pawn.of(Color.WHITE) != King.of(Color.WHITE)
+
+
+def test_pieces_use_slots_and_survive_pickling():
+    counter = Counter(Color.BLACK)
+    counter.crowned = True
+    assert not hasattr(counter, '__dict__')
+
+    restored = pickle.loads(pickle.dumps(counter))
+    assert restored == counter and restored.crowned
+    assert deepcopy(counter).crowned
+
+
+def test_shared_pieces_cannot_be_changed_or_placed():
+    king = King.of(Color.WHITE)
+    with pytest.raises(AttributeError):
+        king.moved = True
+    with pytest.raises(AttributeError):
+        king.coords = Coords(x=0, y=0)
+
+    game = Chess()
+    with pytest.raises(AttributeError):
+        game.add(Pawn.of(Color.BLACK), Coords(x=3, y=3))
+    assert game.board[3][3] is None and game == Chess()
+    assert not king.moved and king.coords is None
+    assert copy(king) is king and pickle.loads(pickle.dumps(king)) is king
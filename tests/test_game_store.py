@@ -0,0 +1,163 @@
+"""Test module for the server side game store."""
+from threading import Thread
+
+import pytest
+
+from src import app as app_module
+
+from src.app import create_app
+from src.game_store import GameStore, SqliteBackend
+from src.games.chess import Chess
+from src.games.game import CodeBoard
+from src.games.othello import Othello
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def backend():
+    return SqliteBackend(':memory:')
+
+
+def test_games_held_in_memory_until_evicted(backend):
+    store = GameStore(backend, max_games=2)
+    game = Chess()
+    game_id = store.add(game)
+
+    assert store.get(game_id) is game
+    assert backend.load(game_id) is None  # Not written while in memory
+
+
+def test_games_held_compact_between_requests(backend):
+    store = GameStore(backend)
+    game = Chess()
+    game.move('41', '43')
+    game_id = store.add(game)
+    assert isinstance(game.board, CodeBoard)
+
+    assert store.get(game_id) is game
+    assert not isinstance(game.board, CodeBoard)
+    assert game.last_move_pawn is game.board[4][3]
+
+
+def test_least_recently_used_game_evicted_over_max_games(backend):
+    store = GameStore(backend, max_games=2)
+    first_id, second_id = store.add(Chess()), store.add(Othello())
+    store.get(first_id)
+    store.add(Othello())
+
+    assert len(store) == 2
+    assert backend.load(second_id) is not None and backend.load(first_id) is None
+
+
+def test_idle_games_evicted_and_loaded_back(backend):
+    clock = FakeClock()
+    store = GameStore(backend, idle_seconds=60, clock=clock)
+    game = Chess()
+    game.move('41', '43')
+    game_id = store.add(game)
+
+    clock.now = 61
+    store.add(Othello())
+    assert len(store) == 1
+
+    loaded_game = store.get(game_id)
+    assert loaded_game is not game
+    assert loaded_game == game and loaded_game.board[4][3].coords == game.board[4][3].coords
+    assert store.get(game_id) is loaded_game
+
+
+def test_unchanged_games_not_written_again(backend):
+    store = GameStore(backend, max_games=1)
+    game_id = store.add(Chess())
+    store.add(Chess())
+    backend.delete(game_id)
+
+    store.get(game_id)
+    store.flush()
+    assert backend.load(game_id) is None
+
+
+def test_evicted_games_written_outside_store_lock(backend):
+    store = GameStore(backend, max_games=1)
+    game_id = store.add(Chess())
+    stored = []
+
+    def store_games(items):
+        # Other requests can use the store while games are written
+        assert not store._lock.locked()
+        # A game not yet written is still served from memory
+        assert store.get(game_id) is game
+        stored.extend(items)
+
+    game = store.get(game_id)
+    backend.store = store_games
+    store.add(Othello())
+    assert stored[0][0] == game_id and backend.load(game_id) is None
+
+
+def test_flush_and_discard(backend):
+    store = GameStore(backend)
+    game_id = store.add(Chess())
+    store.flush()
+    assert backend.load(game_id) is not None
+
+    store.discard(game_id)
+    assert store.get(game_id) is None and store.get(None) is None
+
+
+def test_app_keeps_only_game_id_in_session(backend, app_config):
+    store = GameStore(backend)
+    client = create_app(store, app_config).test_client()
+    client.get('/chess')
+
+    with client.session_transaction() as session:
+        game_id = session['game_id']
+        assert 'current_game' not in session
+
+    response = client.get('/move?from=41&to=43').get_json()
+    assert response['err'] is None and response['next_player'] == 'Black'
+    assert store.get(game_id).board[4][3] is not None
+
+    client.get('/')
+    assert store.get(game_id) is None
+    assert client.get('/move?from=46&to=44').status_code == 404
+
+
+def test_move_waits_for_game_lock(backend, app_config):
+    store = GameStore(backend)
+    client = create_app(store, app_config).test_client()
+    client.get('/chess')
+    with client.session_transaction() as session:
+        game_id = session['game_id']
+    assert store.game_lock(game_id) is store.game_lock(game_id)
+    assert store.game_lock(game_id) is not store.game_lock(None)
+
+    responses = []
+    with store.game_lock(game_id):
+        mover = Thread(target=lambda: responses.append(client.get('/move?from=41&to=43')))
+        mover.start()
+        mover.join(0.2)
+        assert mover.is_alive() and store.get(game_id).board[4][3] is None
+    mover.join()
+    assert responses[0].get_json()['err'] is None
+
+
+def test_default_store_created_on_first_request(tmp_path, monkeypatch, app_config):
+    flushed_at_exit = []
+    monkeypatch.setattr(app_module.atexit, 'register', flushed_at_exit.append)
+    store_path = tmp_path / 'games.sqlite3'
+    app = create_app(config=dict(app_config, GAME_STORE_PATH=str(store_path)))
+    assert 'game_store' not in app.extensions and not store_path.exists()
+
+    app.test_client().get('/chess')
+    store = app.extensions['game_store']
+    assert store.backend.path == str(store_path)
+    assert flushed_at_exit == [store.flush]
+    assert store_path.exists()
@@ -0,0 +1,78 @@
+"""Test module for optional game method timing."""
+import pytest
+
+from src import instrumentation
+from src.games.chess import Chess
+from src.games.draughts import Draughts
+from src.games.game import Game
+from src.games.othello import Othello
+
+
+@pytest.fixture
+def recording():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_methods_are_untouched_while_disabled():
+    originals = {(cls, name): cls.__dict__[name]
+                 for cls, names in instrumentation.TARGETS.items() for name in names}
+    instrumentation.enable()
+    assert instrumentation.enabled()
+    assert Chess.__dict__['make_move'] is not originals[(Chess, 'make_move')]
+
+    instrumentation.disable()
+    assert not instrumentation.enabled()
+    for (cls, name), method in originals.items():
+        assert cls.__dict__[name] is method
+
+
+def test_calls_recorded_per_game_type(recording):
+    Chess().move('41', '43')
+    Othello().move(to_coords='53')
+    Draughts().move('15', '04')
+
+    game_stats = instrumentation.stats()
+    assert game_stats['Chess']['move'].calls == 1
+    assert game_stats['Chess']['make_move'].calls == 1
+    assert game_stats['Chess']['_check_mate'].calls == 1
+    assert game_stats['Othello']['move'].calls == 1
+    assert game_stats['Othello']['_trapped_discs_mask'].calls == 1
+    assert game_stats['Draughts']['make_move'].calls == 1
+    assert 'Game' not in game_stats
+
+
+def test_histogram_counts_every_call(recording):
+    game = Othello()
+    for _ in range(3):
+        game.legal_moves_mask()
+
+    method_stats = instrumentation.stats()['Othello']['legal_moves_mask']
+    assert method_stats.calls == 3
+    assert sum(method_stats.histogram) == 3
+    assert len(method_stats.histogram) == len(instrumentation.BUCKET_LABELS)
+    assert 0 < method_stats.max_seconds <= method_stats.total_seconds
+
+
+def test_recorded_when_method_raises(recording):
+    with pytest.raises(Exception):
+        Chess().move('41', '45')
+    assert instrumentation.stats()['Chess']['move'].calls == 1
+
+
+def test_report_and_reset(recording):
+    Chess().move('41', '43')
+    assert 'make_move' in instrumentation.report()
+
+    instrumentation.reset()
+    assert instrumentation.stats() == {}
+
+
+def test_enable_only_passed_targets(recording):
+    instrumentation.disable()
+    instrumentation.enable({Game: ('move',)})
+    Othello().move(to_coords='53')
+    assert set(instrumentation.stats()['Othello']) == {'move'}
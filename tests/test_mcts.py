@@ -0,0 +1,56 @@
+"""Test module for Monte Carlo tree search."""
+import pytest
+
+from src.engines.mcts import merge_stats, MonteCarloAI, MoveStats
+from src.game_enums import Color
+from src.game_pieces.othello_disc import Disc
+from src.games.draughts import Draughts
+from src.games.game import Coords
+from src.games.othello import Othello
+
+
+def endgame():
+    # Black wins 8-0 whichever of 30 and 47 it plays first
+    return Othello(restore_positions={
+        '00': Disc(Color.BLACK),
+        '10': Disc(Color.BLACK),
+        '20': Disc(Color.WHITE),
+        '57': Disc(Color.WHITE),
+        '67': Disc(Color.BLACK),
+        '77': Disc(Color.BLACK),
+    })
+
+
+def test_move_stats_count_wins_for_playing_color():
+    stats = MonteCarloAI(playouts=20, seed=1).move_stats(endgame())
+    assert {stat.move for stat in stats} == {(None, Coords(x=3, y=0)), (None, Coords(x=4, y=7))}
+    assert sum(stat.visits for stat in stats) == 20
+    assert all(stat.wins == stat.visits for stat in stats)
+
+
+def test_search_leaves_game_as_it_was():
+    game = Draughts()
+    board = game.display_board()
+    move = MonteCarloAI(playouts=10, max_playout_moves=20, seed=1).best_move(game)
+    assert move in game.legal_moves()
+    assert game.display_board() == board
+
+
+def test_worker_stats_merged_at_root():
+    ai = MonteCarloAI(playouts=9, workers=2, seed=1)
+    try:
+        stats = ai.move_stats(endgame())
+    finally:
+        ai.close()
+    assert sum(stat.visits for stat in stats) == 9
+
+
+def test_merge_stats_adds_visits_and_wins_per_move():
+    merged = merge_stats([[MoveStats('a', 3, 1.0), MoveStats('b', 1, 1.0)],
+                          [MoveStats('b', 4, 2.5)]])
+    assert merged == [MoveStats('b', 5, 3.5), MoveStats('a', 3, 1.0)]
+
+
+def test_search_needs_a_limit():
+    with pytest.raises(ValueError):
+        MonteCarloAI(playouts=None, time_limit=None)
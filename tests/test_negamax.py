@@ -0,0 +1,79 @@
+"""Test module for game tree search shared by all games."""
+import pytest
+
+from src.engines.negamax import material, NegamaxAI
+from src.game_enums import Color
+from src.game_pieces.draughts_counter import Counter
+from src.game_pieces.king import King
+from src.game_pieces.pawn import Pawn
+from src.game_pieces.rook import Rook
+from src.games.chess import Chess
+from src.games.draughts import Draughts
+from src.games.game import Coords
+from src.games.othello import Othello
+
+
+@pytest.mark.parametrize('game_class, move_count', [(Chess, 20), (Draughts, 7), (Othello, 4)])
+def test_new_game_legal_moves(game_class, move_count):
+    game = game_class()
+    assert len(game.legal_moves()) == move_count
+    assert not game.is_terminal()
+    assert game.result() == 0
+
+
+def test_finds_mate_in_one():
+    game = Chess(restore_positions={
+        '40': King(Color.WHITE),
+        '00': Rook(Color.WHITE),
+        '77': King(Color.BLACK),
+        '56': Pawn(Color.BLACK),
+        '66': Pawn(Color.BLACK),
+        '76': Pawn(Color.BLACK),
+    })
+    move = NegamaxAI(max_depth=2).best_move(game)
+    assert move == (Coords(x=0, y=0), Coords(x=0, y=7))
+
+    game.apply(move)
+    assert game.is_terminal()
+    assert game.result() == -1
+
+
+def test_draughts_player_without_moves_loses():
+    game = Draughts({
+        '00': Counter(Color.WHITE),
+        '11': Counter(Color.BLACK),
+        '22': Counter(Color.BLACK),
+    })
+    game.switch_players()
+    assert game.legal_moves() == []
+    assert game.is_terminal()
+    assert game.result() == -1
+
+
+@pytest.mark.parametrize('game_class', [Chess, Draughts, Othello])
+def test_search_leaves_game_as_it_was(game_class):
+    game = game_class()
+    game.apply(game.legal_moves()[0])
+    position_hash, board = game.hash(), game.display_board()
+
+    move = NegamaxAI(max_depth=2).best_move(game)
+    assert move in game.legal_moves()
+    assert game.hash() == position_hash
+    assert game.display_board() == board
+
+
+def test_applied_moves_keep_redo_moves():
+    game = Othello()
+    game.move(to_coords='53')
+    game.undo()
+    game.apply(game.legal_moves()[0])
+    game.undo()
+
+    game.redo()
+    assert game.board[5][3].color == Color.BLACK
+
+
+def test_material_is_from_playing_color_view():
+    game = Draughts({'00': Counter(Color.WHITE), '77': Counter(Color.BLACK)})
+    game.board[0][0].crowned = True
+    assert material(game) == 100 - 250
@@ -0,0 +1,114 @@
+"""Test module for Othello computer player."""
+from random import Random
+from time import perf_counter
+
+from src.engines.negamax import OutOfTime
+from src.engines.othello_ai import ENDGAME_PRESEARCH_DEPTH, evaluate, OthelloAI
+from src.game_enums import Color
+from src.game_pieces.othello_disc import Disc
+from src.games.game import Coords
+from src.games.othello import Othello
+from src.games.othello_bitboard import flips, legal_moves, popcount, squares
+
+
+def test_best_move_is_legal_for_new_game():
+    game = Othello()
+    move = OthelloAI(time_limit=0.1).best_move(game)
+    assert f'{move.x}{move.y}' in game.legal_square_ids()
+
+
+def test_best_move_returns_none_when_player_has_to_pass():
+    game = Othello(restore_positions={
+        '00': Disc(Color.BLACK),
+        '77': Disc(Color.WHITE),
+    })
+    assert OthelloAI(time_limit=0.1).best_move(game) is None
+
+
+def test_evaluation_rewards_corners():
+    black, white = 1 << 27 | 1 << 36, 1 << 28 | 1 << 35
+    assert evaluate(black | 1 << 0, white) > evaluate(black | 1 << 1, white)
+
+
+def test_move_chosen_within_time_limit():
+    ai = OthelloAI(time_limit=0.1)
+    start = perf_counter()
+    ai.best_move(Othello())
+    assert perf_counter() - start < 0.3
+
+
+def test_endgame_solver_finds_exact_disc_difference():
+    # Black plays both 30 and 47 as White has no moves, ending the game 8-0
+    game = Othello(restore_positions={
+        '00': Disc(Color.BLACK),
+        '10': Disc(Color.BLACK),
+        '20': Disc(Color.WHITE),
+        '57': Disc(Color.WHITE),
+        '67': Disc(Color.BLACK),
+        '77': Disc(Color.BLACK),
+    })
+    ai = OthelloAI()
+    black, white = game.discs[Color.BLACK], game.discs[Color.WHITE]
+    assert ai.solve(black, white) == 8
+    assert ai.best_move(game) in (Coords(x=3, y=0), Coords(x=4, y=7))
+
+
+def test_computer_plays_full_game_to_a_winner():
+    game = Othello()
+    ai = OthelloAI(time_limit=0.02, endgame_empties=6)
+    while not game.winner:
+        game.move(to_coords=ai.best_move(game))
+    assert game.disc_count(Color.WHITE) + game.disc_count(Color.BLACK) <= 64
+
+
+def test_evaluation_is_symmetric_between_players():
+    game = Othello()
+    black, white = game.discs[Color.BLACK], game.discs[Color.WHITE]
+    assert evaluate(black, white) == -evaluate(white, black)
+
+
+def random_position(empty_count, seed):
+    """Return (player, opponent) bitboards after random moves until empty_count squares are left,
+       with player to move and able to.
+    """
+    rng = Random(seed)
+    player, opponent = Othello().discs[Color.BLACK], Othello().discs[Color.WHITE]
+    while 64 - popcount(player | opponent) > empty_count or not legal_moves(player, opponent):
+        moves = list(squares(legal_moves(player, opponent)))
+        if moves:
+            move_bit = 1 << rng.choice(moves)
+            flipped = flips(player, opponent, move_bit)
+            player, opponent = player | flipped | move_bit, opponent ^ flipped
+        player, opponent = opponent, player
+    return player, opponent
+
+
+def test_best_move_at_default_settings_solves_endgame():
+    ai = OthelloAI()
+    # Positions solved in a fraction of the time limit, so the test doesn't depend on machine speed
+    for seed in (1, 5, 7, 11):
+        player, opponent = random_position(ai.endgame_empties, seed)
+        move = ai.best_move_for(player, opponent)
+
+        move_bit = 1 << move
+        flipped = flips(player, opponent, move_bit)
+        solver = OthelloAI()
+        assert -solver.solve(opponent ^ flipped, player | flipped | move_bit) == \
+            solver.solve(player, opponent)
+
+
+def test_midgame_move_kept_when_solver_runs_out_of_time(monkeypatch):
+    player, opponent = random_position(12, 0)
+    searcher = OthelloAI()
+    searcher._deadline = float('inf')
+    moves = searcher._ordered_moves(legal_moves(player, opponent), None)
+    for depth in range(1, ENDGAME_PRESEARCH_DEPTH + 1):
+        midgame_move, moves = searcher._deepen(player, opponent, moves, depth)
+
+    def out_of_time(*args):
+        raise OutOfTime()
+
+    ai = OthelloAI(endgame_empties=12)
+    monkeypatch.setattr(ai, '_solve_child', out_of_time)
+    assert ai.best_move_for(player, opponent) == midgame_move
+    assert midgame_move != OthelloAI._ordered_moves(legal_moves(player, opponent), None)[0]
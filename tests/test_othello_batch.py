@@ -0,0 +1,83 @@
+"""Test module for the NumPy batch Othello simulator."""
+import pytest
+
+from src.game_enums import Color
+from src.games import othello_bitboard as bitboard
+from src.games.game import Coords
+from src.games.othello import Othello
+
+np = pytest.importorskip('numpy')
+from src.games.othello_batch import flips, OthelloBatch, PASS, popcount  # noqa: E402
+
+
+def bit(coords_str):
+    return bitboard.square_index(Coords(int(coords_str[0]), int(coords_str[1])))
+
+
+def test_start_position_matches_othello_game():
+    game, batch = Othello(), OthelloBatch(3)
+    assert (batch.player == game.discs[Color.BLACK]).all()
+    assert (batch.opponent == game.discs[Color.WHITE]).all()
+    assert (batch.legal_moves() == game.legal_moves_mask()).all()
+
+
+def test_popcount():
+    masks = np.array([0, 1, 0xFF, 2 ** 64 - 1], dtype=np.uint64)
+    assert popcount(masks).tolist() == [0, 1, 8, 64]
+
+
+def test_random_games_match_bitboard_functions():
+    rng = np.random.default_rng(0)
+    batch = OthelloBatch(50)
+    while not batch.terminal().all():
+        player, opponent = batch.player.tolist(), batch.opponent.tolist()
+        legal = batch.legal_moves().tolist()
+        moves = batch.random_moves(rng)
+        move_bits = np.array([0 if move == PASS else 1 << int(move) for move in moves], dtype=np.uint64)
+        flipped = flips(batch.player, batch.opponent, move_bits).tolist()
+
+        for game_idx, move in enumerate(moves.tolist()):
+            assert legal[game_idx] == bitboard.legal_moves(player[game_idx], opponent[game_idx])
+            if move == PASS:
+                assert legal[game_idx] == 0
+            else:
+                assert legal[game_idx] & 1 << move
+                assert flipped[game_idx] == bitboard.flips(player[game_idx], opponent[game_idx], 1 << move)
+        batch.step(moves)
+
+    black, white = batch.disc_counts()
+    assert (batch.results() == np.sign(black - white)).all()
+
+
+def test_step_matches_othello_game_moves():
+    game, batch = Othello(), OthelloBatch(2)
+    for _ in range(6):
+        _, to_coords = game.legal_moves()[0]
+        game.move(to_coords=f'{to_coords.x}{to_coords.y}')
+        batch.step([bitboard.square_index(to_coords)] * 2)
+
+    assert (batch.black_to_move == (game.playing_color == Color.BLACK)).all()
+    black, white = batch.disc_counts()
+    assert black.tolist() == [game.disc_count(Color.BLACK)] * 2
+    assert white.tolist() == [game.disc_count(Color.WHITE)] * 2
+
+
+def test_step_raises_for_illegal_move_and_changes_no_games():
+    batch = OthelloBatch(2)
+    with pytest.raises(ValueError, match=r'\[1\]'):
+        batch.step([bit('53'), bit('00')])
+    with pytest.raises(ValueError, match=r'\[0\]'):
+        batch.step([PASS, bit('53')])
+    assert (batch.player == OthelloBatch(2).player).all()
+
+
+def test_from_game_and_play_random_to_end():
+    game = Othello()
+    game.move(to_coords='53')
+    batch = OthelloBatch.from_game(game, 20)
+    assert not batch.black_to_move.any()
+
+    placed = batch.play_random(np.random.default_rng(1))
+    assert batch.terminal().all()
+    black, white = batch.disc_counts()
+    assert placed == (black + white - 5).sum()
@@ -0,0 +1,84 @@
+"""Test module for othello_bitboard helpers."""
+import pytest
+
+from src.games.game import Coords
+from src.games import othello_bitboard as bitboard
+
+
+def mask(*coords_strs):
+    return sum(bitboard.square_bit(Coords(int(c[0]), int(c[1]))) for c in coords_strs)
+
+
+def test_square_bit_and_bit_coords_round_trip():
+    for bit_idx in range(64):
+        coords = bitboard.bit_coords(bit_idx)
+        assert bitboard.square_bit(coords) == 1 << bit_idx
+
+
+def test_squares_and_popcount():
+    discs = mask('00', '34', '77')
+    assert list(bitboard.squares(discs)) == [0, 35, 63]
+    assert bitboard.popcount(discs) == 3
+
+
+def test_start_position_legal_moves():
+    black, white = mask('33', '44'), mask('34', '43')
+    assert bitboard.legal_moves(black, white) == mask('35', '24', '53', '42')
+
+
+@pytest.mark.parametrize('player, opponent, move, flipped', [
+    (mask('33', '44'), mask('34', '43'), '53', ('43',)),
+    (mask('71'), mask('61', '51'), '41', ('51', '61')),  # horizontal run
+    (mask('77'), mask('66', '55'), '44', ('55', '66')),  # diagonal run
+    (mask('20', '40'), mask('10', '30'), '00', ('10',)),  # stops at closing disc
+])
+def test_flips(player, opponent, move, flipped):
+    assert bitboard.flips(player, opponent, mask(move)) == mask(*flipped)
+
+
+def test_no_flips_wrap_around_board_edge():
+    # Discs at end of row 0 and start of row 1 are adjacent bits but not adjacent squares
+    player, opponent = mask('11'), mask('01')
+    assert bitboard.flips(player, opponent, mask('70')) == 0
+    assert not bitboard.legal_moves(player, opponent) & mask('70')
+
+
+def test_symmetric_positions_share_canonical_form():
+    player, opponent = mask('00', '10', '33'), mask('20', '44')
+    mirrored = bitboard.mirror_horizontal(player), bitboard.mirror_horizontal(opponent)
+    rotated = (bitboard.flip_vertical(bitboard.flip_diagonal(player)),
+               bitboard.flip_vertical(bitboard.flip_diagonal(opponent)))
+
+    position, _ = bitboard.canonical(player, opponent)
+    assert bitboard.canonical(*mirrored)[0] == position
+    assert bitboard.canonical(*rotated)[0] == position
+    assert bitboard.canonical(opponent, player)[0] != position
+
+
+def test_symmetry_squares_map_into_canonical_form():
+    player, opponent = mask('01', '52'), mask('66')
+    (canonical_player, _), symmetry = bitboard.canonical(player, opponent)
+    moved = sum(1 << bitboard.SYMMETRY_SQUARES[symmetry][bit_idx]
+                for bit_idx in bitboard.squares(player))
+    assert moved == canonical_player
+    for bit_idx in range(64):
+        assert bitboard.INVERSE_SQUARES[symmetry][bitboard.SYMMETRY_SQUARES[symmetry][bit_idx]] == bit_idx
+
+
+def test_stable_discs_grow_from_corner():
+    player, opponent = mask('00', '10', '20', '01', '11', '33'), mask('30', '44')
+    assert bitboard.stable_discs(player, opponent) == mask('00', '10', '20', '01', '11')
+    assert bitboard.stable_discs(opponent, player) == 0
+
+
+def test_discs_on_full_lines_are_stable():
+    # Every square taken: no disc can be flipped
+    player = sum(1 << bit_idx for bit_idx in range(0, 64, 3))
+    opponent = bitboard.FULL & ~player
+    assert bitboard.stable_discs(player, opponent) == player
+    assert bitboard.stable_discs(opponent, player) == opponent
+
+
+def test_edge_disc_next_to_empty_square_not_stable():
+    player, opponent = mask('30'), mask('20')
+    assert bitboard.stable_discs(player, opponent) == 0
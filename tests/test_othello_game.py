@@ -78,10 +78,10 @@ def test_winner_declared():
         '33': Disc(Color.BLACK),
         '77': Disc(Color.WHITE),
     })
-    assert not game.winner
+    assert not game.winner and game.winner_color() is None
 
     game.move(to_coords=Coords(x=5, y=3))
-    assert game.winner == Color.BLACK
+    assert game.winner == Color.BLACK == game.winner_color()
 
 
 def test_drawer_declared():
@@ -94,7 +94,8 @@ def test_drawer_declared():
     })
 
     game.move(to_coords=Coords(x=3, y=5))
-    assert game.winner == Color.NONE
+    assert game.winner == Color.NONE == game.winner_color()
+    assert game.legal_moves() == [] and game.legal_square_ids() == []
 
 
 def test_player_can_move_detected_correctly():
@@ -103,7 +104,7 @@ def test_player_can_move_detected_correctly():
         '11': Disc(Color.WHITE),
         '22': Disc(Color.BLACK)
     })
-    black_can_move = game._scan_board_for_trapped_discs(Coords(x=0, y=0))
+    black_can_move = game._trapped_discs_mask(Coords(x=0, y=0))
     assert black_can_move
 
 
@@ -119,3 +120,78 @@ def test_game_ends_if_both_players_cant_move():
 
     game.move(to_coords=Coords(x=5, y=3))
     assert game.winner == Color.BLACK
+
+
+def test_legal_moves_mask_for_start_position():
+    game = Othello()
+    assert sorted(game.legal_square_ids()) == ['24', '35', '42', '53']
+    assert game.legal_moves_mask(Color.WHITE) != game.legal_moves_mask(Color.BLACK)
+
+
+def test_player_passes_when_opponent_cant_move():
+    game = Othello(restore_positions={
+        '57': Disc(Color.WHITE),
+        '67': Disc(Color.BLACK),
+        '77': Disc(Color.BLACK),
+        '00': Disc(Color.BLACK),
+        '10': Disc(Color.BLACK),
+        '20': Disc(Color.WHITE),
+    })
+
+    game.move(to_coords=Coords(x=4, y=7))
+    assert not game.winner
+    assert game.playing_color == Color.BLACK  # White has to pass
+
+    game.move(to_coords=Coords(x=3, y=0))
+    assert game.winner == Color.BLACK
+    assert game.legal_square_ids() == []
+
+
+def test_disc_counts_kept_up_to_date():
+    game = Othello()
+    assert (game.disc_count(Color.BLACK), game.disc_count(Color.WHITE), game.empty_count) == (2, 2, 60)
+
+    for to_coords in (Coords(x=5, y=3), Coords(x=5, y=4), Coords(x=4, y=5)):
+        game.move(to_coords=to_coords)
+        for color in (Color.BLACK, Color.WHITE):
+            assert game.disc_count(color) == sum(
+                1 for disc in game.current_board_pieces() if disc.color == color)
+        assert game.empty_count == 64 - len(list(game.current_board_pieces()))
+
+
+def test_symmetric_openings_have_same_canonical_hash():
+    games = [Othello() for _ in range(4)]
+    for game, to_coords in zip(games, ('53', '35', '24', '42')):
+        game.move(to_coords=to_coords)
+
+    assert len({game.canonical_hash() for game in games}) == 1
+    assert Othello().canonical_hash() != games[0].canonical_hash()
+
+
+def test_stable_discs_mask_per_color():
+    game = Othello(restore_positions={
+        '00': Disc(Color.BLACK),
+        '10': Disc(Color.BLACK),
+        '20': Disc(Color.WHITE),
+        '77': Disc(Color.WHITE),
+    })
+    assert game.stable_discs_mask(Color.BLACK) == 0b11
+    assert game.stable_discs_mask(Color.WHITE) == 1 << 63
+
+
+def test_undo_restores_discs_and_counters():
+    game = Othello()
+    start_discs = dict(game.discs)
+    game.move(to_coords='53')
+    game.move(to_coords='52')
+
+    game.undo()
+    game.undo()
+    assert game.discs == start_discs
+    assert game.disc_count(Color.BLACK) == 2 and game.empty_count == 60
+    assert game.board[4][3].color == Color.WHITE
+    assert game.playing_color == Color.BLACK
+
+    game.redo()
+    assert game.disc_count(Color.BLACK) == 4
+    assert game.playing_color == Color.WHITE
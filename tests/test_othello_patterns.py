@@ -0,0 +1,49 @@
+"""Test module for Othello pattern tables."""
+import random
+
+from src.engines import othello_patterns
+from src.game_enums import Color
+from src.games.game import Coords
+from src.games.othello import Othello
+
+
+def random_position(seed):
+    rng = random.Random(seed)
+    first = rng.getrandbits(64) & rng.getrandbits(64)
+    second = rng.getrandbits(64) & ~first
+    return first, second
+
+
+def test_patterns_cover_board_outside_centre():
+    covered = {square for _, squares in othello_patterns.PATTERNS for square in squares}
+    assert len(covered) == 48
+    assert 0 in covered and 27 in covered and 26 not in covered
+
+
+def test_tables_file_matches_built_tables():
+    loaded, built = othello_patterns.tables(), othello_patterns.build_tables()
+    for name, size in othello_patterns.TABLE_SIZES:
+        assert len(loaded[name]) == size
+        assert list(loaded[name]) == built[name]
+
+
+def test_bitboard_evaluation_matches_pattern_indexes():
+    for seed in range(200):
+        first, second = random_position(seed)
+        indexes = othello_patterns.indexes(first, second)
+        assert othello_patterns.evaluate(first, second) == othello_patterns.pattern_score(indexes)
+
+
+def test_evaluation_changes_sign_when_colors_swap():
+    for seed in range(200):
+        first, second = random_position(seed)
+        assert othello_patterns.evaluate(first, second) == -othello_patterns.evaluate(second, first)
+
+
+def test_played_positions_evaluated_as_pattern_indexes():
+    game = Othello()
+    for to_coords in (Coords(x=5, y=3), Coords(x=5, y=2), Coords(x=4, y=2), Coords(x=3, y=2)):
+        game.move(to_coords=to_coords)
+        black, white = game.discs[Color.BLACK], game.discs[Color.WHITE]
+        score = othello_patterns.pattern_score(othello_patterns.indexes(black, white))
+        assert othello_patterns.evaluate(black, white) == score
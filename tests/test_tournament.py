@@ -0,0 +1,87 @@
+"""Test module for the engine tournament runner."""
+import json
+
+import pytest
+
+from src.tournament import (make_player, openings, parse_engine, play_match, RandomPlayer,
+                            run_tournament, schedule, summarise, wilson_interval)
+
+
+def test_parse_engine_reads_literal_args():
+    assert parse_engine('negamax') == ('negamax', {})
+    assert parse_engine('mcts:playouts=50,exploration=0.5') == ('mcts', {'playouts': 50, 'exploration': 0.5})
+
+
+@pytest.mark.parametrize('spec', ['minimax', 'negamax:max_depth', 'negamax:=2', 'mcts:workers=2'])
+def test_parse_engine_raises_for_bad_spec(spec):
+    with pytest.raises(ValueError):
+        parse_engine(spec)
+
+
+def test_mcts_with_one_worker_plays_in_tournament_pool(tmp_path):
+    tasks = schedule(['random', 'mcts:playouts=20,workers=1'], ['draughts'], 1, 2, max_moves=4)
+    results = run_tournament(tasks, tmp_path / 'results.jsonl', workers=1)
+    assert len(results) == 2
+
+
+def test_make_player():
+    assert isinstance(make_player('random', 'chess', seed=1), RandomPlayer)
+    assert make_player('negamax:max_depth=2', 'draughts').max_depth == 2
+    with pytest.raises(ValueError):
+        make_player('othello', 'chess')
+
+
+def test_openings_are_fixed_by_seed_and_different():
+    game_openings = openings('draughts', 4, 3, seed=7)
+    assert game_openings == openings('draughts', 4, 3, seed=7)
+    assert len(game_openings) == 4 and all(len(opening) == 3 for opening in game_openings)
+    assert len({tuple(opening) for opening in game_openings}) == 4
+
+
+def test_schedule_plays_each_opening_from_both_sides():
+    tasks = schedule(['random', 'negamax:max_depth=1', 'othello'], ['chess', 'othello'], 2, 2)
+    # Othello engine only plays Othello: 1 chess pair and 3 othello pairs, 2 openings, 2 sides
+    assert len(tasks) == (1 + 3) * 2 * 2
+    pairs = [(task['game'], task['opening'], task['players']) for task in tasks]
+    for game_name, opening, (first, second) in pairs:
+        assert (game_name, opening, (second, first)) in pairs
+
+
+def test_play_match_names_winner_from_players():
+    task = schedule(['random', 'negamax:max_depth=1'], ['othello'], 1, 2, seed=3)[0]
+    result = play_match(task)
+    assert result['winner'] in (None, *task['players'])
+    assert result == dict(play_match(task), seconds=result['seconds'])  # Repeatable
+
+
+def test_run_tournament_writes_jsonl(tmp_path):
+    output_file = tmp_path / 'results.jsonl'
+    tasks = schedule(['random', 'othello:time_limit=0.01'], ['othello'], 1, 2, max_moves=10)
+    results = run_tournament(tasks, str(output_file), workers=2)
+
+    lines = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert sorted(lines, key=str) == sorted(results, key=str)
+    assert len(lines) == len(tasks) == 2
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert low == pytest.approx(0.4038, abs=1e-4) and high == pytest.approx(0.5962, abs=1e-4)
+    assert wilson_interval(0, 10)[0] == 0.0
+    assert wilson_interval(10, 10)[1] == 1.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_summarise_scores_draws_as_half():
+    results = [
+        {'game': 'chess', 'players': ['b', 'a'], 'winner': 'a'},
+        {'game': 'chess', 'players': ['a', 'b'], 'winner': None},
+        {'game': 'chess', 'players': ['a', 'b'], 'winner': 'b'},
+        {'game': 'chess', 'players': ['b', 'a'], 'winner': 'a'},
+    ]
+    row, = summarise(results)
+    assert (row['engine'], row['opponent']) == ('a', 'b')
+    assert (row['wins'], row['losses'], row['draws']) == (2, 1, 1)
+    assert row['score'] == 2.5 / 4
+    assert row['low'] < row['score'] < row['high']
+